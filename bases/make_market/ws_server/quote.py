@@ -1,22 +1,43 @@
+from collections.abc import Sequence
 from datetime import datetime
-from typing import TypedDict
+from typing import NotRequired, TypedDict
 from zoneinfo import ZoneInfo
 
+from make_market.orderbook.batch import BookBlock
 from make_market.orderbook.core import OrderBook
 
 
 class RawQuoteDict(TypedDict):
-    """A dictionary representing a raw quote."""
+    """
+    A dictionary representing a raw quote.
+
+    The timestamp is either an ISO string in `timestamp` or integer
+    nanoseconds since the Unix epoch in `timestamp_ns`. Prices and sizes are
+    numbers when built from an order book, and their decimal texts when
+    parsed by `make_market.messaging.vendor.parse_vendor_message`.
+    """
+
+    timestamp: NotRequired[str]
+    timestamp_ns: NotRequired[int]
+    bid_prices: list[float] | list[str]
+    ask_prices: list[float] | list[str]
+    bid_sizes: list[float] | list[str]
+    ask_sizes: list[float] | list[str]
+
 
+class _TimestampDict(TypedDict, total=False):
     timestamp: str
-    bid_prices: list[float]
-    ask_prices: list[float]
-    bid_sizes: list[int]
-    ask_sizes: list[int]
+    timestamp_ns: int
+
+
+def _timestamp(timezone: ZoneInfo, timestamp_ns: int | None) -> _TimestampDict:
+    if timestamp_ns is not None:
+        return {"timestamp_ns": timestamp_ns}
+    return {"timestamp": datetime.now(timezone).isoformat()}
 
 
 def create_raw_quote_from_orderbook(
-    orderbook: OrderBook, timezone: ZoneInfo
+    orderbook: OrderBook, timezone: ZoneInfo, timestamp_ns: int | None = None
 ) -> RawQuoteDict:
     """
     Create a raw quote dictionary from an order book.
@@ -24,12 +45,43 @@ def create_raw_quote_from_orderbook(
     Args:
         orderbook (OrderBook): The order book from which to create the raw quote.
         timezone (ZoneInfo): The timezone to use for the timestamp.
+        timestamp_ns (int | None, optional): The timestamp in nanoseconds since the
+            Unix epoch, sent instead of an ISO string. Defaults to None.
 
     Returns:
         RawQuoteDict: A dictionary containing the timestamp and the order book data.
 
     """
     return {
-        "timestamp": datetime.now(timezone).isoformat(),
+        **_timestamp(timezone, timestamp_ns),
         **orderbook.to_dict(),
     }
+
+
+def create_raw_quotes_from_book_block(
+    symbols: Sequence[str],
+    block: BookBlock,
+    timezone: ZoneInfo,
+    timestamp_ns: int | None = None,
+) -> dict[str, RawQuoteDict]:
+    """
+    Create raw quote dictionaries for many symbols from a block of order books.
+
+    All quotes of one tick share a single timestamp.
+
+    Args:
+        symbols (Sequence[str]): The symbols, one per book in the block.
+        block (BookBlock): The order books, in the same order as `symbols`.
+        timezone (ZoneInfo): The timezone to use for the timestamp.
+        timestamp_ns (int | None, optional): The timestamp in nanoseconds since the
+            Unix epoch, sent instead of an ISO string. Defaults to None.
+
+    Returns:
+        dict[str, RawQuoteDict]: The raw quote of each symbol.
+
+    """
+    timestamp = _timestamp(timezone, timestamp_ns)
+    return {
+        symbol: {**timestamp, **orderbook}
+        for symbol, orderbook in zip(symbols, block.to_dicts(), strict=True)
+    }
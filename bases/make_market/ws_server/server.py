@@ -1,12 +1,13 @@
 import asyncio
 import json
-import random
 
+import numpy as np
 import websockets
+from make_market.clock import now_ns
 from make_market.log.core import get_logger
-from make_market.orderbook.core import OrderBook
+from make_market.orderbook.batch import random_book_block
 from make_market.settings.models import Settings
-from make_market.ws_server.quote import create_raw_quote_from_orderbook
+from make_market.ws_server.quote import create_raw_quotes_from_book_block
 from make_market.ws_server.requests_types import Actions, Request
 
 # setup logger
@@ -19,6 +20,9 @@ subscriptions: set[str] = set()
 # fetch settings from central store
 settings = Settings().vendor_websocket
 
+# random generator used to simulate vendor prices
+rng = np.random.default_rng()
+
 
 async def consumer_handler(
     websocket: websockets.WebSocketServerProtocol,
@@ -71,23 +75,22 @@ async def fx_price_publisher(
     """
     while True:
         if subscriptions:
-            message = {}
-            for symbol in subscriptions:
-                # get random midprice and spread
-                # TODO: replace with MarketDataProtocol dependency injection. pass in the initializer
-                m = random.uniform(1.0, 2.0)  # midprice  # noqa: S311
-                s = random.uniform(0.01, 0.05)  # spread  # noqa: S311
-
-                # create orderbook
-                orderbook = OrderBook.random_from_midprice_and_spread(
-                    midprice=m, spread=s
-                )
-
-                symbol_quote = create_raw_quote_from_orderbook(
-                    orderbook, timezone=Settings().timezone
-                )
-
-                message[symbol] = symbol_quote
+            symbols = list(subscriptions)
+
+            # get random midprices and spreads for all symbols at once
+            # TODO: replace with MarketDataProtocol dependency injection. pass in the initializer
+            midprices = rng.uniform(1.0, 2.0, len(symbols))
+            spreads = rng.uniform(0.01, 0.05, len(symbols))
+
+            # create orderbooks for all symbols in one vectorized call
+            block = random_book_block(midprices, spreads, rng=rng)
+
+            message = create_raw_quotes_from_book_block(
+                symbols,
+                block,
+                timezone=Settings().timezone,
+                timestamp_ns=now_ns() if settings.TIMESTAMP_NS else None,
+            )
 
             try:
                 # Send updated prices to the client
@@ -0,0 +1,3 @@
+from make_market.book_history.core import BookHistory, BookHistoryStore, HistoryWindow
+
+__all__ = ["BookHistory", "BookHistoryStore", "HistoryWindow"]
@@ -0,0 +1,220 @@
+import datetime
+from dataclasses import dataclass
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+from make_market.clock import datetime_to_ns
+from make_market.messaging.decimals import digits_to_floats
+from make_market.orderbook.batch import BookBlock
+
+
+class QuoteProtocol(Protocol):
+    """The `BaseQuote` fields read by the book history."""
+
+    symbol: str
+    timestamp: datetime.datetime
+    timestamp_ns: int
+    bid_price: list[int]
+    ask_price: list[int]
+    price_exponent: int
+    bid_size: list[int]
+    ask_size: list[int]
+    size_exponent: int
+
+
+def _scale(mantissas: list[int], exponent: int, depth: int) -> npt.NDArray[np.float64]:
+    return digits_to_floats(mantissas[:depth], exponent)
+
+
+@dataclass(frozen=True)
+class HistoryWindow:
+    """
+    HistoryWindow is a zero-copy view of the most recent snapshots in a history.
+
+    The arrays are views into the history's buffers, oldest snapshot first. A
+    window of `n` snapshots stays valid for `capacity - n` more appends, so a
+    window of the full capacity is overwritten by the very next append. Copy
+    the arrays to keep them longer.
+
+    Attributes:
+        timestamps_ns (npt.NDArray[np.int64]): Snapshot timestamps, epoch nanoseconds.
+        books (BookBlock): The top levels of each snapshot.
+
+    """
+
+    timestamps_ns: npt.NDArray[np.int64]
+    books: BookBlock
+
+    def __len__(self) -> int:
+        return self.timestamps_ns.shape[0]
+
+
+class BookHistory:
+    """
+    BookHistory is a fixed-capacity ring buffer of top-of-book snapshots.
+
+    All buffers are preallocated, so memory stays flat however long the
+    process runs, and appending is O(1). Every snapshot is written twice, at
+    its slot and at the same slot of a mirrored second half, which keeps the
+    latest `capacity` snapshots contiguous in memory: windows are returned
+    as views without copying or re-ordering.
+
+    Levels deeper than `depth` are dropped. Missing levels are stored with a
+    NaN price and a size of 0, which the order book analytics ignore.
+
+    """
+
+    def __init__(self, capacity: int, depth: int = 10) -> None:
+        if capacity <= 0 or depth <= 0:
+            msg = "capacity and depth must be positive"
+            raise ValueError(msg)
+
+        self.capacity = capacity
+        self.depth = depth
+        self._count = 0
+
+        shape = (2 * capacity, depth)
+        self._timestamps_ns = np.zeros(2 * capacity, dtype=np.int64)
+        self._ask_prices = np.full(shape, np.nan)
+        self._ask_sizes = np.zeros(shape)
+        self._bid_prices = np.full(shape, np.nan)
+        self._bid_sizes = np.zeros(shape)
+
+    def __len__(self) -> int:
+        return min(self._count, self.capacity)
+
+    def append(
+        self,
+        timestamp_ns: int,
+        ask_prices: npt.ArrayLike,
+        ask_sizes: npt.ArrayLike,
+        bid_prices: npt.ArrayLike,
+        bid_sizes: npt.ArrayLike,
+    ) -> None:
+        """
+        Append a snapshot, overwriting the oldest one once the buffer is full.
+
+        Args:
+            timestamp_ns (int): The snapshot timestamp, epoch nanoseconds.
+            ask_prices (npt.ArrayLike): Ask prices, best level first.
+            ask_sizes (npt.ArrayLike): Ask sizes matching `ask_prices`.
+            bid_prices (npt.ArrayLike): Bid prices, best level first.
+            bid_sizes (npt.ArrayLike): Bid sizes matching `bid_prices`.
+
+        """
+        slot = self._count % self.capacity
+        for row in (slot, slot + self.capacity):
+            self._timestamps_ns[row] = timestamp_ns
+            self._write_levels(self._ask_prices[row], ask_prices, np.nan)
+            self._write_levels(self._ask_sizes[row], ask_sizes, 0.0)
+            self._write_levels(self._bid_prices[row], bid_prices, np.nan)
+            self._write_levels(self._bid_sizes[row], bid_sizes, 0.0)
+        self._count += 1
+
+    def _write_levels(
+        self, row: npt.NDArray[np.float64], values: npt.ArrayLike, fill: float
+    ) -> None:
+        values = np.asarray(values, dtype=np.float64)[: self.depth]
+        n_levels = values.shape[0]
+        row[:n_levels] = values
+        row[n_levels:] = fill
+
+    def append_quote(self, quote: QuoteProtocol) -> None:
+        """
+        Append the levels of a `BaseQuote`, stamped with its receive timestamp.
+
+        Quotes without an integer timestamp fall back to converting `timestamp`.
+
+        Args:
+            quote (QuoteProtocol): The quote to append.
+
+        """
+        self.append(
+            quote.timestamp_ns or datetime_to_ns(quote.timestamp),
+            _scale(quote.ask_price, quote.price_exponent, self.depth),
+            _scale(quote.ask_size, quote.size_exponent, self.depth),
+            _scale(quote.bid_price, quote.price_exponent, self.depth),
+            _scale(quote.bid_size, quote.size_exponent, self.depth),
+        )
+
+    def window(self, n: int | None = None) -> HistoryWindow:
+        """
+        Get the `n` most recent snapshots as zero-copy views.
+
+        Args:
+            n (int | None, optional): The number of snapshots. Defaults to all
+                snapshots currently held.
+
+        Returns:
+            HistoryWindow: The snapshots, oldest first, valid for `capacity - n`
+            more appends.
+
+        Raises:
+            ValueError: If `n` is negative or more than the history holds.
+
+        """
+        n = len(self) if n is None else n
+        if not 0 <= n <= len(self):
+            msg = f"window size must be between 0 and {len(self)}, got {n}"
+            raise ValueError(msg)
+
+        # the latest snapshot sits in the mirrored half, older ones precede it
+        stop = (self._count - 1) % self.capacity + self.capacity + 1
+        window = slice(stop - n, stop)
+        return HistoryWindow(
+            timestamps_ns=self._timestamps_ns[window],
+            books=BookBlock(
+                ask_prices=self._ask_prices[window],
+                ask_sizes=self._ask_sizes[window],
+                bid_prices=self._bid_prices[window],
+                bid_sizes=self._bid_sizes[window],
+            ),
+        )
+
+
+class BookHistoryStore:
+    """
+    BookHistoryStore keeps one `BookHistory` per symbol.
+
+    Histories are created on the first quote of a symbol, all with the same
+    capacity and depth, so memory is bounded by the number of symbols.
+
+    """
+
+    def __init__(self, capacity: int, depth: int = 10) -> None:
+        self.capacity = capacity
+        self.depth = depth
+        self._histories: dict[str, BookHistory] = {}
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._histories
+
+    def __getitem__(self, symbol: str) -> BookHistory:
+        return self._histories[symbol]
+
+    @property
+    def symbols(self) -> list[str]:
+        """
+        Get the symbols with a history.
+
+        Returns:
+            list[str]: The symbols, in the order they were first seen.
+
+        """
+        return list(self._histories)
+
+    def append_quote(self, quote: QuoteProtocol) -> None:
+        """
+        Append a quote to the history of its symbol.
+
+        Args:
+            quote (QuoteProtocol): The quote to append.
+
+        """
+        history = self._histories.get(quote.symbol)
+        if history is None:
+            history = self._histories[quote.symbol] = BookHistory(
+                self.capacity, self.depth
+            )
+        history.append_quote(quote)
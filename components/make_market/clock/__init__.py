@@ -0,0 +1,9 @@
+from make_market.clock.core import (
+    WallClock,
+    datetime_to_ns,
+    now_ns,
+    ns_to_datetime,
+    wall_clock,
+)
+
+__all__ = ["WallClock", "datetime_to_ns", "now_ns", "ns_to_datetime", "wall_clock"]
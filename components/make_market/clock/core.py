@@ -0,0 +1,84 @@
+import datetime
+import time
+from functools import lru_cache
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+
+class WallClock:
+    """
+    WallClock reads wall-clock time in integer nanoseconds since the Unix epoch.
+
+    The clock is anchored to `time.time_ns()` once and then advanced with the
+    monotonic `time.perf_counter_ns()`. Readings never go backwards when the
+    system clock is stepped, and the difference of two readings is a precise
+    latency. `resync` re-anchors the clock to the system clock, e.g. to follow
+    NTP slewing in long running processes.
+
+    """
+
+    def __init__(self) -> None:
+        self.resync()
+
+    def resync(self) -> None:
+        """Re-anchor the clock to the current system time."""
+        self._wall_anchor_ns = time.time_ns()
+        self._monotonic_anchor_ns = time.perf_counter_ns()
+
+    def now_ns(self) -> int:
+        """
+        Get the current time.
+
+        Returns:
+            int: Nanoseconds since 1970-01-01 UTC.
+
+        """
+        return self._wall_anchor_ns + (
+            time.perf_counter_ns() - self._monotonic_anchor_ns
+        )
+
+
+wall_clock = WallClock()
+
+
+def now_ns() -> int:
+    """
+    Get the current time from the process-wide `WallClock`.
+
+    Returns:
+        int: Nanoseconds since 1970-01-01 UTC.
+
+    """
+    return wall_clock.now_ns()
+
+
+def datetime_to_ns(value: datetime.datetime) -> int:
+    """
+    Convert an aware datetime to integer nanoseconds since the Unix epoch.
+
+    Args:
+        value (datetime.datetime): The timezone-aware datetime to convert.
+
+    Returns:
+        int: Nanoseconds since 1970-01-01 UTC.
+
+    """
+    return (value - _EPOCH) // datetime.timedelta(microseconds=1) * 1000
+
+
+@lru_cache(maxsize=1024)
+def ns_to_datetime(value_ns: int) -> datetime.datetime:
+    """
+    Convert integer nanoseconds since the Unix epoch to an aware UTC datetime.
+
+    The datetime is truncated to microseconds. Conversions are cached, so
+    the quotes of one tick, which share a timestamp, create a single datetime.
+
+    Args:
+        value_ns (int): Nanoseconds since 1970-01-01 UTC.
+
+    Returns:
+        datetime.datetime: The UTC datetime.
+
+    """
+    return _EPOCH + datetime.timedelta(microseconds=value_ns // 1000)
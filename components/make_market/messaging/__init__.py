@@ -1,3 +1,32 @@
+from make_market.messaging.codec import AvroCodec, QuoteCodec
+from make_market.messaging.deltas import (
+    DeltaDecoder,
+    DeltaEncoder,
+    QuoteDelta,
+    QuoteDeltaCodec,
+)
+from make_market.messaging.envelope import EnvelopeCodec, SchemaRegistry
+from make_market.messaging.fixed_point import FixedPoint
+from make_market.messaging.frames import QuoteFrame, QuoteFrameArrays, QuoteFrameCodec
+from make_market.messaging.lazy import LazyQuote
+from make_market.messaging.packing import PackedQuote, PackedQuoteCodec
 from make_market.messaging.schemas import BaseQuote
 
-__all__ = ["BaseQuote"]
+__all__ = [
+    "AvroCodec",
+    "BaseQuote",
+    "DeltaDecoder",
+    "DeltaEncoder",
+    "EnvelopeCodec",
+    "FixedPoint",
+    "LazyQuote",
+    "PackedQuote",
+    "PackedQuoteCodec",
+    "QuoteCodec",
+    "QuoteDelta",
+    "QuoteDeltaCodec",
+    "QuoteFrame",
+    "QuoteFrameArrays",
+    "QuoteFrameCodec",
+    "SchemaRegistry",
+]
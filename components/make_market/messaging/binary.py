@@ -0,0 +1,222 @@
+import datetime
+from typing import Any, Protocol
+
+import numpy as np
+from make_market.clock import datetime_to_ns, ns_to_datetime
+
+BINARY_VERSION = 2
+DEFAULT_MAX_LEVELS = 10
+SYMBOL_LENGTH = 16
+EXCHANGE_LENGTH = 16
+
+
+class BinaryQuoteProtocol(Protocol):
+    """The `BaseQuote` fields written by the binary encoding."""
+
+    symbol: str
+    exchange: str
+    vendor_timestamp: datetime.datetime
+    timestamp: datetime.datetime
+    bid_price: list[int]
+    ask_price: list[int]
+    price_exponent: int
+    bid_size: list[int]
+    ask_size: list[int]
+    size_exponent: int
+    app_id: int
+    tick_id: int
+    status: int
+    vendor_timestamp_ns: int
+    timestamp_ns: int
+
+
+def binary_quote_dtype(max_levels: int = DEFAULT_MAX_LEVELS) -> np.dtype:
+    """
+    Build the fixed layout of one binary quote.
+
+    The layout is packed and little-endian: a 4-byte header with the format
+    version, the level capacity and the number of bid and ask levels in use,
+    followed by the quote fields and fixed-capacity level arrays. Timestamps
+    are nanoseconds since the Unix epoch. Unused levels are zero.
+
+    Args:
+        max_levels (int, optional): The level capacity per side. Defaults to 10.
+
+    Returns:
+        np.dtype: The structured dtype of one quote.
+
+    Raises:
+        ValueError: If `max_levels` is not between 1 and 255.
+
+    """
+    if not 1 <= max_levels <= 255:
+        msg = f"max_levels must be between 1 and 255, got {max_levels}"
+        raise ValueError(msg)
+
+    return np.dtype(
+        [
+            # header
+            ("version", "u1"),
+            ("max_levels", "u1"),
+            ("n_bids", "u1"),
+            ("n_asks", "u1"),
+            # quote
+            ("symbol", f"S{SYMBOL_LENGTH}"),
+            ("exchange", f"S{EXCHANGE_LENGTH}"),
+            ("vendor_timestamp_ns", "<i8"),
+            ("timestamp_ns", "<i8"),
+            ("price_exponent", "i1"),
+            ("size_exponent", "i1"),
+            ("status", "<u2"),
+            ("app_id", "<i8"),
+            ("tick_id", "<i8"),
+            # levels
+            ("bid_price", "<i8", (max_levels,)),
+            ("bid_size", "<i8", (max_levels,)),
+            ("ask_price", "<i8", (max_levels,)),
+            ("ask_size", "<i8", (max_levels,)),
+        ]
+    )
+
+
+def _to_ns(value: datetime.datetime, value_ns: int) -> int:
+    return value_ns or datetime_to_ns(value)
+
+
+def _encode_text(value: str, length: int, name: str) -> bytes:
+    encoded = value.encode()
+    if len(encoded) > length:
+        msg = f"{name} {value!r} is longer than {length} bytes"
+        raise ValueError(msg)
+    return encoded
+
+
+class BinaryQuoteCodec:
+    """
+    BinaryQuoteCodec encodes quotes to a fixed binary layout.
+
+    Every quote takes exactly `dtype.itemsize` bytes, so a buffer of quotes is
+    read with `np.frombuffer` without copying or creating a Python object per
+    field, and a single field of many quotes is a strided column view. There
+    is no schema evolution: producer and consumer must use the same layout,
+    which suits same-host consumers, e.g. over `ipc://`.
+
+    Attributes:
+        max_levels (int): The level capacity per side.
+        dtype (np.dtype): The structured dtype of one quote.
+
+    """
+
+    def __init__(self, max_levels: int = DEFAULT_MAX_LEVELS) -> None:
+        self.max_levels = max_levels
+        self.dtype = binary_quote_dtype(max_levels)
+
+    def encode(self, quote: BinaryQuoteProtocol) -> bytes:
+        """
+        Encode a quote to the fixed binary layout.
+
+        Args:
+            quote (BinaryQuoteProtocol): The quote to encode, e.g. a `BaseQuote`.
+
+        Returns:
+            bytes: The encoded quote, `dtype.itemsize` bytes long.
+
+        Raises:
+            ValueError: If the quote has more levels than the capacity or its
+                        symbol or exchange does not fit.
+
+        """
+        n_bids, n_asks = len(quote.bid_price), len(quote.ask_price)
+        if max(n_bids, n_asks) > self.max_levels:
+            msg = f"quote has more than {self.max_levels} levels on one side"
+            raise ValueError(msg)
+
+        record = np.zeros((), dtype=self.dtype)
+        record["version"] = BINARY_VERSION
+        record["max_levels"] = self.max_levels
+        record["n_bids"] = n_bids
+        record["n_asks"] = n_asks
+        record["symbol"] = _encode_text(quote.symbol, SYMBOL_LENGTH, "symbol")
+        record["exchange"] = _encode_text(quote.exchange, EXCHANGE_LENGTH, "exchange")
+        record["vendor_timestamp_ns"] = _to_ns(
+            quote.vendor_timestamp, quote.vendor_timestamp_ns
+        )
+        record["timestamp_ns"] = _to_ns(quote.timestamp, quote.timestamp_ns)
+        record["price_exponent"] = quote.price_exponent
+        record["size_exponent"] = quote.size_exponent
+        record["status"] = quote.status
+        record["app_id"] = quote.app_id
+        record["tick_id"] = quote.tick_id
+        record["bid_price"][:n_bids] = quote.bid_price
+        record["bid_size"][:n_bids] = quote.bid_size
+        record["ask_price"][:n_asks] = quote.ask_price
+        record["ask_size"][:n_asks] = quote.ask_size
+        return record.tobytes()
+
+    def view(self, data: bytes | memoryview) -> np.ndarray:
+        """
+        View a buffer of one or more encoded quotes without copying.
+
+        Args:
+            data (bytes | memoryview): Concatenated encoded quotes.
+
+        Returns:
+            np.ndarray: A read-only structured array with one record per quote.
+
+        Raises:
+            ValueError: If the buffer is not a whole number of quotes or was
+                        written with another version or level capacity.
+
+        """
+        if len(data) % self.dtype.itemsize:
+            msg = f"buffer of {len(data)} bytes is not a multiple of {self.dtype.itemsize}"
+            raise ValueError(msg)
+
+        records = np.frombuffer(data, dtype=self.dtype)
+        if (records["version"] != BINARY_VERSION).any() or (
+            records["max_levels"] != self.max_levels
+        ).any():
+            msg = "buffer was not encoded with this binary layout"
+            raise ValueError(msg)
+        return records
+
+    def decode_fields(self, data: bytes | memoryview) -> dict[str, Any]:
+        """
+        Decode one encoded quote to the keyword arguments of `BaseQuote`.
+
+        Args:
+            data (bytes | memoryview): One encoded quote.
+
+        Returns:
+            dict[str, Any]: The quote fields, timestamps as UTC datetimes and nanoseconds.
+
+        Raises:
+            ValueError: If the buffer does not hold exactly one quote of this layout.
+
+        """
+        records = self.view(data)
+        if records.shape[0] != 1:
+            msg = f"expected one quote, got {records.shape[0]}"
+            raise ValueError(msg)
+
+        record = records[0]
+        n_bids, n_asks = int(record["n_bids"]), int(record["n_asks"])
+        vendor_timestamp_ns = int(record["vendor_timestamp_ns"])
+        timestamp_ns = int(record["timestamp_ns"])
+        return {
+            "symbol": record["symbol"].decode(),
+            "exchange": record["exchange"].decode(),
+            "vendor_timestamp": ns_to_datetime(vendor_timestamp_ns),
+            "timestamp": ns_to_datetime(timestamp_ns),
+            "bid_price": record["bid_price"][:n_bids].tolist(),
+            "ask_price": record["ask_price"][:n_asks].tolist(),
+            "price_exponent": int(record["price_exponent"]),
+            "bid_size": record["bid_size"][:n_bids].tolist(),
+            "ask_size": record["ask_size"][:n_asks].tolist(),
+            "size_exponent": int(record["size_exponent"]),
+            "app_id": int(record["app_id"]),
+            "tick_id": int(record["tick_id"]),
+            "status": int(record["status"]),
+            "vendor_timestamp_ns": vendor_timestamp_ns,
+            "timestamp_ns": timestamp_ns,
+        }
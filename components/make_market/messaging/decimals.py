@@ -1,4 +1,33 @@
 from decimal import Decimal
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+# 10.0 ** n is exact up to n = 22, so scaling by it rounds only once
+_MAX_EXACT_POWER = 22
+# above 2**52 a float64 no longer has a fractional part to round
+_MAX_EXACT_MANTISSA = 2.0**52
+
+# int64 holds [-2**63, 2**63)
+_INT64_BOUND = 2**63
+
+_FLOAT_POWERS = tuple(10.0**n for n in range(_MAX_EXACT_POWER + 1))
+
+
+@lru_cache(maxsize=64)
+def decimal_power(exponent: int) -> Decimal:
+    """
+    Get a power of ten as a Decimal, created once per exponent.
+
+    Args:
+        exponent (int): The power of ten.
+
+    Returns:
+        Decimal: `Decimal(10) ** exponent`.
+
+    """
+    return Decimal(10) ** exponent
 
 
 def float_to_digits_with_precision(value: float, exponent: int) -> int:
@@ -14,7 +43,7 @@ def float_to_digits_with_precision(value: float, exponent: int) -> int:
 
     """
     # normalize the value to the given exponent
-    factor = Decimal(10.0) ** exponent
+    factor = Decimal(1).scaleb(exponent)
 
     # get the sign, digits, and exponent of the value
     sign, digits, exponent = Decimal(value).quantize(factor).as_tuple()
@@ -23,6 +52,67 @@ def float_to_digits_with_precision(value: float, exponent: int) -> int:
     return int("".join(map(str, digits))) * (-1 if sign else 1)
 
 
+def floats_to_digits_with_precision(
+    values: npt.ArrayLike, exponent: int
+) -> npt.NDArray[np.int64]:
+    """
+    Converts an array of floating-point numbers to integer digits with a specified precision.
+
+    This is the vectorized counterpart of `float_to_digits_with_precision` and
+    returns exactly the same digits: the exact binary value of each float is
+    rounded half to even. The values are scaled with a single float64 rounding
+    and rounded with `np.rint`, which can only disagree with exact rounding when
+    the scaled value lies within one ulp of a tie or has no fractional bits
+    left. Those few values are converted with the Decimal path instead.
+
+    Args:
+        values (npt.ArrayLike): The floating-point numbers to convert.
+        exponent (int): The number of decimal places to consider for the conversion.
+
+    Returns:
+        npt.NDArray[np.int64]: The integer representation of each number with the specified precision.
+
+    Raises:
+        ValueError: If any value is not finite.
+        OverflowError: If a converted value does not fit in an int64.
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if not np.isfinite(values).all():
+        msg = "values must be finite"
+        raise ValueError(msg)
+
+    with np.errstate(over="ignore"):
+        if exponent <= 0:
+            scaled = values * 10.0**-exponent
+        else:
+            scaled = values / 10.0**exponent
+    # the bound is 2**63 itself, the exact digits near it are checked below
+    if np.any(np.abs(scaled) > _INT64_BOUND):
+        msg = f"values do not fit in an int64 at exponent {exponent}"
+        raise OverflowError(msg)
+
+    if abs(exponent) > _MAX_EXACT_POWER:
+        exact = np.ones(values.shape, dtype=bool)
+        digits = np.zeros(values.shape, dtype=np.int64)
+    else:
+        rounded = np.rint(scaled)
+
+        distance_to_tie = np.abs(scaled - np.floor(scaled) - 0.5)
+        exact = (distance_to_tie <= np.abs(np.spacing(scaled))) | (
+            np.abs(scaled) >= _MAX_EXACT_MANTISSA
+        )
+        digits = np.where(exact, 0.0, rounded).astype(np.int64)
+
+    for index in np.flatnonzero(exact):
+        digit = float_to_digits_with_precision(float(values.flat[index]), exponent)
+        if not -_INT64_BOUND <= digit < _INT64_BOUND:
+            msg = f"values do not fit in an int64 at exponent {exponent}"
+            raise OverflowError(msg)
+        digits.flat[index] = digit
+    return digits
+
+
 def decimal_from_int_number_with_exponent(number: int, exponent: int) -> Decimal:
     """
     Converts an integer number to a Decimal with a given exponent.
@@ -35,4 +125,108 @@ def decimal_from_int_number_with_exponent(number: int, exponent: int) -> Decimal
         Decimal: The resulting Decimal value after applying the exponent.
 
     """
-    return Decimal(number) * Decimal(10) ** exponent
+    return Decimal(number) * decimal_power(exponent)
+
+
+def digits_to_floats(values: npt.ArrayLike, exponent: int) -> npt.NDArray[np.float64]:
+    """
+    Converts integer digits with a shared exponent to floats.
+
+    The digits are scaled by a power of ten from a table of exact float64
+    powers: negative exponents divide by the power, so each value is
+    rounded only once, unlike multiplying by an inexact `10.0 ** exponent`.
+
+    Args:
+        values (npt.ArrayLike): The integer digits, e.g. the prices of a ladder.
+        exponent (int): The exponent shared by all values.
+
+    Returns:
+        npt.NDArray[np.float64]: The value of each number.
+
+    """
+    values = np.asarray(values, dtype=np.float64)
+    power = (
+        _FLOAT_POWERS[abs(exponent)]
+        if abs(exponent) <= _MAX_EXACT_POWER
+        else 10.0 ** abs(exponent)
+    )
+    return values / power if exponent <= 0 else values * power
+
+
+def digits_to_decimals(values: npt.ArrayLike, exponent: int) -> list[Decimal]:
+    """
+    Converts integer digits with a shared exponent to Decimals.
+
+    Args:
+        values (npt.ArrayLike): The integer digits, e.g. the prices of a ladder.
+        exponent (int): The exponent shared by all values.
+
+    Returns:
+        list[Decimal]: The exact value of each number, as
+        `decimal_from_int_number_with_exponent` returns it.
+
+    """
+    power = decimal_power(exponent)
+    return [Decimal(value) * power for value in np.asarray(values).tolist()]
+
+
+def _is_digits(text: str) -> bool:
+    # str.isdigit alone also accepts non-ASCII digits like "²"
+    return text.isascii() and text.isdigit()
+
+
+def decimal_text_to_digits(text: str, exponent: int) -> int:
+    """
+    Converts the decimal text of a number to integer digits with a specified precision.
+
+    The digits are read straight from the text, e.g. a JSON number, so no float
+    is involved: the exact decimal value is rounded half to even, like
+    `Decimal(text).quantize(...)` but without building a Decimal.
+
+    Args:
+        text (str): The number, e.g. "1.0850125", "-12" or "1e-05".
+        exponent (int): The number of decimal places to consider for the conversion.
+
+    Returns:
+        int: The integer representation of the number with the specified precision.
+
+    Raises:
+        ValueError: If the text is not a decimal number.
+
+    """
+    coefficient, e, text_exponent = text.lower().partition("e")
+    negative = coefficient[:1] == "-"
+    if coefficient[:1] in ("-", "+"):
+        coefficient = coefficient[1:]
+    integer, _, fraction = coefficient.partition(".")
+    exponent_digits = (
+        text_exponent[1:] if text_exponent[:1] in ("-", "+") else text_exponent
+    )
+    if not (_is_digits(integer + fraction) and (not e or _is_digits(exponent_digits))):
+        msg = f"not a decimal number: {text!r}"
+        raise ValueError(msg)
+
+    if not text_exponent and exponent <= 0:
+        # plain decimal text: keep the digits up to the precision, round on the rest
+        places = -exponent
+        result = int(integer + fraction[:places].ljust(places, "0"))
+        dropped = fraction[places:]
+        if dropped and (
+            dropped[0] > "5"
+            or (dropped[0] == "5" and (dropped[1:].strip("0") or result % 2))
+        ):
+            result += 1
+        return -result if negative else result
+
+    # the value is digits * 10**scale
+    digits = int(integer + fraction)
+    shift = (int(text_exponent) if text_exponent else 0) - len(fraction) - exponent
+
+    if shift >= 0:
+        result = digits * 10**shift
+    else:
+        result, remainder = divmod(digits, 10**-shift)
+        half = 5 * 10 ** (-shift - 1)
+        if remainder > half or (remainder == half and result % 2):
+            result += 1
+    return -result if negative else result
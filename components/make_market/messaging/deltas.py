@@ -0,0 +1,286 @@
+from dataclasses import dataclass
+
+from dataclasses_avroschema import AvroModel, types
+from make_market.messaging.codec import AvroCodec
+from make_market.messaging.schemas import BaseQuote
+from make_market.messaging.status import QuoteStatus
+
+DEFAULT_KEYFRAME_INTERVAL = 100
+
+
+@dataclass
+class QuoteDelta(AvroModel):
+    """
+    QuoteDelta is one message of a delta-encoded quote stream.
+
+    A keyframe carries the full ladder of a symbol, like a `BaseQuote`. Any
+    other message carries only the levels that changed since the previous
+    message of the symbol, keyed by price: a level with a size of 0 was
+    removed, any other size is the new size of the level.
+
+    Attributes:
+        symbol (str): The symbol of the financial instrument.
+        exchange (str): The exchange where the instrument is traded.
+        vendor_timestamp (datetime.datetime): The timestamp provided by the vendor.
+        timestamp (datetime.datetime): The local timestamp when the quote was received.
+        keyframe (bool): Whether the message carries the full ladder.
+        sequence (int): The number of the message in the stream of the symbol.
+        bid_price (list[int]): The bid prices of the ladder or of the changed levels.
+        ask_price (list[int]): The ask prices of the ladder or of the changed levels.
+        price_exponent (int): The exponent used for price scaling.
+        bid_size (list[int]): The sizes matching `bid_price`.
+        ask_size (list[int]): The sizes matching `ask_price`.
+        size_exponent (int): The exponent used for size scaling.
+        app_id (int): The application identifier.
+        tick_id (int): The tick identifier.
+        status (int): The quote status of the full quote.
+        vendor_timestamp_ns (int): The vendor timestamp in nanoseconds since the Unix epoch.
+        timestamp_ns (int): The local timestamp in nanoseconds since the Unix epoch.
+
+    """
+
+    symbol: str
+    exchange: str
+
+    vendor_timestamp: types.DateTimeMicro
+    timestamp: types.DateTimeMicro
+
+    # stream
+    keyframe: bool
+    sequence: int
+
+    # prices
+    bid_price: list[int]
+    ask_price: list[int]
+    price_exponent: int
+
+    # sizes
+    bid_size: list[int]
+    ask_size: list[int]
+    size_exponent: int
+
+    # ids
+    app_id: int
+    tick_id: int
+
+    # quote status
+    status: int
+
+    # nanosecond timestamps
+    vendor_timestamp_ns: int = 0
+    timestamp_ns: int = 0
+
+
+class QuoteDeltaCodec(AvroCodec[QuoteDelta]):
+    """QuoteDeltaCodec is the `AvroCodec` of `QuoteDelta`."""
+
+    def __init__(self) -> None:
+        super().__init__(QuoteDelta)
+
+
+def _level_map(side: str, prices: list[int], sizes: list[int]) -> dict[int, int]:
+    levels = dict(zip(prices, sizes, strict=True))
+    if len(levels) != len(prices):
+        msg = f"{side}_price must not contain duplicate prices"
+        raise ValueError(msg)
+    return levels
+
+
+def _changes(
+    old: dict[int, int], prices: list[int], sizes: list[int]
+) -> tuple[list[int], list[int]]:
+    changed_prices, changed_sizes = [], []
+    for price, size in zip(prices, sizes, strict=True):
+        if old.get(price) != size:
+            changed_prices.append(price)
+            changed_sizes.append(size)
+
+    new = set(prices)
+    for price in old:
+        if price not in new:
+            changed_prices.append(price)
+            changed_sizes.append(0)
+    return changed_prices, changed_sizes
+
+
+@dataclass
+class _SymbolState:
+    """The ladder of one symbol as of its last message, price -> size per side."""
+
+    bids: dict[int, int]
+    asks: dict[int, int]
+    price_exponent: int
+    size_exponent: int
+    sequence: int
+    since_keyframe: int = 0
+
+
+class DeltaEncoder:
+    """
+    DeltaEncoder turns a stream of `BaseQuote`s into a stream of `QuoteDelta`s.
+
+    The first quote of every symbol is sent as a keyframe, and so is every
+    `keyframe_interval`-th quote after it, which bounds how long a consumer
+    joining late or missing a message waits for a full ladder. A keyframe is
+    also sent when the exponents change, or when a quote has a level with a
+    size of 0, which a delta cannot tell apart from a removed level.
+
+    """
+
+    def __init__(self, keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL) -> None:
+        if keyframe_interval <= 0:
+            msg = "keyframe_interval must be positive"
+            raise ValueError(msg)
+
+        self.keyframe_interval = keyframe_interval
+        self._states: dict[str, _SymbolState] = {}
+
+    def force_keyframe(self, symbol: str) -> None:
+        """
+        Send the next quote of a symbol as a keyframe.
+
+        Args:
+            symbol (str): The symbol, e.g. after a consumer reported a gap.
+
+        """
+        self._states.pop(symbol, None)
+
+    def encode(self, quote: BaseQuote) -> QuoteDelta:
+        """
+        Encode a quote against the previous quote of its symbol.
+
+        Args:
+            quote (BaseQuote): The quote to encode.
+
+        Returns:
+            QuoteDelta: A keyframe or the changed levels.
+
+        Raises:
+            ValueError: If a side of the quote has the same price twice.
+
+        """
+        bids = _level_map("bid", quote.bid_price, quote.bid_size)
+        asks = _level_map("ask", quote.ask_price, quote.ask_size)
+        state = self._states.get(quote.symbol)
+        keyframe = (
+            state is None
+            or state.since_keyframe + 1 >= self.keyframe_interval
+            or state.price_exponent != quote.price_exponent
+            or state.size_exponent != quote.size_exponent
+            or 0 in quote.bid_size
+            or 0 in quote.ask_size
+        )
+
+        # testing state again lets the type checker narrow it
+        if keyframe or state is None:
+            bid_price, bid_size = quote.bid_price, quote.bid_size
+            ask_price, ask_size = quote.ask_price, quote.ask_size
+        else:
+            bid_price, bid_size = _changes(state.bids, quote.bid_price, quote.bid_size)
+            ask_price, ask_size = _changes(state.asks, quote.ask_price, quote.ask_size)
+
+        sequence = 0 if state is None else state.sequence + 1
+        self._states[quote.symbol] = _SymbolState(
+            bids=bids,
+            asks=asks,
+            price_exponent=quote.price_exponent,
+            size_exponent=quote.size_exponent,
+            sequence=sequence,
+            since_keyframe=0 if keyframe or state is None else state.since_keyframe + 1,
+        )
+
+        return QuoteDelta(
+            symbol=quote.symbol,
+            exchange=quote.exchange,
+            vendor_timestamp=quote.vendor_timestamp,
+            timestamp=quote.timestamp,
+            keyframe=keyframe,
+            sequence=sequence,
+            bid_price=list(bid_price),
+            ask_price=list(ask_price),
+            price_exponent=quote.price_exponent,
+            bid_size=list(bid_size),
+            ask_size=list(ask_size),
+            size_exponent=quote.size_exponent,
+            app_id=quote.app_id,
+            tick_id=quote.tick_id,
+            status=quote.status,
+            vendor_timestamp_ns=quote.vendor_timestamp_ns,
+            timestamp_ns=quote.timestamp_ns,
+        )
+
+
+def _apply(levels: dict[int, int], prices: list[int], sizes: list[int]) -> None:
+    for price, size in zip(prices, sizes, strict=True):
+        if size:
+            levels[price] = size
+        else:
+            levels.pop(price, None)
+
+
+class DeltaDecoder:
+    """
+    DeltaDecoder rebuilds full `BaseQuote`s from a stream of `QuoteDelta`s.
+
+    A symbol is decoded from its first keyframe on. Deltas that arrive before
+    it, or after a gap in the sequence, cannot be applied: they are dropped
+    and the symbol waits for its next keyframe.
+
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, _SymbolState] = {}
+
+    def decode(self, delta: QuoteDelta) -> BaseQuote | None:
+        """
+        Apply a message to the ladder of its symbol.
+
+        Args:
+            delta (QuoteDelta): The next message of the symbol.
+
+        Returns:
+            BaseQuote | None: The full quote, or None while waiting for a keyframe.
+
+        """
+        state = self._states.get(delta.symbol)
+        if delta.keyframe:
+            state = self._states[delta.symbol] = _SymbolState(
+                bids=dict(zip(delta.bid_price, delta.bid_size, strict=True)),
+                asks=dict(zip(delta.ask_price, delta.ask_size, strict=True)),
+                price_exponent=delta.price_exponent,
+                size_exponent=delta.size_exponent,
+                sequence=delta.sequence,
+            )
+            bid_price, bid_size = delta.bid_price, delta.bid_size
+            ask_price, ask_size = delta.ask_price, delta.ask_size
+        else:
+            if state is None or delta.sequence != state.sequence + 1:
+                self._states.pop(delta.symbol, None)
+                return None
+
+            _apply(state.bids, delta.bid_price, delta.bid_size)
+            _apply(state.asks, delta.ask_price, delta.ask_size)
+            state.sequence = delta.sequence
+
+            bids = sorted(state.bids.items(), reverse=True)
+            asks = sorted(state.asks.items())
+            bid_price, bid_size = [p for p, _ in bids], [s for _, s in bids]
+            ask_price, ask_size = [p for p, _ in asks], [s for _, s in asks]
+
+        return BaseQuote(
+            symbol=delta.symbol,
+            exchange=delta.exchange,
+            vendor_timestamp=delta.vendor_timestamp,
+            timestamp=delta.timestamp,
+            bid_price=list(bid_price),
+            ask_price=list(ask_price),
+            price_exponent=delta.price_exponent,
+            bid_size=list(bid_size),
+            ask_size=list(ask_size),
+            size_exponent=delta.size_exponent,
+            app_id=delta.app_id,
+            tick_id=delta.tick_id,
+            status=QuoteStatus(delta.status),
+            vendor_timestamp_ns=delta.vendor_timestamp_ns,
+            timestamp_ns=delta.timestamp_ns,
+        )
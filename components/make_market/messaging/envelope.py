@@ -0,0 +1,195 @@
+import io
+from typing import Any, Generic, cast
+
+import fastavro
+from dataclasses_avroschema import AvroModel, types
+from fastavro.schema import fingerprint, to_parsing_canonical_form
+from make_market.messaging.codec import AvroCodec, ModelT
+
+# Avro single-object encoding: marker, 8-byte CRC-64-AVRO fingerprint, payload
+SINGLE_OBJECT_MARKER = b"\xc3\x01"
+FINGERPRINT_SIZE = 8
+HEADER_SIZE = len(SINGLE_OBJECT_MARKER) + FINGERPRINT_SIZE
+
+
+def _as_schema(schema: types.JsonDict | type[AvroModel]) -> dict[str, Any]:
+    if isinstance(schema, type) and issubclass(schema, AvroModel):
+        return schema.avro_schema_to_python()
+    return schema
+
+
+def schema_fingerprint(schema: types.JsonDict | type[AvroModel]) -> bytes:
+    """
+    Calculate the CRC-64-AVRO fingerprint of a schema.
+
+    Args:
+        schema (types.JsonDict | type[AvroModel]): The schema or the model defining it.
+
+    Returns:
+        bytes: The 8-byte little-endian fingerprint of the schema's canonical form.
+
+    """
+    canonical_form = to_parsing_canonical_form(_as_schema(schema))
+    return bytes.fromhex(fingerprint(canonical_form, "CRC-64-AVRO"))
+
+
+def pack_envelope(schema_id: bytes, payload: bytes) -> bytes:
+    """
+    Prefix a schemaless Avro payload with the single-object header.
+
+    Args:
+        schema_id (bytes): The fingerprint of the writer schema.
+        payload (bytes): The schemaless Avro encoding of the message.
+
+    Returns:
+        bytes: The message in Avro single-object encoding.
+
+    """
+    return SINGLE_OBJECT_MARKER + schema_id + payload
+
+
+def unpack_envelope(data: bytes) -> tuple[bytes, bytes]:
+    """
+    Split a message in Avro single-object encoding.
+
+    Args:
+        data (bytes): The message.
+
+    Returns:
+        tuple[bytes, bytes]: The fingerprint of the writer schema and the payload.
+
+    Raises:
+        ValueError: If the message does not start with the single-object header.
+
+    """
+    if len(data) < HEADER_SIZE or not data.startswith(SINGLE_OBJECT_MARKER):
+        msg = "message is not in Avro single-object encoding"
+        raise ValueError(msg)
+    return data[len(SINGLE_OBJECT_MARKER) : HEADER_SIZE], data[HEADER_SIZE:]
+
+
+class SchemaRegistry:
+    """
+    SchemaRegistry is a process-local cache of parsed writer schemas by fingerprint.
+
+    Schemas are parsed once, when registered. Consumers register every schema
+    version their producers may write, and each message is then decoded with
+    the writer schema its fingerprint names.
+
+    """
+
+    def __init__(self) -> None:
+        self._schemas: dict[bytes, dict[str, Any]] = {}
+
+    def __contains__(self, schema_id: bytes) -> bool:
+        return schema_id in self._schemas
+
+    def register(self, schema: types.JsonDict | type[AvroModel]) -> bytes:
+        """
+        Parse and cache a schema.
+
+        Args:
+            schema (types.JsonDict | type[AvroModel]): The schema or the model defining it.
+
+        Returns:
+            bytes: The fingerprint of the schema.
+
+        """
+        schema = _as_schema(schema)
+        schema_id = schema_fingerprint(schema)
+        if schema_id not in self._schemas:
+            # a record schema always parses to a dict
+            self._schemas[schema_id] = cast(
+                "dict[str, Any]", fastavro.parse_schema(schema)
+            )
+        return schema_id
+
+    def get(self, schema_id: bytes) -> dict[str, Any]:
+        """
+        Look up a parsed schema.
+
+        Args:
+            schema_id (bytes): The fingerprint of the schema.
+
+        Returns:
+            dict[str, Any]: The parsed schema.
+
+        Raises:
+            KeyError: If no schema with this fingerprint is registered.
+
+        """
+        try:
+            return self._schemas[schema_id]
+        except KeyError:
+            msg = f"unknown schema fingerprint {schema_id.hex()}"
+            raise KeyError(msg) from None
+
+
+default_registry = SchemaRegistry()
+
+
+class EnvelopeCodec(Generic[ModelT]):
+    """
+    EnvelopeCodec wraps an `AvroCodec` in the Avro single-object encoding.
+
+    Every message starts with a 2-byte marker and the fingerprint of the
+    schema it was written with. Messages written with the codec's own schema
+    are decoded on the codec's fast path. Messages from producers on another
+    schema version are resolved against the codec's schema, using the writer
+    schema cached in the registry, so producers can be upgraded one by one.
+
+    Attributes:
+        codec (AvroCodec[ModelT]): The codec of the payload.
+        registry (SchemaRegistry): The registry of known writer schemas.
+        schema_id (bytes): The fingerprint of the codec's schema.
+
+    """
+
+    def __init__(
+        self, codec: AvroCodec[ModelT], registry: SchemaRegistry | None = None
+    ) -> None:
+        self.codec = codec
+        self.registry = default_registry if registry is None else registry
+        self.schema_id = self.registry.register(codec.model)
+
+    def encode(self, message: ModelT) -> bytes:
+        """
+        Encode a message in Avro single-object encoding.
+
+        Args:
+            message (ModelT): The message to encode.
+
+        Returns:
+            bytes: The header followed by the schemaless encoding of the message.
+
+        """
+        return pack_envelope(self.schema_id, self.codec.encode(message))
+
+    def decode(self, data: bytes, *, trusted: bool = False) -> ModelT:
+        """
+        Decode a message in Avro single-object encoding.
+
+        Args:
+            data (bytes): The message.
+            trusted (bool, optional): Skip the field validation of the model.
+                Defaults to False.
+
+        Returns:
+            ModelT: The decoded message.
+
+        Raises:
+            ValueError: If the message does not start with the single-object header.
+            KeyError: If the writer schema is not registered.
+
+        """
+        schema_id, payload = unpack_envelope(data)
+        if schema_id == self.schema_id:
+            return self.codec.decode(payload, trusted=trusted)
+
+        record = cast(
+            "dict[str, Any]",
+            fastavro.schemaless_reader(
+                io.BytesIO(payload), self.registry.get(schema_id), self.codec.schema
+            ),
+        )
+        return self.codec.from_record(record, trusted=trusted)
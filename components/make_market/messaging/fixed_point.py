@@ -0,0 +1,153 @@
+from dataclasses import dataclass
+from decimal import Decimal
+from functools import total_ordering
+from typing import cast
+
+from make_market.messaging.decimals import decimal_power, digits_to_floats
+
+
+def _round_half_even(value: int, divisor: int) -> int:
+    result, remainder = divmod(value, divisor)
+    twice = 2 * remainder
+    if twice > divisor or (twice == divisor and result % 2):
+        result += 1
+    return result
+
+
+@total_ordering
+@dataclass(frozen=True, eq=False)
+class FixedPoint:
+    """
+    FixedPoint is an exact decimal number stored as an integer mantissa and an exponent.
+
+    It is the value of one price or size of a quote, e.g.
+    `FixedPoint(quote.bid_price[0], quote.price_exponent)`, and does integer
+    arithmetic only. Numbers with different exponents are aligned to the
+    smaller exponent, so addition, subtraction and comparison are exact and
+    `FixedPoint(10, -1) == FixedPoint(1, 0)`.
+
+    Attributes:
+        mantissa (int): The integer digits of the number.
+        exponent (int): The power of ten the mantissa is scaled by.
+
+    """
+
+    mantissa: int
+    exponent: int
+
+    @classmethod
+    def from_decimal(cls, value: Decimal) -> "FixedPoint":
+        """
+        Create a FixedPoint from a finite Decimal, keeping all of its digits.
+
+        Args:
+            value (Decimal): The number.
+
+        Returns:
+            FixedPoint: The same number.
+
+        Raises:
+            ValueError: If the Decimal is not finite.
+
+        """
+        if not value.is_finite():
+            msg = f"cannot convert {value} to FixedPoint"
+            raise ValueError(msg)
+        sign, digits, exponent = value.as_tuple()
+        mantissa = int("".join(map(str, digits)))
+        # only NaN and infinities have a letter exponent, they are rejected above
+        return cls(-mantissa if sign else mantissa, cast("int", exponent))
+
+    def _aligned(self, other: "FixedPoint") -> tuple[int, int, int]:
+        exponent = min(self.exponent, other.exponent)
+        return (
+            self.mantissa * 10 ** (self.exponent - exponent),
+            other.mantissa * 10 ** (other.exponent - exponent),
+            exponent,
+        )
+
+    def rescale(self, exponent: int) -> "FixedPoint":
+        """
+        Express the number with another exponent.
+
+        Args:
+            exponent (int): The new exponent.
+
+        Returns:
+            FixedPoint: The number, rounded half to even if the new exponent
+            is larger than the current one.
+
+        """
+        if exponent <= self.exponent:
+            return FixedPoint(
+                self.mantissa * 10 ** (self.exponent - exponent), exponent
+            )
+        return FixedPoint(
+            _round_half_even(self.mantissa, 10 ** (exponent - self.exponent)), exponent
+        )
+
+    def normalize(self) -> "FixedPoint":
+        """
+        Strip the trailing zeros of the mantissa.
+
+        Returns:
+            FixedPoint: The same number with the largest possible exponent.
+
+        """
+        if not self.mantissa:
+            return FixedPoint(0, 0)
+        mantissa, exponent = self.mantissa, self.exponent
+        while not mantissa % 10:
+            mantissa //= 10
+            exponent += 1
+        return FixedPoint(mantissa, exponent)
+
+    def to_decimal(self) -> Decimal:
+        """
+        Convert the number to a Decimal.
+
+        Returns:
+            Decimal: The exact value of the number.
+
+        """
+        return Decimal(self.mantissa) * decimal_power(self.exponent)
+
+    def __float__(self) -> float:
+        return float(digits_to_floats(self.mantissa, self.exponent))
+
+    def __neg__(self) -> "FixedPoint":
+        return FixedPoint(-self.mantissa, self.exponent)
+
+    def __abs__(self) -> "FixedPoint":
+        return FixedPoint(abs(self.mantissa), self.exponent)
+
+    def __add__(self, other: "FixedPoint") -> "FixedPoint":
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        left, right, exponent = self._aligned(other)
+        return FixedPoint(left + right, exponent)
+
+    def __sub__(self, other: "FixedPoint") -> "FixedPoint":
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        left, right, exponent = self._aligned(other)
+        return FixedPoint(left - right, exponent)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        left, right, _ = self._aligned(other)
+        return left == right
+
+    def __lt__(self, other: "FixedPoint") -> bool:
+        if not isinstance(other, FixedPoint):
+            return NotImplemented
+        left, right, _ = self._aligned(other)
+        return left < right
+
+    def __hash__(self) -> int:
+        normalized = self.normalize()
+        return hash((normalized.mantissa, normalized.exponent))
+
+    def __str__(self) -> str:
+        return str(self.to_decimal())
@@ -0,0 +1,278 @@
+import datetime
+from collections.abc import Iterator, Mapping
+from dataclasses import dataclass, field
+from itertools import accumulate
+
+import numpy as np
+import numpy.typing as npt
+from dataclasses_avroschema import AvroModel, types
+from make_market.clock import datetime_to_ns
+from make_market.messaging.codec import AvroCodec
+from make_market.messaging.schemas import BaseQuote, RawVendorQuote
+from make_market.messaging.status import QuoteStatus, status_from_top_of_book_arrays
+
+IntArray = npt.NDArray[np.int64]
+
+
+def _offsets(levels: list[list[int]]) -> list[int]:
+    return list(accumulate((len(side) for side in levels), initial=0))
+
+
+def _top_of_book(
+    prices: IntArray, offsets: IntArray
+) -> tuple[IntArray, npt.NDArray[np.bool_]]:
+    has_levels = offsets[1:] > offsets[:-1]
+    # clip keeps empty trailing books from indexing past the end
+    first = np.minimum(offsets[:-1], max(prices.shape[0] - 1, 0))
+    top = prices[first] if prices.shape[0] else np.zeros(first.shape, np.int64)
+    return top, has_levels
+
+
+def _statuses(
+    bid_price: list[int],
+    bid_offsets: list[int],
+    ask_price: list[int],
+    ask_offsets: list[int],
+) -> list[int]:
+    top_bids, has_bids = _top_of_book(
+        np.asarray(bid_price, dtype=np.int64), np.asarray(bid_offsets, dtype=np.int64)
+    )
+    top_asks, has_asks = _top_of_book(
+        np.asarray(ask_price, dtype=np.int64), np.asarray(ask_offsets, dtype=np.int64)
+    )
+    return status_from_top_of_book_arrays(
+        top_bids, top_asks, has_bids=has_bids, has_asks=has_asks
+    ).tolist()
+
+
+@dataclass(frozen=True)
+class QuoteFrameArrays:
+    """
+    QuoteFrameArrays holds the columns of a `QuoteFrame` as int64 arrays.
+
+    The levels of book `i` are `bid_price[bid_offsets[i]:bid_offsets[i + 1]]`
+    and likewise for the other level columns.
+
+    Attributes:
+        statuses (IntArray): The status flags of each book.
+        bid_offsets (IntArray): Start of each book's bids, plus the total, shape (n_books + 1,).
+        bid_price (IntArray): The bid price mantissas of all books.
+        bid_size (IntArray): The bid size mantissas of all books.
+        ask_offsets (IntArray): Start of each book's asks, plus the total, shape (n_books + 1,).
+        ask_price (IntArray): The ask price mantissas of all books.
+        ask_size (IntArray): The ask size mantissas of all books.
+
+    """
+
+    statuses: IntArray
+    bid_offsets: IntArray
+    bid_price: IntArray
+    bid_size: IntArray
+    ask_offsets: IntArray
+    ask_price: IntArray
+    ask_size: IntArray
+
+    def levels(self, index: int) -> tuple[IntArray, IntArray, IntArray, IntArray]:
+        """
+        Get the levels of one book as views into the columns.
+
+        Args:
+            index (int): The position of the book in the frame.
+
+        Returns:
+            tuple[IntArray, IntArray, IntArray, IntArray]: The bid prices, bid
+            sizes, ask prices and ask sizes of the book.
+
+        """
+        bids = slice(self.bid_offsets[index], self.bid_offsets[index + 1])
+        asks = slice(self.ask_offsets[index], self.ask_offsets[index + 1])
+        return (
+            self.bid_price[bids],
+            self.bid_size[bids],
+            self.ask_price[asks],
+            self.ask_size[asks],
+        )
+
+
+@dataclass
+class QuoteFrame(AvroModel):
+    """
+    QuoteFrame packs the quotes of many symbols from one vendor tick into one message.
+
+    All quotes share the exchange, the receive timestamp, the ids and the
+    price and size exponents. The per-symbol fields are columns, and the
+    levels of all books are flattened into one list per field, with offsets
+    marking where each book starts. One frame replaces one `BaseQuote` per
+    symbol, so the per-message cost of ZeroMQ and Avro is paid once per tick.
+
+    Attributes:
+        exchange (str): The exchange where the instruments are traded.
+        timestamp (datetime.datetime): The local timestamp when the tick was received.
+        price_exponent (int): The exponent used for price scaling.
+        size_exponent (int): The exponent used for size scaling.
+        app_id (int): The application identifier.
+        tick_id (int): The tick identifier.
+        symbols (list[str]): The symbol of each book.
+        vendor_timestamps (list[datetime.datetime]): The vendor timestamp of each book.
+        statuses (list[int]): The status flags of each book.
+        bid_offsets (list[int]): Start of each book's bids, plus the total.
+        bid_price (list[int]): The bid prices of all books.
+        bid_size (list[int]): The bid sizes of all books.
+        ask_offsets (list[int]): Start of each book's asks, plus the total.
+        ask_price (list[int]): The ask prices of all books.
+        ask_size (list[int]): The ask sizes of all books.
+        timestamp_ns (int): The local timestamp in nanoseconds since the Unix epoch.
+        vendor_timestamps_ns (list[int]): The vendor timestamp of each book in
+            nanoseconds since the Unix epoch.
+
+    """
+
+    exchange: str
+    timestamp: types.DateTimeMicro
+    price_exponent: int
+    size_exponent: int
+    app_id: int
+    tick_id: int
+
+    # one entry per book
+    symbols: list[str]
+    vendor_timestamps: list[types.DateTimeMicro]
+    statuses: list[int]
+
+    # flattened levels
+    bid_offsets: list[int]
+    bid_price: list[int]
+    bid_size: list[int]
+    ask_offsets: list[int]
+    ask_price: list[int]
+    ask_size: list[int]
+
+    # nanosecond timestamps
+    timestamp_ns: int = 0
+    vendor_timestamps_ns: list[int] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.symbols)
+
+    def __getitem__(self, index: int) -> BaseQuote:
+        bids = slice(self.bid_offsets[index], self.bid_offsets[index + 1])
+        asks = slice(self.ask_offsets[index], self.ask_offsets[index + 1])
+        return BaseQuote(
+            symbol=self.symbols[index],
+            exchange=self.exchange,
+            vendor_timestamp=self.vendor_timestamps[index],
+            timestamp=self.timestamp,
+            bid_price=self.bid_price[bids],
+            ask_price=self.ask_price[asks],
+            price_exponent=self.price_exponent,
+            bid_size=self.bid_size[bids],
+            ask_size=self.ask_size[asks],
+            size_exponent=self.size_exponent,
+            app_id=self.app_id,
+            tick_id=self.tick_id,
+            status=QuoteStatus(self.statuses[index]),
+            vendor_timestamp_ns=self.vendor_timestamps_ns[index]
+            if self.vendor_timestamps_ns
+            else 0,
+            timestamp_ns=self.timestamp_ns,
+        )
+
+    def __iter__(self) -> Iterator[BaseQuote]:
+        return (self[i] for i in range(len(self)))
+
+    @classmethod
+    def from_raw_vendor_quotes(  # noqa: PLR0913
+        cls,
+        raw_quotes: Mapping[str, RawVendorQuote],
+        exchange: str,
+        timestamp: datetime.datetime,
+        app_id: int,
+        tick_id: int,
+        timestamp_ns: int | None = None,
+    ) -> "QuoteFrame":
+        """
+        Create a frame from the raw quotes of one vendor tick.
+
+        The status of every book is computed from the top of book in one
+        vectorized pass.
+
+        Args:
+            raw_quotes (Mapping[str, RawVendorQuote]): The raw quote of each symbol.
+            exchange (str): The exchange where the instruments are traded.
+            timestamp (datetime.datetime): The local timestamp when the tick was received.
+            app_id (int): The application identifier.
+            tick_id (int): The tick identifier.
+            timestamp_ns (int | None, optional): The local timestamp in nanoseconds
+                since the Unix epoch. Defaults to the value of `timestamp`.
+
+        Returns:
+            QuoteFrame: The frame holding every symbol of the tick.
+
+        Raises:
+            ValueError: If the raw quotes do not all share the same exponents.
+
+        """
+        quotes = list(raw_quotes.values())
+        exponents = {(q.price_exponent, q.size_exponent) for q in quotes}
+        if len(exponents) > 1:
+            msg = "all quotes of a frame must share the same price and size exponents"
+            raise ValueError(msg)
+        price_exponent, size_exponent = exponents.pop() if exponents else (0, 0)
+
+        bid_offsets = _offsets([q.bid_price for q in quotes])
+        bid_price = [p for q in quotes for p in q.bid_price]
+        ask_offsets = _offsets([q.ask_price for q in quotes])
+        ask_price = [p for q in quotes for p in q.ask_price]
+        return cls(
+            exchange=exchange,
+            timestamp=timestamp,
+            price_exponent=price_exponent,
+            size_exponent=size_exponent,
+            app_id=app_id,
+            tick_id=tick_id,
+            symbols=list(raw_quotes),
+            vendor_timestamps=[q.timestamp for q in quotes],
+            statuses=_statuses(bid_price, bid_offsets, ask_price, ask_offsets),
+            bid_offsets=bid_offsets,
+            bid_price=bid_price,
+            bid_size=[s for q in quotes for s in q.bid_size],
+            ask_offsets=ask_offsets,
+            ask_price=ask_price,
+            ask_size=[s for q in quotes for s in q.ask_size],
+            timestamp_ns=datetime_to_ns(timestamp)
+            if timestamp_ns is None
+            else timestamp_ns,
+            vendor_timestamps_ns=[
+                datetime_to_ns(q.timestamp)
+                if q.timestamp_ns is None
+                else q.timestamp_ns
+                for q in quotes
+            ],
+        )
+
+    def to_arrays(self) -> QuoteFrameArrays:
+        """
+        Convert the columns of the frame to int64 arrays.
+
+        Each column is converted once, the books are then read as views.
+
+        Returns:
+            QuoteFrameArrays: The columns of the frame.
+
+        """
+        return QuoteFrameArrays(
+            statuses=np.asarray(self.statuses, dtype=np.int64),
+            bid_offsets=np.asarray(self.bid_offsets, dtype=np.int64),
+            bid_price=np.asarray(self.bid_price, dtype=np.int64),
+            bid_size=np.asarray(self.bid_size, dtype=np.int64),
+            ask_offsets=np.asarray(self.ask_offsets, dtype=np.int64),
+            ask_price=np.asarray(self.ask_price, dtype=np.int64),
+            ask_size=np.asarray(self.ask_size, dtype=np.int64),
+        )
+
+
+class QuoteFrameCodec(AvroCodec[QuoteFrame]):
+    """QuoteFrameCodec is the `AvroCodec` of `QuoteFrame`."""
+
+    def __init__(self) -> None:
+        super().__init__(QuoteFrame)
@@ -0,0 +1,244 @@
+import datetime
+import io
+from functools import cached_property
+from typing import Any, Self, cast
+
+import fastavro
+from make_market.messaging.codec import QuoteCodec
+from make_market.messaging.envelope import (
+    EnvelopeCodec,
+    SchemaRegistry,
+    unpack_envelope,
+)
+from make_market.messaging.schemas import BaseQuote
+from make_market.messaging.status import QuoteStatus
+
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.UTC)
+
+_codec = QuoteCodec()
+_envelope_codec = EnvelopeCodec(_codec)
+
+
+def _field_kind(avro_type: Any) -> str:
+    if isinstance(avro_type, dict):
+        avro_type = avro_type["type"]
+    if avro_type in ("string", "long", "array"):
+        return avro_type
+    msg = f"unsupported Avro type for lazy decoding: {avro_type!r}"
+    raise TypeError(msg)
+
+
+def _layout(schema: dict[str, Any]) -> tuple[list[str], list[tuple[str, str]]]:
+    """
+    Split the record fields into leading strings and the varint fields after them.
+
+    Every field after the leading strings is a long or an array of longs, so
+    the rest of a message is nothing but a sequence of varints.
+    """
+    fields = [(f["name"], _field_kind(f["type"])) for f in schema["fields"]]
+    n_strings = next(
+        (i for i, (_, kind) in enumerate(fields) if kind != "string"), len(fields)
+    )
+    if any(kind == "string" for _, kind in fields[n_strings:]):
+        msg = "lazy decoding needs all string fields at the start of the record"
+        raise TypeError(msg)
+    return [name for name, _ in fields[:n_strings]], fields[n_strings:]
+
+
+_STRINGS, _VARINTS = _layout(BaseQuote.avro_schema_to_python())
+_ARRAY_POSITIONS = [i for i, (_, kind) in enumerate(_VARINTS) if kind == "array"]
+# longs before the first array sit at a fixed varint index from the start,
+# longs after the last array at a fixed index from the end of the message
+_FORWARD = {name: i for i, (name, _) in enumerate(_VARINTS[: _ARRAY_POSITIONS[0]])}
+_BACKWARD = {
+    name: len(_VARINTS) - 1 - i
+    for i, (name, _) in enumerate(_VARINTS)
+    if i > _ARRAY_POSITIONS[-1]
+}
+
+
+def _zigzag(value: int) -> int:
+    return (value >> 1) ^ -(value & 1)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return _zigzag(value), offset
+        shift += 7
+
+
+class LazyQuote:
+    """
+    LazyQuote reads a `BaseQuote` straight from its Avro encoding, field by field.
+
+    Only the leading strings are decoded up front. The timestamps, `tick_id`,
+    `app_id` and `status` are single varints at a fixed position from the
+    start or the end of the message, so reading them does not touch the
+    level lists. The rest of the record is decoded, with
+    the precompiled `QuoteCodec` schema, the first time a level is accessed. A consumer
+    that filters on the header pays for the levels of the quotes it keeps only.
+
+    The constructor takes a bare schemaless payload written with the current
+    `BaseQuote` schema; messages from the bus, in the single-object envelope,
+    go through `from_envelope`.
+
+    Attributes:
+        data (bytes): The schemaless Avro encoding of the quote.
+        symbol (str): The symbol of the financial instrument.
+        exchange (str): The exchange where the instrument is traded.
+
+    """
+
+    symbol: str
+    exchange: str
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+
+        offset = 0
+        for name in _STRINGS:
+            length, offset = _read_varint(data, offset)
+            setattr(self, name, data[offset : offset + length].decode())
+            offset += length
+        self._varints_offset = offset
+
+    @classmethod
+    def from_envelope(cls, data: bytes, registry: SchemaRegistry | None = None) -> Self:
+        """
+        Read a quote in Avro single-object encoding, as published on the bus.
+
+        A quote written with the current `BaseQuote` schema is read lazily
+        from its payload. A quote written with another schema version is
+        resolved and decoded in full by an `EnvelopeCodec`, then re-encoded,
+        since the lazy layout only holds for the current schema.
+
+        Args:
+            data (bytes): The message.
+            registry (SchemaRegistry | None, optional): The registry of known
+                writer schemas. Defaults to the default registry.
+
+        Returns:
+            Self: The lazy quote.
+
+        Raises:
+            ValueError: If the message does not start with the single-object header.
+            KeyError: If the writer schema is not registered.
+
+        """
+        schema_id, payload = unpack_envelope(data)
+        if schema_id == _envelope_codec.schema_id:
+            return cls(payload)
+        codec = _envelope_codec if registry is None else EnvelopeCodec(_codec, registry)
+        return cls(_codec.encode(codec.decode(data, trusted=True)))
+
+    def _forward(self, name: str) -> int:
+        offset = self._varints_offset
+        for _ in range(_FORWARD[name] + 1):
+            value, offset = _read_varint(self.data, offset)
+        return value
+
+    def _backward(self, name: str) -> int:
+        # every byte of a varint but its last has the high bit set, so the
+        # varints at the end of the message are found by scanning backwards
+        end = len(self.data)
+        for _ in range(_BACKWARD[name] + 1):
+            start = end - 1
+            while start > self._varints_offset and self.data[start - 1] >= 0x80:
+                start -= 1
+            end, value_start = start, start
+        value, _ = _read_varint(self.data, value_start)
+        return value
+
+    def _long(self, name: str) -> int:
+        if name in _FORWARD:
+            return self._forward(name)
+        if name in _BACKWARD:
+            return self._backward(name)
+        return self._fields[name]
+
+    @property
+    def vendor_timestamp(self) -> datetime.datetime:
+        """The timestamp provided by the vendor, read without decoding the levels."""
+        return _EPOCH + datetime.timedelta(microseconds=self._long("vendor_timestamp"))
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """The local timestamp when the quote was received, read without decoding the levels."""
+        return _EPOCH + datetime.timedelta(microseconds=self._long("timestamp"))
+
+    @property
+    def vendor_timestamp_ns(self) -> int:
+        """The vendor timestamp in nanoseconds, read without decoding the levels."""
+        return self._long("vendor_timestamp_ns")
+
+    @property
+    def timestamp_ns(self) -> int:
+        """The local timestamp in nanoseconds, read without decoding the levels."""
+        return self._long("timestamp_ns")
+
+    @property
+    def app_id(self) -> int:
+        """The application identifier, read without decoding the levels."""
+        return self._long("app_id")
+
+    @property
+    def tick_id(self) -> int:
+        """The tick identifier, read without decoding the levels."""
+        return self._long("tick_id")
+
+    @property
+    def status(self) -> QuoteStatus:
+        """The quote status, read without decoding the levels."""
+        return QuoteStatus(self._long("status"))
+
+    @cached_property
+    def _fields(self) -> dict[str, Any]:
+        return cast(
+            "dict[str, Any]",
+            fastavro.schemaless_reader(io.BytesIO(self.data), _codec.schema, None),
+        )
+
+    @property
+    def bid_price(self) -> list[int]:
+        """The bid prices, decoded on first access."""
+        return self._fields["bid_price"]
+
+    @property
+    def ask_price(self) -> list[int]:
+        """The ask prices, decoded on first access."""
+        return self._fields["ask_price"]
+
+    @property
+    def price_exponent(self) -> int:
+        """The exponent used for price scaling, decoded on first access."""
+        return self._fields["price_exponent"]
+
+    @property
+    def bid_size(self) -> list[int]:
+        """The bid sizes, decoded on first access."""
+        return self._fields["bid_size"]
+
+    @property
+    def ask_size(self) -> list[int]:
+        """The ask sizes, decoded on first access."""
+        return self._fields["ask_size"]
+
+    @property
+    def size_exponent(self) -> int:
+        """The exponent used for size scaling, decoded on first access."""
+        return self._fields["size_exponent"]
+
+    def to_quote(self) -> BaseQuote:
+        """
+        Decode the full quote.
+
+        Returns:
+            BaseQuote: The quote, decoded with the trusted `QuoteCodec` path.
+
+        """
+        return _codec.decode(self.data, trusted=True)
@@ -0,0 +1,215 @@
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from dataclasses_avroschema import AvroModel, types
+from make_market.messaging.codec import AvroCodec
+from make_market.messaging.schemas import BaseQuote
+from make_market.messaging.status import QuoteStatus
+
+# a 64-bit varint has at most 10 groups of 7 bits
+_MAX_VARINT_GROUPS = 10
+_GROUP_THRESHOLDS = np.array(
+    [1 << (7 * group) for group in range(1, _MAX_VARINT_GROUPS)], dtype=np.uint64
+)
+
+
+def _zigzag(values: npt.NDArray[np.int64]) -> npt.NDArray[np.uint64]:
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+
+def _unzigzag(values: npt.NDArray[np.uint64]) -> npt.NDArray[np.int64]:
+    return (values >> np.uint64(1)).view(np.int64) ^ -(values & np.uint64(1)).view(
+        np.int64
+    )
+
+
+def pack_levels(values: npt.ArrayLike) -> bytes:
+    """
+    Pack a level array as zigzag varints of the differences between levels.
+
+    The first value is written as is, every other value as the difference to
+    the value before it. Adjacent levels of a ladder are a few ticks apart,
+    so most differences fit in a single byte where the full value would take
+    three or four. All values are encoded at once, one vectorized pass per
+    varint byte.
+
+    Args:
+        values (npt.ArrayLike): The integer levels, e.g. the bid prices of a quote.
+
+    Returns:
+        bytes: The packed levels.
+
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if not values.shape[0]:
+        return b""
+
+    # int64 differences wrap around on overflow, and so does the cumulative
+    # sum that undoes them, so extreme values still round trip
+    encoded = _zigzag(np.diff(values, prepend=np.int64(0)))
+    n_groups = 1 + (encoded[:, None] >= _GROUP_THRESHOLDS).sum(axis=1)
+    starts = np.concatenate(([0], np.cumsum(n_groups[:-1])))
+
+    packed = np.empty(int(n_groups.sum()), dtype=np.uint8)
+    for group in range(int(n_groups.max())):
+        in_group = n_groups > group
+        byte = (encoded[in_group] >> np.uint64(7 * group)) & np.uint64(0x7F)
+        continued = n_groups[in_group] > group + 1
+        packed[starts[in_group] + group] = byte | (
+            continued.astype(np.uint64) << np.uint64(7)
+        )
+    return packed.tobytes()
+
+
+def unpack_levels(data: bytes) -> npt.NDArray[np.int64]:
+    """
+    Unpack a level array written by `pack_levels`.
+
+    Args:
+        data (bytes): The packed levels.
+
+    Returns:
+        npt.NDArray[np.int64]: The levels.
+
+    Raises:
+        ValueError: If the data ends in the middle of a varint.
+
+    """
+    packed = np.frombuffer(data, dtype=np.uint8)
+    if not packed.shape[0]:
+        return np.zeros(0, dtype=np.int64)
+    if packed[-1] & 0x80:
+        msg = "packed levels end in the middle of a varint"
+        raise ValueError(msg)
+
+    # the last byte of every varint has the high bit clear
+    ends = np.flatnonzero(packed < 0x80)
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    value_index = np.repeat(np.arange(ends.shape[0]), ends - starts + 1)
+    group = np.arange(packed.shape[0]) - starts[value_index]
+
+    # the groups of a varint have disjoint bits, so summing them ors them
+    shifted = (packed & 0x7F).astype(np.uint64) << (7 * group).astype(np.uint64)
+    encoded = np.add.reduceat(shifted, starts)
+    return np.cumsum(_unzigzag(encoded), dtype=np.int64)
+
+
+@dataclass
+class PackedQuote(AvroModel):
+    """
+    PackedQuote is a `BaseQuote` whose level arrays are packed with `pack_levels`.
+
+    The fields and their order are those of `BaseQuote`, only the four level
+    arrays are bytes. For deep books this roughly halves the size of a
+    message, at the cost of a pack and unpack per level array, which suits
+    links where bandwidth is scarcer than CPU, e.g. tcp between hosts.
+
+    Attributes:
+        symbol (str): The symbol of the financial instrument.
+        exchange (str): The exchange where the instrument is traded.
+        vendor_timestamp (datetime.datetime): The timestamp provided by the vendor.
+        timestamp (datetime.datetime): The local timestamp when the quote was received.
+        bid_price (bytes): The packed bid prices.
+        ask_price (bytes): The packed ask prices.
+        price_exponent (int): The exponent used for price scaling.
+        bid_size (bytes): The packed bid sizes.
+        ask_size (bytes): The packed ask sizes.
+        size_exponent (int): The exponent used for size scaling.
+        app_id (int): The application identifier.
+        tick_id (int): The tick identifier.
+        status (int): The quote status.
+        vendor_timestamp_ns (int): The vendor timestamp in nanoseconds since the Unix epoch.
+        timestamp_ns (int): The local timestamp in nanoseconds since the Unix epoch.
+
+    """
+
+    symbol: str
+    exchange: str
+
+    vendor_timestamp: types.DateTimeMicro
+    timestamp: types.DateTimeMicro
+
+    # prices
+    bid_price: bytes
+    ask_price: bytes
+    price_exponent: int
+
+    # sizes
+    bid_size: bytes
+    ask_size: bytes
+    size_exponent: int
+
+    # ids
+    app_id: int
+    tick_id: int
+
+    # quote status
+    status: int
+
+    # nanosecond timestamps
+    vendor_timestamp_ns: int = 0
+    timestamp_ns: int = 0
+
+    @classmethod
+    def from_quote(cls, quote: BaseQuote) -> "PackedQuote":
+        """
+        Pack the level arrays of a quote.
+
+        Args:
+            quote (BaseQuote): The quote to pack.
+
+        Returns:
+            PackedQuote: The packed quote.
+
+        """
+        return cls(
+            symbol=quote.symbol,
+            exchange=quote.exchange,
+            vendor_timestamp=quote.vendor_timestamp,
+            timestamp=quote.timestamp,
+            bid_price=pack_levels(quote.bid_price),
+            ask_price=pack_levels(quote.ask_price),
+            price_exponent=quote.price_exponent,
+            bid_size=pack_levels(quote.bid_size),
+            ask_size=pack_levels(quote.ask_size),
+            size_exponent=quote.size_exponent,
+            app_id=quote.app_id,
+            tick_id=quote.tick_id,
+            status=quote.status,
+            vendor_timestamp_ns=quote.vendor_timestamp_ns,
+            timestamp_ns=quote.timestamp_ns,
+        )
+
+    def to_quote(self) -> BaseQuote:
+        """
+        Unpack the level arrays.
+
+        Returns:
+            BaseQuote: The quote.
+
+        """
+        return BaseQuote(
+            symbol=self.symbol,
+            exchange=self.exchange,
+            vendor_timestamp=self.vendor_timestamp,
+            timestamp=self.timestamp,
+            bid_price=unpack_levels(self.bid_price).tolist(),
+            ask_price=unpack_levels(self.ask_price).tolist(),
+            price_exponent=self.price_exponent,
+            bid_size=unpack_levels(self.bid_size).tolist(),
+            ask_size=unpack_levels(self.ask_size).tolist(),
+            size_exponent=self.size_exponent,
+            app_id=self.app_id,
+            tick_id=self.tick_id,
+            status=QuoteStatus(self.status),
+            vendor_timestamp_ns=self.vendor_timestamp_ns,
+            timestamp_ns=self.timestamp_ns,
+        )
+
+
+class PackedQuoteCodec(AvroCodec[PackedQuote]):
+    """PackedQuoteCodec is the `AvroCodec` of `PackedQuote`."""
+
+    def __init__(self) -> None:
+        super().__init__(PackedQuote)
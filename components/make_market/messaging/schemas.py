@@ -1,12 +1,40 @@
 import datetime
 from dataclasses import dataclass, field
-from typing import Union, type
+from typing import Literal, Union
 
-from dataclasses_avroschema import AvroModel, SerializationType, types
-from make_market.messaging.decimals import float_to_digits_with_precision
-from make_market.messaging.status import QuoteStatus
+from dataclasses_avroschema import AvroModel, types
+from make_market.clock import datetime_to_ns, ns_to_datetime
+from make_market.messaging.binary import BinaryQuoteCodec
+from make_market.messaging.decimals import floats_to_digits_with_precision
+from make_market.messaging.status import QuoteStatus, status_from_top_of_book
 from make_market.ws_server.quote import RawQuoteDict
 
+# "binary" is the fixed layout of `BinaryQuoteCodec`, see make_market.messaging.binary
+QuoteSerializationType = Literal["avro", "avro-json", "binary"]
+
+_binary_codec = BinaryQuoteCodec()
+
+
+def parse_vendor_timestamp(
+    raw_quote_dict: RawQuoteDict,
+) -> tuple[datetime.datetime, int | None]:
+    """
+    Read the timestamp of a raw vendor quote.
+
+    Args:
+        raw_quote_dict (RawQuoteDict): The raw quote, with an ISO `timestamp`
+            or an epoch-nanosecond `timestamp_ns`.
+
+    Returns:
+        tuple[datetime.datetime, int | None]: The timestamp as a datetime and,
+        if the vendor sent one, in nanoseconds since the Unix epoch.
+
+    """
+    if "timestamp_ns" in raw_quote_dict:
+        timestamp_ns = int(raw_quote_dict["timestamp_ns"])
+        return ns_to_datetime(timestamp_ns), timestamp_ns
+    return datetime.datetime.fromisoformat(raw_quote_dict["timestamp"]), None
+
 
 @dataclass
 class RawVendorQuote:
@@ -20,6 +48,8 @@ class RawVendorQuote:
         ask_prices (list[float]): A list of ask prices.
         bid_sizes (list[int]): A list of bid sizes corresponding to the bid prices.
         ask_sizes (list[int]): A list of ask sizes corresponding to the ask prices.
+        timestamp_ns (int | None): The timestamp in nanoseconds since the Unix epoch,
+            if the vendor sent one.
 
     """
 
@@ -35,6 +65,8 @@ class RawVendorQuote:
     ask_size: list[int]
     size_exponent: int
 
+    timestamp_ns: int | None = None
+
     @classmethod
     def from_raw_vendor_dict(
         cls, raw_quote_dict: RawQuoteDict, price_exponent: int, size_exponent: int
@@ -51,26 +83,24 @@ class RawVendorQuote:
             RawVendorQuote: An instance of RawVendorQuote populated with the data from the raw quote dictionary.
 
         """
+        timestamp, timestamp_ns = parse_vendor_timestamp(raw_quote_dict)
         return cls(
-            timestamp=datetime.datetime.fromisoformat(raw_quote_dict["timestamp"]),
-            bid_price=[
-                float_to_digits_with_precision(p, price_exponent)
-                for p in raw_quote_dict["bid_prices"]
-            ],
-            ask_price=[
-                float_to_digits_with_precision(p, price_exponent)
-                for p in raw_quote_dict["ask_prices"]
-            ],
+            timestamp=timestamp,
+            bid_price=floats_to_digits_with_precision(
+                raw_quote_dict["bid_prices"], price_exponent
+            ).tolist(),
+            ask_price=floats_to_digits_with_precision(
+                raw_quote_dict["ask_prices"], price_exponent
+            ).tolist(),
             price_exponent=price_exponent,
-            bid_size=[
-                float_to_digits_with_precision(s, size_exponent)
-                for s in raw_quote_dict["bid_sizes"]
-            ],
-            ask_size=[
-                float_to_digits_with_precision(s, size_exponent)
-                for s in raw_quote_dict["ask_sizes"]
-            ],
+            bid_size=floats_to_digits_with_precision(
+                raw_quote_dict["bid_sizes"], size_exponent
+            ).tolist(),
+            ask_size=floats_to_digits_with_precision(
+                raw_quote_dict["ask_sizes"], size_exponent
+            ).tolist(),
             size_exponent=size_exponent,
+            timestamp_ns=timestamp_ns,
         )
 
 
@@ -92,6 +122,9 @@ class BaseQuote(AvroModel):
         size_exponent (int): The exponent used for size scaling.
         app_id (str): The application identifier.
         tick_id (int): The tick identifier.
+        status (int): The quote status.
+        vendor_timestamp_ns (int): The vendor timestamp in nanoseconds since the Unix epoch.
+        timestamp_ns (int): The local timestamp in nanoseconds since the Unix epoch.
 
     """
 
@@ -118,6 +151,10 @@ class BaseQuote(AvroModel):
     # quote status
     status: int = field(default=QuoteStatus(0))
 
+    # nanosecond timestamps, 0 when the producer did not set them
+    vendor_timestamp_ns: int = 0
+    timestamp_ns: int = 0
+
     @classmethod
     def from_raw_vendor_quote(  # noqa: PLR0913
         cls,
@@ -127,8 +164,16 @@ class BaseQuote(AvroModel):
         timestamp: datetime.datetime,
         app_id: int,
         tick_id: int,
+        timestamp_ns: int | None = None,
     ) -> "BaseQuote":
-        """Create a BaseQuote instance from a RawVendorQuote instance."""
+        """
+        Create a BaseQuote instance from a RawVendorQuote instance.
+
+        The quote status is computed from the top of book, comparing the
+        integer price mantissas exactly. The nanosecond timestamps are taken
+        from `timestamp_ns` and the raw quote when given, and from the
+        datetimes otherwise.
+        """
         return cls(
             symbol=symbol,
             exchange=exchange,
@@ -142,18 +187,37 @@ class BaseQuote(AvroModel):
             size_exponent=raw_quote.size_exponent,
             app_id=app_id,
             tick_id=tick_id,
+            status=status_from_top_of_book(
+                raw_quote.bid_price[0] if raw_quote.bid_price else None,
+                raw_quote.ask_price[0] if raw_quote.ask_price else None,
+            ),
+            vendor_timestamp_ns=datetime_to_ns(raw_quote.timestamp)
+            if raw_quote.timestamp_ns is None
+            else raw_quote.timestamp_ns,
+            timestamp_ns=datetime_to_ns(timestamp)
+            if timestamp_ns is None
+            else timestamp_ns,
         )
 
+    def serialize(self, serialization_type: QuoteSerializationType = "avro") -> bytes:
+        """Overrides AvroModel serialize method to add the binary layout."""
+        if serialization_type == "binary":
+            return _binary_codec.encode(self)
+        return super().serialize(serialization_type)
+
     @classmethod
     def deserialize(
         cls: type["AvroModel"],
         data: bytes,
-        serialization_type: SerializationType = "avro",
+        serialization_type: QuoteSerializationType = "avro",
         create_instance: bool = True,  # noqa: FBT001, FBT002
         writer_schema: types.JsonDict | type["AvroModel"] | None = None,
     ) -> Union[types.JsonDict, "AvroModel"]:
-        """Overrides AvroModel deserialize method to handle QuoteStatus."""
-        payload = cls.deserialize_to_python(data, serialization_type, writer_schema)
+        """Overrides AvroModel deserialize method to handle QuoteStatus and the binary layout."""
+        if serialization_type == "binary":
+            payload = _binary_codec.decode_fields(data)
+        else:
+            payload = cls.deserialize_to_python(data, serialization_type, writer_schema)
 
         # initalize status as QuoteStatus
         payload["status"] = QuoteStatus(payload["status"])
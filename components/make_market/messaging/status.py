@@ -1,5 +1,8 @@
 from enum import KEEP, IntFlag, auto
 
+import numpy as np
+import numpy.typing as npt
+
 
 class QuoteStatus(IntFlag, boundary=KEEP):
     """
@@ -7,11 +10,87 @@ class QuoteStatus(IntFlag, boundary=KEEP):
 
     Attributes:
         MARKET_CLOSED: Indicates that the market is closed.
-        CROSSED_PRICE: Indicates that the price has crossed a certain threshold.
+        CROSSED_PRICE: Indicates that the top bid is above the top ask.
         EMPTY_ORDERBOOK: Indicates that the order book is empty.
+        LOCKED_PRICE: Indicates that the top bid equals the top ask.
+        ONE_SIDED: Indicates that only one side of the order book has levels.
 
     """
 
     MARKET_CLOSED = auto()
     CROSSED_PRICE = auto()
     EMPTY_ORDERBOOK = auto()
+    LOCKED_PRICE = auto()
+    ONE_SIDED = auto()
+
+
+def status_from_top_of_book(
+    top_bid: float | None, top_ask: float | None
+) -> QuoteStatus:
+    """
+    Compute the book status flags of a quote from its top of book.
+
+    Prices are compared as given, so passing integer mantissas makes the
+    crossed and locked checks exact.
+
+    Args:
+        top_bid (float | None): The top bid price, or None if there are no bids.
+        top_ask (float | None): The top ask price, or None if there are no asks.
+
+    Returns:
+        QuoteStatus: EMPTY_ORDERBOOK or ONE_SIDED if a side is missing, otherwise
+        CROSSED_PRICE or LOCKED_PRICE if applicable, else no flags.
+
+    """
+    if top_bid is None:
+        return QuoteStatus.EMPTY_ORDERBOOK if top_ask is None else QuoteStatus.ONE_SIDED
+    if top_ask is None:
+        return QuoteStatus.ONE_SIDED
+    if top_bid > top_ask:
+        return QuoteStatus.CROSSED_PRICE
+    if top_bid == top_ask:
+        return QuoteStatus.LOCKED_PRICE
+    return QuoteStatus(0)
+
+
+def status_from_top_of_book_arrays(
+    top_bids: npt.ArrayLike,
+    top_asks: npt.ArrayLike,
+    has_bids: npt.ArrayLike | None = None,
+    has_asks: npt.ArrayLike | None = None,
+) -> npt.NDArray[np.int64]:
+    """
+    Compute the book status flags of many quotes with vectorized comparisons.
+
+    This is the batch counterpart of `status_from_top_of_book`. A side is
+    missing where its mask is False or, when no mask is given, where its
+    price is NaN.
+
+    Args:
+        top_bids (npt.ArrayLike): The top bid price of each quote.
+        top_asks (npt.ArrayLike): The top ask price of each quote.
+        has_bids (npt.ArrayLike | None, optional): Whether each quote has bids.
+        has_asks (npt.ArrayLike | None, optional): Whether each quote has asks.
+
+    Returns:
+        npt.NDArray[np.int64]: The `QuoteStatus` value of each quote.
+
+    """
+    top_bids = np.asarray(top_bids)
+    top_asks = np.asarray(top_asks)
+    has_bids = ~_isnan(top_bids) if has_bids is None else np.asarray(has_bids, bool)
+    has_asks = ~_isnan(top_asks) if has_asks is None else np.asarray(has_asks, bool)
+
+    both = has_bids & has_asks
+    status = np.zeros(np.broadcast(top_bids, top_asks).shape, dtype=np.int64)
+    status[~(has_bids | has_asks)] |= QuoteStatus.EMPTY_ORDERBOOK
+    status[has_bids ^ has_asks] |= QuoteStatus.ONE_SIDED
+    status[both & (top_bids > top_asks)] |= QuoteStatus.CROSSED_PRICE
+    status[both & (top_bids == top_asks)] |= QuoteStatus.LOCKED_PRICE
+    return status
+
+
+def _isnan(values: np.ndarray) -> npt.NDArray[np.bool_]:
+    if np.issubdtype(values.dtype, np.floating):
+        return np.isnan(values)
+    return np.zeros(values.shape, dtype=bool)
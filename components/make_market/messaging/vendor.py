@@ -0,0 +1,67 @@
+import json
+
+from make_market.messaging.decimals import decimal_text_to_digits
+from make_market.messaging.schemas import RawVendorQuote, parse_vendor_timestamp
+from make_market.ws_server.quote import RawQuoteDict
+
+
+def _digits(texts: list[float] | list[str], exponent: int) -> list[int]:
+    # the parsed frames only hold texts, str() keeps them as they are
+    return [decimal_text_to_digits(str(text), exponent) for text in texts]
+
+
+def _reject_constant(constant: str) -> None:
+    msg = f"not a decimal number: {constant!r}"
+    raise ValueError(msg)
+
+
+def _raw_vendor_quote(
+    quote: RawQuoteDict, price_exponent: int, size_exponent: int
+) -> RawVendorQuote:
+    timestamp, timestamp_ns = parse_vendor_timestamp(quote)
+    return RawVendorQuote(
+        timestamp=timestamp,
+        bid_price=_digits(quote["bid_prices"], price_exponent),
+        ask_price=_digits(quote["ask_prices"], price_exponent),
+        price_exponent=price_exponent,
+        bid_size=_digits(quote["bid_sizes"], size_exponent),
+        ask_size=_digits(quote["ask_sizes"], size_exponent),
+        size_exponent=size_exponent,
+        timestamp_ns=timestamp_ns,
+    )
+
+
+def parse_vendor_message(
+    data: str | bytes, price_exponent: int, size_exponent: int
+) -> tuple[str | None, dict[str, RawVendorQuote]]:
+    """
+    Parse a vendor websocket message straight to integer mantissas.
+
+    The whole message, all symbols at once, goes through one pass of the C
+    JSON scanner with number hooks that keep each number as its decimal
+    text, so no price or size is ever a float. The texts are then converted
+    to mantissas at the given exponents with exact half-even rounding.
+
+    Args:
+        data (str | bytes): The raw websocket frame.
+        price_exponent (int): The exponent to use for price precision.
+        size_exponent (int): The exponent to use for size precision.
+
+    Returns:
+        tuple[str | None, dict[str, RawVendorQuote]]: The vendor's status
+        message, if any, and the raw quote of each symbol in the message.
+
+    Raises:
+        json.JSONDecodeError: If the frame is not valid JSON.
+        ValueError: If a price or size is not a decimal number, e.g. `NaN`
+            or `Infinity`.
+
+    """
+    payload = json.loads(
+        data, parse_float=str, parse_int=str, parse_constant=_reject_constant
+    )
+    message = payload.pop("message", None)
+    return message, {
+        symbol: _raw_vendor_quote(quote, price_exponent, size_exponent)
+        for symbol, quote in payload.items()
+    }
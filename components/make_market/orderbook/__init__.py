@@ -1,3 +1,31 @@
+from make_market.orderbook import analytics
+from make_market.orderbook.arrays import ArrayOrderBook
+from make_market.orderbook.batch import BookBlock, random_book_block
+from make_market.orderbook.consolidated import ConsolidatedOrderBook
 from make_market.orderbook.core import OrderBook, OrderBookDict
+from make_market.orderbook.incremental import (
+    BookSide,
+    IncrementalOrderBook,
+    LevelDelta,
+    Side,
+)
+from make_market.orderbook.l3 import L3OrderBook, Order
+from make_market.orderbook.ticks import QuoteLevelsDict, TickOrderBook
 
-__all__ = ["OrderBook", "OrderBookDict"]
+__all__ = [
+    "ArrayOrderBook",
+    "BookBlock",
+    "BookSide",
+    "ConsolidatedOrderBook",
+    "IncrementalOrderBook",
+    "L3OrderBook",
+    "LevelDelta",
+    "Order",
+    "OrderBook",
+    "OrderBookDict",
+    "QuoteLevelsDict",
+    "Side",
+    "TickOrderBook",
+    "analytics",
+    "random_book_block",
+]
@@ -0,0 +1,191 @@
+from typing import Protocol
+
+import numpy as np
+import numpy.typing as npt
+from make_market.orderbook.incremental import Side
+
+FloatArray = npt.NDArray[np.float64]
+
+
+class BookLike(Protocol):
+    """
+    BookLike is anything holding best-level-first ask and bid levels.
+
+    The analytics functions accept a single book (`OrderBook`, `ArrayOrderBook`)
+    and return Python floats, or a `BookBlock` of many books stacked into 2-D
+    arrays and return one float64 value per book. Undefined values, e.g. the
+    microprice of a one-sided book, are NaN. Books of different depth can be
+    stacked into one block by padding the missing levels with a size of 0.
+    """
+
+    ask_prices: npt.ArrayLike
+    ask_sizes: npt.ArrayLike
+    bid_prices: npt.ArrayLike
+    bid_sizes: npt.ArrayLike
+
+
+def _as_batch(values: npt.ArrayLike) -> FloatArray:
+    return np.atleast_2d(np.asarray(values, dtype=np.float64))
+
+
+def _side_levels(book: BookLike, side: Side) -> tuple[FloatArray, FloatArray]:
+    # plain strings are accepted like their Side member, others raise
+    if Side(side) is Side.ASK:
+        return _as_batch(book.ask_prices), _as_batch(book.ask_sizes)
+    return _as_batch(book.bid_prices), _as_batch(book.bid_sizes)
+
+
+def _is_batch(book: BookLike) -> bool:
+    return np.ndim(book.ask_prices) == 2
+
+
+def _result(book: BookLike, values: FloatArray) -> float | FloatArray:
+    return values if _is_batch(book) else float(values[0])
+
+
+def _top(prices: FloatArray, sizes: FloatArray) -> tuple[FloatArray, FloatArray]:
+    if prices.shape[1] == 0:
+        missing = np.full(prices.shape[0], np.nan)
+        return missing, missing
+    return prices[:, 0], sizes[:, 0]
+
+
+def mid_prices(book: BookLike) -> float | FloatArray:
+    """
+    Calculate the mid-price of each book.
+
+    Args:
+        book (BookLike): A single book or a block of books.
+
+    Returns:
+        float | FloatArray: The average of the top ask and top bid prices.
+
+    """
+    ask, _ = _top(*_side_levels(book, Side.ASK))
+    bid, _ = _top(*_side_levels(book, Side.BID))
+    return _result(book, (ask + bid) / 2)
+
+
+def microprice(book: BookLike) -> float | FloatArray:
+    """
+    Calculate the size-weighted microprice of each book.
+
+    The microprice weights each top-level price by the size on the opposite
+    side: `(ask * bid_size + bid * ask_size) / (ask_size + bid_size)`. It leans
+    towards the side that is more likely to be taken out next.
+
+    Args:
+        book (BookLike): A single book or a block of books.
+
+    Returns:
+        float | FloatArray: The microprice of each book.
+
+    """
+    ask, ask_size = _top(*_side_levels(book, Side.ASK))
+    bid, bid_size = _top(*_side_levels(book, Side.BID))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = (ask * bid_size + bid * ask_size) / (ask_size + bid_size)
+    return _result(book, values)
+
+
+def imbalance(book: BookLike, depth: int = 1) -> float | FloatArray:
+    """
+    Calculate the book imbalance over the top `depth` levels.
+
+    The imbalance is `(bid_depth - ask_depth) / (bid_depth + ask_depth)` and
+    ranges from -1 (only asks) to 1 (only bids).
+
+    Args:
+        book (BookLike): A single book or a block of books.
+        depth (int, optional): The number of levels per side to include. Defaults to 1.
+
+    Returns:
+        float | FloatArray: The imbalance of each book.
+
+    """
+    _, ask_sizes = _side_levels(book, Side.ASK)
+    _, bid_sizes = _side_levels(book, Side.BID)
+    ask_depth = ask_sizes[:, :depth].sum(axis=1)
+    bid_depth = bid_sizes[:, :depth].sum(axis=1)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        values = (bid_depth - ask_depth) / (bid_depth + ask_depth)
+    return _result(book, values)
+
+
+def cumulative_depth(book: BookLike, side: Side) -> FloatArray:
+    """
+    Calculate the cumulative size available up to each level of one side.
+
+    Args:
+        book (BookLike): A single book or a block of books.
+        side (Side): The side of the book.
+
+    Returns:
+        FloatArray: The running sum of sizes, with the shape of the side's sizes.
+
+    """
+    _, sizes = _side_levels(book, side)
+    depth = np.cumsum(sizes, axis=1)
+    return depth if _is_batch(book) else depth[0]
+
+
+def price_for_size(book: BookLike, side: Side, quantity: float) -> float | FloatArray:
+    """
+    Calculate the average price of sweeping `quantity` through one side.
+
+    Levels are consumed best first, the last level only partially. Buying
+    sweeps the ask side, selling sweeps the bid side.
+
+    Args:
+        book (BookLike): A single book or a block of books.
+        side (Side): The side of the book to sweep.
+        quantity (float): The size to fill, must be positive.
+
+    Returns:
+        float | FloatArray: The volume-weighted average fill price of each book,
+        or NaN where the side does not hold `quantity`.
+
+    Raises:
+        ValueError: If `quantity` is not positive.
+
+    """
+    if not quantity > 0:
+        msg = f"quantity must be positive, got {quantity}"
+        raise ValueError(msg)
+
+    prices, sizes = _side_levels(book, side)
+    depth = np.cumsum(sizes, axis=1)
+
+    # size taken from each level: what is left of the quantity, capped by the level
+    filled = np.clip(quantity - (depth - sizes), 0.0, sizes)
+    notional = np.where(filled > 0, filled * prices, 0.0).sum(axis=1)
+
+    available = depth[:, -1] if depth.shape[1] else np.zeros(depth.shape[0])
+    values = np.where(available >= quantity, notional / quantity, np.nan)
+    return _result(book, values)
+
+
+def depth_within_ticks(
+    book: BookLike, side: Side, n_ticks: int, tick_size: float
+) -> float | FloatArray:
+    """
+    Calculate the size resting within `n_ticks` ticks of the mid-price on one side.
+
+    Args:
+        book (BookLike): A single book or a block of books.
+        side (Side): The side of the book.
+        n_ticks (int): The distance from the mid-price, in ticks.
+        tick_size (float): The price increment of one tick.
+
+    Returns:
+        float | FloatArray: The total size within the distance, NaN where the
+        mid-price is undefined.
+
+    """
+    prices, sizes = _side_levels(book, side)
+    mid = np.atleast_1d(mid_prices(book))[:, np.newaxis]
+    # a small tolerance keeps levels exactly n_ticks away despite float error
+    within = np.abs(prices - mid) / tick_size <= n_ticks + 1e-9
+    values = np.where(within, sizes, 0.0).sum(axis=1)
+    values[np.isnan(mid[:, 0])] = np.nan
+    return _result(book, values)
@@ -0,0 +1,359 @@
+from dataclasses import dataclass, field
+from typing import Self
+
+import numpy as np
+import numpy.typing as npt
+from make_market.orderbook.core import OrderBook, OrderBookDict
+
+FloatArray = npt.NDArray[np.float64]
+
+
+def _as_levels(values: npt.ArrayLike) -> FloatArray:
+    """Return `values` as a contiguous, one-dimensional float64 array."""
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1)
+
+
+def validate_levels(
+    ask_prices: np.ndarray,
+    ask_sizes: np.ndarray,
+    bid_prices: np.ndarray,
+    bid_sizes: np.ndarray,
+) -> None:
+    """
+    Validate order book level arrays in a single O(n) pass per side.
+
+    The monotonicity check compares each level with its neighbour instead of
+    building sorted copies, and accepts exactly the books `OrderBook.validate`
+    accepts.
+
+    Args:
+        ask_prices (np.ndarray): Ask prices, best level first.
+        ask_sizes (np.ndarray): Ask sizes matching `ask_prices`.
+        bid_prices (np.ndarray): Bid prices, best level first.
+        bid_sizes (np.ndarray): Bid sizes matching `bid_prices`.
+
+    Raises:
+        ValueError: If prices and sizes of a side are not of the same length,
+                    or if ask_prices are not increasing or bid_prices are not
+                    decreasing.
+
+    """
+    if ask_prices.shape != ask_sizes.shape:
+        msg = "ask_prices and ask_sizes must be of the same length"
+        raise ValueError(msg)
+    if bid_prices.shape != bid_sizes.shape:
+        msg = "bid_prices and bid_sizes must be of the same length"
+        raise ValueError(msg)
+
+    if np.any(ask_prices[1:] < ask_prices[:-1]):
+        msg = "ask_prices must be in strictly increasing order"
+        raise ValueError(msg)
+
+    if np.any(bid_prices[1:] > bid_prices[:-1]):
+        msg = "bid_prices must be in strictly decreasing order"
+        raise ValueError(msg)
+
+
+@dataclass(eq=False)
+class ArrayOrderBook:
+    """
+    ArrayOrderBook is an OrderBook variant backed by contiguous NumPy arrays.
+
+    It exposes the same public API as `OrderBook`, so code building or reading
+    books can switch between the two without changes. Books that are already
+    known to be valid can be created with `from_arrays(..., validate=False)`,
+    which skips both the conversion and the validation.
+
+    Attributes:
+        ask_prices (FloatArray): A float64 array of prices for the ask orders.
+        ask_sizes (FloatArray): A float64 array of sizes for the ask orders.
+        bid_prices (FloatArray): A float64 array of prices for the bid orders.
+        bid_sizes (FloatArray): A float64 array of sizes for the bid orders.
+
+    """
+
+    ask_prices: FloatArray = field(default_factory=lambda: np.empty(0))
+    ask_sizes: FloatArray = field(default_factory=lambda: np.empty(0))
+    bid_prices: FloatArray = field(default_factory=lambda: np.empty(0))
+    bid_sizes: FloatArray = field(default_factory=lambda: np.empty(0))
+
+    def __post_init__(self) -> None:
+        self.ask_prices = _as_levels(self.ask_prices)
+        self.ask_sizes = _as_levels(self.ask_sizes)
+        self.bid_prices = _as_levels(self.bid_prices)
+        self.bid_sizes = _as_levels(self.bid_sizes)
+        self.validate()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ArrayOrderBook):
+            return NotImplemented
+        return (
+            np.array_equal(self.ask_prices, other.ask_prices)
+            and np.array_equal(self.ask_sizes, other.ask_sizes)
+            and np.array_equal(self.bid_prices, other.bid_prices)
+            and np.array_equal(self.bid_sizes, other.bid_sizes)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def validate(self) -> None:
+        """
+        Validate the order book to ensure that prices and sizes are consistent.
+
+        Raises:
+            ValueError: If ask_prices and ask_sizes or bid_prices and bid_sizes
+                        are not of the same length, or if ask_prices are not in
+                        strictly increasing order, or if bid_prices are not in
+                        strictly decreasing order.
+
+        """
+        validate_levels(
+            self.ask_prices, self.ask_sizes, self.bid_prices, self.bid_sizes
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ask_prices: FloatArray,
+        ask_sizes: FloatArray,
+        bid_prices: FloatArray,
+        bid_sizes: FloatArray,
+        *,
+        validate: bool = True,
+    ) -> Self:
+        """
+        Create an order book from level arrays.
+
+        With `validate=False` the arrays are stored as-is: they must already be
+        one-dimensional float64 arrays forming a valid book. This is the
+        trusted construction path for books rebuilt from validated state.
+
+        Args:
+            ask_prices (FloatArray): Ask prices, best level first.
+            ask_sizes (FloatArray): Ask sizes matching `ask_prices`.
+            bid_prices (FloatArray): Bid prices, best level first.
+            bid_sizes (FloatArray): Bid sizes matching `bid_prices`.
+            validate (bool, optional): Whether to convert and validate the
+                arrays. Defaults to True.
+
+        Returns:
+            Self: An instance of ArrayOrderBook wrapping the arrays.
+
+        """
+        if validate:
+            return cls(ask_prices, ask_sizes, bid_prices, bid_sizes)
+
+        book = cls.__new__(cls)
+        book.ask_prices = ask_prices
+        book.ask_sizes = ask_sizes
+        book.bid_prices = bid_prices
+        book.bid_sizes = bid_sizes
+        return book
+
+    def is_empty(self) -> bool:
+        """
+        Check if the order book is empty.
+
+        Returns:
+            bool: True if both ask_prices and bid_prices are empty, False otherwise.
+
+        """
+        return not (self.ask_prices.size or self.bid_prices.size)
+
+    @classmethod
+    def random_from_midprice_and_spread(
+        cls,
+        midprice: float,
+        spread: float,
+        n_ask_levels: int = 10,
+        n_bid_levels: int = 10,
+        rng: np.random.Generator | None = None,
+    ) -> Self:
+        """
+        Create a random order book given a midprice and spread.
+
+        Args:
+            midprice (float): The midprice around which the order book is centered.
+            spread (float): The spread between the ask and bid prices.
+            n_ask_levels (int, optional): The number of ask levels. Defaults to 10.
+            n_bid_levels (int, optional): The number of bid levels. Defaults to 10.
+            rng (np.random.Generator | None, optional): The random generator to
+                draw from. Defaults to a freshly seeded generator.
+
+        Returns:
+            ArrayOrderBook: An instance of ArrayOrderBook with random prices and sizes.
+
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        spread_variation = spread * 0.1  # 10% variation in spread
+
+        ask_steps = np.arange(1, n_ask_levels + 1) * spread
+        bid_steps = np.arange(1, n_bid_levels + 1) * spread
+
+        ask_prices = midprice + ask_steps
+        ask_prices += rng.uniform(-spread_variation, spread_variation, n_ask_levels)
+        bid_prices = midprice - bid_steps
+        bid_prices += rng.uniform(-spread_variation, spread_variation, n_bid_levels)
+
+        return cls(
+            ask_prices,
+            rng.uniform(5.0, 15.0, n_ask_levels),
+            bid_prices,
+            rng.uniform(5.0, 15.0, n_bid_levels),
+        )
+
+    @classmethod
+    def random_from_bid_ask_prices(
+        cls,
+        bid_price: float,
+        ask_price: float,
+        n_ask_levels: int = 10,
+        n_bid_levels: int = 10,
+        rng: np.random.Generator | None = None,
+    ) -> Self:
+        """
+        Create a random order book given a bid price and an ask price.
+
+        Args:
+            bid_price (float): The top bid price.
+            ask_price (float): The top ask price.
+            n_ask_levels (int, optional): The number of ask levels. Defaults to 10.
+            n_bid_levels (int, optional): The number of bid levels. Defaults to 10.
+            rng (np.random.Generator | None, optional): The random generator to
+                draw from. Defaults to a freshly seeded generator.
+
+        Returns:
+            ArrayOrderBook: An instance of ArrayOrderBook with random prices and sizes.
+
+        """
+        midprice = (bid_price + ask_price) / 2
+        spread = ask_price - bid_price
+        return cls.random_from_midprice_and_spread(
+            midprice, spread, n_ask_levels, n_bid_levels, rng
+        )
+
+    @property
+    def top_level_prices(self) -> tuple[float | None, float | None]:
+        """
+        Get the top level ask and bid prices.
+
+        Returns:
+            tuple[float | None, float | None]: The top ask price and top bid price, or None if empty.
+
+        """
+        top_ask = float(self.ask_prices[0]) if self.ask_prices.size else None
+        top_bid = float(self.bid_prices[0]) if self.bid_prices.size else None
+        return top_ask, top_bid
+
+    @property
+    def top_level_spread(self) -> float | None:
+        """
+        Calculate the top-level spread of the order book.
+
+        Returns:
+            float | None: The top-level spread if both top ask and top bid prices
+            are available, otherwise None.
+
+        """
+        top_ask, top_bid = self.top_level_prices
+        if top_ask is None or top_bid is None:
+            return None
+        return top_ask - top_bid
+
+    @property
+    def mid_price(self) -> float | None:
+        """
+        Calculate the mid-price of the order book.
+
+        Returns:
+            float | None: The mid-price if both top ask and top bid prices are available,
+                          otherwise None.
+
+        """
+        top_ask, top_bid = self.top_level_prices
+        if top_ask is None or top_bid is None:
+            return None
+        return (top_ask + top_bid) / 2
+
+    @property
+    def n_levels(self) -> tuple[int, int]:
+        """
+        Returns the number of levels in the order book for both ask and bid prices.
+
+        Returns:
+            tuple[int, int]: A tuple containing the number of ask price levels and bid price levels.
+
+        """
+        return self.ask_prices.size, self.bid_prices.size
+
+    def to_dict(self) -> OrderBookDict:
+        """
+        Converts the order book data to a dictionary format.
+
+        The arrays are converted to plain lists, so the result can be passed to
+        `json.dumps` just like `OrderBook.to_dict()`.
+
+        Returns:
+            OrderBookDict: A dictionary containing the order book data.
+
+        """
+        return OrderBookDict(
+            ask_prices=self.ask_prices.tolist(),
+            ask_sizes=self.ask_sizes.tolist(),
+            bid_prices=self.bid_prices.tolist(),
+            bid_sizes=self.bid_sizes.tolist(),
+        )
+
+    @classmethod
+    def from_dict(cls, data: OrderBookDict) -> Self:
+        """
+        Create an instance of the class from a dictionary.
+
+        Args:
+            data (OrderBookDict): A dictionary containing the data to initialize the class instance.
+
+        Returns:
+            Self: An instance of the class initialized with the provided data.
+
+        """
+        return cls(
+            ask_prices=_as_levels(data["ask_prices"]),
+            ask_sizes=_as_levels(data["ask_sizes"]),
+            bid_prices=_as_levels(data["bid_prices"]),
+            bid_sizes=_as_levels(data["bid_sizes"]),
+        )
+
+    def to_orderbook(self) -> OrderBook:
+        """
+        Convert the array-backed book to a list-backed `OrderBook`.
+
+        Returns:
+            OrderBook: An equivalent list-backed order book.
+
+        """
+        return OrderBook.from_dict(self.to_dict())
+
+    @classmethod
+    def from_orderbook(cls, orderbook: OrderBook) -> Self:
+        """
+        Create an array-backed book from a list-backed `OrderBook`.
+
+        The book is validated again, since an `OrderBook` may have been
+        changed after it was built.
+
+        Args:
+            orderbook (OrderBook): The order book to convert.
+
+        Returns:
+            Self: An equivalent array-backed order book.
+
+        Raises:
+            ValueError: If the order book is not a valid order book.
+
+        """
+        return cls.from_arrays(
+            _as_levels(orderbook.ask_prices),
+            _as_levels(orderbook.ask_sizes),
+            _as_levels(orderbook.bid_prices),
+            _as_levels(orderbook.bid_sizes),
+        )
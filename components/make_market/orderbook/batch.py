@@ -0,0 +1,125 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+from make_market.orderbook.arrays import ArrayOrderBook, FloatArray
+from make_market.orderbook.core import OrderBookDict
+
+
+@dataclass(frozen=True)
+class BookBlock:
+    """
+    BookBlock is a columnar block of order books with the same depth.
+
+    Each attribute is a 2-D float64 array with one row per book and one column
+    per level, best level first. Rows can be read back as `ArrayOrderBook`
+    views or as `OrderBookDict` records.
+
+    Attributes:
+        ask_prices (FloatArray): Ask prices, shape (n_books, n_ask_levels).
+        ask_sizes (FloatArray): Ask sizes, shape (n_books, n_ask_levels).
+        bid_prices (FloatArray): Bid prices, shape (n_books, n_bid_levels).
+        bid_sizes (FloatArray): Bid sizes, shape (n_books, n_bid_levels).
+
+    """
+
+    ask_prices: FloatArray
+    ask_sizes: FloatArray
+    bid_prices: FloatArray
+    bid_sizes: FloatArray
+
+    def __len__(self) -> int:
+        return self.ask_prices.shape[0]
+
+    def __getitem__(self, index: int) -> ArrayOrderBook:
+        return ArrayOrderBook.from_arrays(
+            self.ask_prices[index],
+            self.ask_sizes[index],
+            self.bid_prices[index],
+            self.bid_sizes[index],
+            validate=False,
+        )
+
+    def __iter__(self) -> Iterator[ArrayOrderBook]:
+        return (self[i] for i in range(len(self)))
+
+    def to_dicts(self) -> list[OrderBookDict]:
+        """
+        Convert every book in the block to an `OrderBookDict`.
+
+        Each array is converted to nested lists once for the whole block,
+        which is much cheaper than converting book by book.
+
+        Returns:
+            list[OrderBookDict]: One dictionary per book, in row order.
+
+        """
+        return [
+            OrderBookDict(
+                ask_prices=ask_prices,
+                ask_sizes=ask_sizes,
+                bid_prices=bid_prices,
+                bid_sizes=bid_sizes,
+            )
+            for ask_prices, ask_sizes, bid_prices, bid_sizes in zip(
+                self.ask_prices.tolist(),
+                self.ask_sizes.tolist(),
+                self.bid_prices.tolist(),
+                self.bid_sizes.tolist(),
+                strict=True,
+            )
+        ]
+
+
+def random_book_block(
+    midprices: npt.ArrayLike,
+    spreads: npt.ArrayLike,
+    n_ask_levels: int = 10,
+    n_bid_levels: int = 10,
+    *,
+    rng: np.random.Generator | None = None,
+) -> BookBlock:
+    """
+    Create random order books for many symbols in one vectorized call.
+
+    This is the batch counterpart of `OrderBook.random_from_midprice_and_spread`
+    and draws from the same distributions.
+
+    Args:
+        midprices (npt.ArrayLike): The midprice of each book.
+        spreads (npt.ArrayLike): The spread of each book, same length as `midprices`.
+        n_ask_levels (int, optional): The number of ask levels. Defaults to 10.
+        n_bid_levels (int, optional): The number of bid levels. Defaults to 10.
+        rng (np.random.Generator | None, optional): The random generator to
+            draw from. Defaults to a freshly seeded generator.
+
+    Returns:
+        BookBlock: A block with one book per midprice.
+
+    Raises:
+        ValueError: If `midprices` and `spreads` do not have the same length.
+
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    midprices = np.asarray(midprices, dtype=np.float64).reshape(-1, 1)
+    spreads = np.asarray(spreads, dtype=np.float64).reshape(-1, 1)
+    if midprices.shape != spreads.shape:
+        msg = "midprices and spreads must be of the same length"
+        raise ValueError(msg)
+
+    n_books = midprices.shape[0]
+    spread_variation = spreads * 0.1  # 10% variation in spread
+
+    ask_noise = rng.uniform(-1.0, 1.0, (n_books, n_ask_levels)) * spread_variation
+    bid_noise = rng.uniform(-1.0, 1.0, (n_books, n_bid_levels)) * spread_variation
+
+    ask_prices = midprices + np.arange(1, n_ask_levels + 1) * spreads + ask_noise
+    bid_prices = midprices - np.arange(1, n_bid_levels + 1) * spreads + bid_noise
+
+    return BookBlock(
+        ask_prices=ask_prices,
+        ask_sizes=rng.uniform(5.0, 15.0, (n_books, n_ask_levels)),
+        bid_prices=bid_prices,
+        bid_sizes=rng.uniform(5.0, 15.0, (n_books, n_bid_levels)),
+    )
@@ -0,0 +1,252 @@
+from collections.abc import Iterable
+
+from make_market.orderbook.arrays import ArrayOrderBook
+from make_market.orderbook.core import OrderBook, OrderBookDict
+from make_market.orderbook.incremental import (
+    BookSide,
+    IncrementalOrderBook,
+    LevelDelta,
+    Side,
+)
+
+
+class _ConsolidatedSide:
+    """
+    One side of the consolidated ladder with per-venue size attribution.
+
+    The ladder itself is a `BookSide` of total sizes, `venues` maps each level
+    key to the size every venue contributes to it.
+    """
+
+    __slots__ = ("levels", "venues")
+
+    def __init__(self, side: Side) -> None:
+        self.levels = BookSide(side)
+        self.venues: dict[float, dict[str, float]] = {}
+
+    def patch(self, venue: str, price: float, size: float) -> None:
+        key = self.levels.sign * price
+        venue_sizes = self.venues.setdefault(key, {})
+        if size:
+            venue_sizes[venue] = size
+        else:
+            venue_sizes.pop(venue, None)
+
+        if venue_sizes:
+            # re-summing the few venues at a level avoids float drift in totals
+            self.levels.set(price, sum(venue_sizes.values()))
+        else:
+            del self.venues[key]
+            self.levels.discard(price)
+
+    def venue_sizes(self, price: float) -> dict[str, float]:
+        return dict(self.venues.get(self.levels.sign * price, {}))
+
+
+def _side_levels(data: OrderBookDict, side: Side) -> tuple[list[float], list[float]]:
+    if side is Side.ASK:
+        return data["ask_prices"], data["ask_sizes"]
+    return data["bid_prices"], data["bid_sizes"]
+
+
+def _level_map(data: OrderBookDict, side: Side) -> dict[float, float]:
+    prices, sizes = _side_levels(data, side)
+    levels = dict(zip(prices, sizes, strict=True))
+    if len(levels) != len(prices):
+        msg = f"{side}_prices must not contain duplicate prices"
+        raise ValueError(msg)
+    return levels
+
+
+def _diff_side(
+    side: Side, old: dict[float, float], new: dict[float, float]
+) -> list[LevelDelta]:
+    deltas = [
+        LevelDelta(side, price, size)
+        for price, size in new.items()
+        if old.get(price) != size
+    ]
+    deltas.extend(LevelDelta(side, price, 0.0) for price in old if price not in new)
+    return deltas
+
+
+class ConsolidatedOrderBook:
+    """
+    ConsolidatedOrderBook aggregates the order books of several venues.
+
+    It keeps the latest book of every venue and a consolidated price ladder in
+    which each level holds the total size across venues, along with the size
+    each venue contributes. When a venue updates, only the levels that changed
+    on that venue are patched in the consolidated ladder, the other venues are
+    not re-merged.
+
+    """
+
+    def __init__(self) -> None:
+        self._venues: dict[str, IncrementalOrderBook] = {}
+        self._asks = _ConsolidatedSide(Side.ASK)
+        self._bids = _ConsolidatedSide(Side.BID)
+
+    def _side(self, side: Side) -> _ConsolidatedSide:
+        # plain strings are accepted like their Side member, others raise
+        return self._asks if Side(side) is Side.ASK else self._bids
+
+    @property
+    def venues(self) -> list[str]:
+        """
+        Get the venues currently contributing to the book.
+
+        Returns:
+            list[str]: The venue names, in the order they were first seen.
+
+        """
+        return list(self._venues)
+
+    def apply_venue_deltas(self, venue: str, deltas: Iterable[LevelDelta]) -> None:
+        """
+        Apply level deltas published by one venue.
+
+        The deltas are applied atomically to the venue's book, then patched
+        into the consolidated ladder.
+
+        Args:
+            venue (str): The venue publishing the deltas, e.g. `BaseQuote.exchange`.
+            deltas (Iterable[LevelDelta]): The level updates to apply.
+
+        Raises:
+            ValueError: If any delta has an invalid side, a non-finite price or a
+                        negative size.
+
+        """
+        deltas = list(deltas)
+        self._venues.setdefault(venue, IncrementalOrderBook()).apply_deltas(deltas)
+        for delta in deltas:
+            self._side(delta.side).patch(venue, delta.price, delta.size)
+
+    def update_venue(self, venue: str, orderbook: OrderBook | ArrayOrderBook) -> None:
+        """
+        Replace the book of one venue with a full snapshot.
+
+        The snapshot is diffed against the venue's previous book and only the
+        changed levels are patched into the consolidated ladder.
+
+        Args:
+            venue (str): The venue publishing the snapshot, e.g. `BaseQuote.exchange`.
+            orderbook (OrderBook | ArrayOrderBook): The venue's new book.
+
+        Raises:
+            ValueError: If a side of the snapshot lists the same price twice, or
+                        has a non-finite price or a negative size.
+
+        """
+        old = self._venues[venue].to_dict() if venue in self._venues else None
+        new = orderbook.to_dict()
+
+        deltas: list[LevelDelta] = []
+        for side in Side:
+            old_levels = _level_map(old, side) if old is not None else {}
+            deltas.extend(_diff_side(side, old_levels, _level_map(new, side)))
+
+        self.apply_venue_deltas(venue, deltas)
+
+    def remove_venue(self, venue: str) -> None:
+        """
+        Remove a venue and all of its levels from the consolidated book.
+
+        Args:
+            venue (str): The venue to remove.
+
+        Raises:
+            KeyError: If the venue is not part of the book.
+
+        """
+        data = self._venues.pop(venue).to_dict()
+        for side in Side:
+            prices, _ = _side_levels(data, side)
+            for price in prices:
+                self._side(side).patch(venue, price, 0.0)
+
+    def venue_book(self, venue: str) -> OrderBook:
+        """
+        Get the latest book of one venue.
+
+        Args:
+            venue (str): The venue to look up.
+
+        Returns:
+            OrderBook: A snapshot of the venue's book.
+
+        Raises:
+            KeyError: If the venue is not part of the book.
+
+        """
+        return self._venues[venue].to_orderbook()
+
+    def venue_sizes(self, side: Side, price: float) -> dict[str, float]:
+        """
+        Get the size each venue contributes to a consolidated level.
+
+        Args:
+            side (Side): The side of the book.
+            price (float): The price of the level.
+
+        Returns:
+            dict[str, float]: The size per venue, empty if there is no such level.
+
+        """
+        return self._side(side).venue_sizes(price)
+
+    @property
+    def top_level_prices(self) -> tuple[float | None, float | None]:
+        """
+        Get the top level ask and bid prices across all venues.
+
+        Returns:
+            tuple[float | None, float | None]: The top ask price and top bid price, or None if empty.
+
+        """
+        return self._asks.levels.best(), self._bids.levels.best()
+
+    @property
+    def n_levels(self) -> tuple[int, int]:
+        """
+        Returns the number of consolidated levels for both ask and bid prices.
+
+        Returns:
+            tuple[int, int]: A tuple containing the number of ask price levels and bid price levels.
+
+        """
+        return len(self._asks.levels), len(self._bids.levels)
+
+    def to_dict(self, depth: int | None = None) -> OrderBookDict:
+        """
+        Snapshot the consolidated ladder as an `OrderBookDict`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBookDict: The total size at each price, best level first.
+
+        """
+        return OrderBookDict(
+            ask_prices=self._asks.levels.prices(depth),
+            ask_sizes=self._asks.levels.level_sizes(depth),
+            bid_prices=self._bids.levels.prices(depth),
+            bid_sizes=self._bids.levels.level_sizes(depth),
+        )
+
+    def to_orderbook(self, depth: int | None = None) -> OrderBook:
+        """
+        Snapshot the consolidated ladder as an `OrderBook`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBook: The total size at each price, best level first.
+
+        """
+        return OrderBook.from_dict(self.to_dict(depth))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from itertools import pairwise
 from random import uniform
 from typing import Self, TypedDict
 
@@ -60,13 +61,14 @@ class OrderBook:
             msg = "bid_prices and bid_sizes must be of the same length"
             raise ValueError(msg)
 
-        # check that prices in ask_prices are in ascending order
-        if self.ask_prices != sorted(self.ask_prices):
+        # check that prices in ask_prices are in ascending order,
+        # comparing neighbours avoids building a sorted copy
+        if any(a > b for a, b in pairwise(self.ask_prices)):
             msg = "ask_prices must be in strictly increasing order"
             raise ValueError(msg)
 
         # check that prices in bid_prices are in descending order
-        if self.bid_prices != sorted(self.bid_prices, reverse=True):
+        if any(a < b for a, b in pairwise(self.bid_prices)):
             msg = "bid_prices must be in strictly decreasing order"
             raise ValueError(msg)
 
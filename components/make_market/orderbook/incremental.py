@@ -0,0 +1,407 @@
+import math
+from bisect import bisect_left
+from collections.abc import Iterable
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Self
+
+import numpy as np
+from make_market.orderbook.arrays import ArrayOrderBook
+from make_market.orderbook.core import OrderBook, OrderBookDict
+
+
+class Side(StrEnum):
+    """Enumeration of the two sides of an order book."""
+
+    ASK = "ask"
+    BID = "bid"
+
+
+@dataclass(frozen=True, slots=True)
+class LevelDelta:
+    """
+    LevelDelta is a single price level update, as sent by L2 exchange feeds.
+
+    Attributes:
+        side (Side): The side of the book the level belongs to.
+        price (float): The price of the level.
+        size (float): The new total size at the price, 0 removes the level.
+
+    """
+
+    side: Side
+    price: float
+    size: float
+
+
+class BookSide:
+    """
+    BookSide is one side of a price ladder, kept sorted best level first.
+
+    Levels are stored as a sorted list of keys plus a key -> size mapping. Bid
+    keys are negated prices, so that for both sides the best level is the
+    smallest key and ordering is a plain ascending sort. Finding a level is
+    an O(log n) search, inserting one a memmove of the tail of the list.
+
+    Attributes:
+        keys (list[float]): The level keys, best level first.
+        sign (float): 1.0 for the ask side, -1.0 for the bid side.
+        sizes (dict[float, float]): The size of each level, by key.
+
+    """
+
+    __slots__ = ("keys", "sign", "sizes")
+
+    def __init__(self, side: Side) -> None:
+        self.sign = 1.0 if side == Side.ASK else -1.0
+        self.keys: list[float] = []
+        self.sizes: dict[float, float] = {}
+
+    def set(self, price: float, size: float) -> None:
+        """
+        Insert or update a level.
+
+        Args:
+            price (float): The price of the level.
+            size (float): The size at the price.
+
+        """
+        key = self.sign * price
+        if key not in self.sizes:
+            self.keys.insert(bisect_left(self.keys, key), key)
+        self.sizes[key] = size
+
+    def discard(self, price: float) -> None:
+        """
+        Remove a level, removing a level that is not present is a no-op.
+
+        Args:
+            price (float): The price of the level.
+
+        """
+        key = self.sign * price
+        if self.sizes.pop(key, None) is not None:
+            del self.keys[bisect_left(self.keys, key)]
+
+    def get(self, price: float) -> float | None:
+        """
+        Get the size at a price.
+
+        Args:
+            price (float): The price of the level.
+
+        Returns:
+            float | None: The size at the level, or None if there is no such level.
+
+        """
+        return self.sizes.get(self.sign * price)
+
+    def prices(self, depth: int | None = None) -> list[float]:
+        """
+        Get the prices of the levels, best level first.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels.
+                Defaults to all levels.
+
+        Returns:
+            list[float]: The prices.
+
+        """
+        return [self.sign * key for key in self.keys[:depth]]
+
+    def level_sizes(self, depth: int | None = None) -> list[float]:
+        """
+        Get the sizes of the levels, best level first.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels.
+                Defaults to all levels.
+
+        Returns:
+            list[float]: The sizes, matching `prices`.
+
+        """
+        sizes = self.sizes
+        return [sizes[key] for key in self.keys[:depth]]
+
+    def best(self) -> float | None:
+        """
+        Get the best price.
+
+        Returns:
+            float | None: The best price, or None if the side is empty.
+
+        """
+        return self.sign * self.keys[0] if self.keys else None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+def _check_level(price: float, size: float) -> None:
+    if not math.isfinite(price):
+        msg = f"price must be finite, got {price}"
+        raise ValueError(msg)
+    if not size >= 0:
+        msg = f"size must be non-negative, got {size}"
+        raise ValueError(msg)
+
+
+class IncrementalOrderBook:
+    """
+    IncrementalOrderBook is a mutable L2 order book maintained from level deltas.
+
+    Each side is kept in price-sorted storage, so the ask/bid ordering
+    invariants hold by construction. Updating the size of an existing level
+    is a dict update; inserting or deleting one is an O(log n) search plus an
+    O(n) memmove of the sorted keys, which is cheap for the few dozen levels
+    of a ladder. Snapshots in the `OrderBook` formats are produced on
+    demand, without re-validating the book.
+
+    """
+
+    def __init__(self) -> None:
+        self._asks = BookSide(Side.ASK)
+        self._bids = BookSide(Side.BID)
+
+    def _side(self, side: Side) -> BookSide:
+        # plain strings are accepted like their Side member, others raise
+        return self._asks if Side(side) is Side.ASK else self._bids
+
+    def update_level(self, side: Side, price: float, size: float) -> None:
+        """
+        Insert, update or delete a single price level.
+
+        Args:
+            side (Side): The side of the book to update.
+            price (float): The price of the level.
+            size (float): The new total size at the price, 0 removes the level.
+
+        Raises:
+            ValueError: If the side is not a `Side`, the price is not finite or
+                        the size is negative.
+
+        """
+        _check_level(price, size)
+        if size:
+            self._side(side).set(price, size)
+        else:
+            self._side(side).discard(price)
+
+    def delete_level(self, side: Side, price: float) -> None:
+        """
+        Delete a price level, deleting a level that is not present is a no-op.
+
+        Args:
+            side (Side): The side of the book to update.
+            price (float): The price of the level to delete.
+
+        """
+        self._side(side).discard(price)
+
+    def apply_delta(self, delta: LevelDelta) -> None:
+        """
+        Apply a single level delta to the book.
+
+        Args:
+            delta (LevelDelta): The level update to apply.
+
+        Raises:
+            ValueError: If the delta has an invalid side, a non-finite price or a
+                        negative size.
+
+        """
+        self.update_level(delta.side, delta.price, delta.size)
+
+    def apply_deltas(self, deltas: Iterable[LevelDelta]) -> None:
+        """
+        Apply a batch of level deltas atomically.
+
+        All deltas are checked before any of them is applied, so an invalid
+        delta leaves the book untouched. Deltas are applied in order, a later
+        update of the same level wins.
+
+        Args:
+            deltas (Iterable[LevelDelta]): The level updates to apply.
+
+        Raises:
+            ValueError: If any delta has an invalid side, a non-finite price or a
+                        negative size.
+
+        """
+        deltas = list(deltas)
+        sides = []
+        for delta in deltas:
+            _check_level(delta.price, delta.size)
+            sides.append(self._side(delta.side))
+
+        for side, delta in zip(sides, deltas, strict=True):
+            if delta.size:
+                side.set(delta.price, delta.size)
+            else:
+                side.discard(delta.price)
+
+    def size_at(self, side: Side, price: float) -> float | None:
+        """
+        Get the size resting at a price level.
+
+        Args:
+            side (Side): The side of the book to look at.
+            price (float): The price of the level.
+
+        Returns:
+            float | None: The size at the level, or None if there is no such level.
+
+        """
+        return self._side(side).get(price)
+
+    def clear(self) -> None:
+        """Remove all levels from both sides of the book."""
+        self._asks = BookSide(Side.ASK)
+        self._bids = BookSide(Side.BID)
+
+    def is_empty(self) -> bool:
+        """
+        Check if the order book is empty.
+
+        Returns:
+            bool: True if both sides have no levels, False otherwise.
+
+        """
+        return not (self._asks or self._bids)
+
+    @property
+    def top_level_prices(self) -> tuple[float | None, float | None]:
+        """
+        Get the top level ask and bid prices.
+
+        Returns:
+            tuple[float | None, float | None]: The top ask price and top bid price, or None if empty.
+
+        """
+        return self._asks.best(), self._bids.best()
+
+    @property
+    def mid_price(self) -> float | None:
+        """
+        Calculate the mid-price of the order book.
+
+        Returns:
+            float | None: The mid-price if both top ask and top bid prices are available,
+                          otherwise None.
+
+        """
+        top_ask, top_bid = self.top_level_prices
+        if top_ask is None or top_bid is None:
+            return None
+        return (top_ask + top_bid) / 2
+
+    @property
+    def n_levels(self) -> tuple[int, int]:
+        """
+        Returns the number of levels in the order book for both ask and bid prices.
+
+        Returns:
+            tuple[int, int]: A tuple containing the number of ask price levels and bid price levels.
+
+        """
+        return len(self._asks), len(self._bids)
+
+    def to_dict(self, depth: int | None = None) -> OrderBookDict:
+        """
+        Snapshot the book as an `OrderBookDict`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBookDict: The book levels, best level first.
+
+        """
+        return OrderBookDict(
+            ask_prices=self._asks.prices(depth),
+            ask_sizes=self._asks.level_sizes(depth),
+            bid_prices=self._bids.prices(depth),
+            bid_sizes=self._bids.level_sizes(depth),
+        )
+
+    def to_orderbook(self, depth: int | None = None) -> OrderBook:
+        """
+        Snapshot the book as an `OrderBook`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBook: A list-backed snapshot of the book.
+
+        """
+        return OrderBook.from_dict(self.to_dict(depth))
+
+    def to_array_orderbook(self, depth: int | None = None) -> ArrayOrderBook:
+        """
+        Snapshot the book as an `ArrayOrderBook`, skipping validation.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            ArrayOrderBook: An array-backed snapshot of the book.
+
+        """
+        data = self.to_dict(depth)
+        return ArrayOrderBook.from_arrays(
+            np.array(data["ask_prices"], dtype=np.float64),
+            np.array(data["ask_sizes"], dtype=np.float64),
+            np.array(data["bid_prices"], dtype=np.float64),
+            np.array(data["bid_sizes"], dtype=np.float64),
+            validate=False,
+        )
+
+    @classmethod
+    def from_dict(cls, data: OrderBookDict) -> Self:
+        """
+        Create an incremental book seeded from a full snapshot.
+
+        Args:
+            data (OrderBookDict): The snapshot to seed the book with.
+
+        Returns:
+            Self: An incremental book holding the snapshot levels.
+
+        Raises:
+            ValueError: If prices and sizes of a side are not of the same length,
+                        or if a level has a non-finite price or a negative size.
+
+        """
+        book = cls()
+        deltas: list[LevelDelta] = []
+        for side, prices, sizes in (
+            (Side.ASK, data["ask_prices"], data["ask_sizes"]),
+            (Side.BID, data["bid_prices"], data["bid_sizes"]),
+        ):
+            if len(prices) != len(sizes):
+                msg = f"{side}_prices and {side}_sizes must be of the same length"
+                raise ValueError(msg)
+            deltas.extend(map(LevelDelta, [side] * len(prices), prices, sizes))
+
+        book.apply_deltas(deltas)
+        return book
+
+    @classmethod
+    def from_orderbook(cls, orderbook: OrderBook | ArrayOrderBook) -> Self:
+        """
+        Create an incremental book seeded from an `OrderBook` snapshot.
+
+        Args:
+            orderbook (OrderBook | ArrayOrderBook): The snapshot to seed the book with.
+
+        Returns:
+            Self: An incremental book holding the snapshot levels.
+
+        """
+        return cls.from_dict(orderbook.to_dict())
@@ -0,0 +1,325 @@
+import math
+from dataclasses import dataclass
+
+from make_market.orderbook.core import OrderBook, OrderBookDict
+from make_market.orderbook.incremental import BookSide, Side
+
+OrderId = int | str
+
+# every finite float is a whole number of these units, the smallest subnormal
+_SIZE_SCALE = 2**1074
+
+
+def _size_units(size: float) -> int:
+    numerator, denominator = size.as_integer_ratio()
+    return numerator * (_SIZE_SCALE // denominator)
+
+
+@dataclass(slots=True)
+class Order:
+    """
+    Order is a single resting order in an order-level (L3) book.
+
+    Attributes:
+        order_id (OrderId): The venue's identifier of the order.
+        side (Side): The side of the book the order rests on.
+        price (float): The limit price of the order.
+        size (float): The remaining size of the order.
+
+    """
+
+    order_id: OrderId
+    side: Side
+    price: float
+    size: float
+
+
+class _OrderBookSide:
+    """
+    One side of an L3 book: FIFO queues per price plus the derived L2 ladder.
+
+    Each queue is an insertion-ordered dict of order id -> order, which gives
+    FIFO iteration with O(1) removal from anywhere in the queue. The L2 ladder
+    of total sizes is updated on every event, so reading it never walks orders.
+    A level's total is kept as an exact integer count of `_SIZE_SCALE` units
+    and moved by the size delta of each event, so an event is O(1) however
+    deep the queue, and the total never drifts from the sum of its orders.
+    """
+
+    __slots__ = ("ladder", "queues", "totals")
+
+    def __init__(self, side: Side) -> None:
+        self.ladder = BookSide(side)
+        self.queues: dict[float, dict[OrderId, Order]] = {}
+        self.totals: dict[float, int] = {}
+
+    def _move(self, key: float, price: float, units: int) -> None:
+        total = self.totals[key] + units
+        self.totals[key] = total
+        # int division rounds correctly, like math.fsum of the order sizes
+        self.ladder.set(price, total / _SIZE_SCALE)
+
+    def add(self, order: Order) -> None:
+        key = self.ladder.sign * order.price
+        queue = self.queues.get(key)
+        if queue is None:
+            queue = self.queues[key] = {}
+            self.totals[key] = 0
+        queue[order.order_id] = order
+        self._move(key, order.price, _size_units(order.size))
+
+    def remove(self, order: Order) -> None:
+        key = self.ladder.sign * order.price
+        queue = self.queues[key]
+        del queue[order.order_id]
+        if queue:
+            self._move(key, order.price, -_size_units(order.size))
+        else:
+            del self.queues[key]
+            del self.totals[key]
+            self.ladder.discard(order.price)
+
+    def reduce(self, order: Order, size: float) -> None:
+        units = _size_units(size) - _size_units(order.size)
+        order.size = size
+        self._move(self.ladder.sign * order.price, order.price, units)
+
+    def queue(self, price: float) -> list[Order]:
+        return list(self.queues.get(self.ladder.sign * price, {}).values())
+
+
+def _check_order(price: float, size: float) -> None:
+    if not math.isfinite(price):
+        msg = f"price must be finite, got {price}"
+        raise ValueError(msg)
+    if not size > 0:
+        msg = f"size must be positive, got {size}"
+        raise ValueError(msg)
+
+
+class L3OrderBook:
+    """
+    L3OrderBook is an order-level book keyed by order id.
+
+    Orders rest in per-price FIFO queues. An id index finds the order of a
+    cancel or modify in O(1), and adding an order at a new price is an
+    O(log n) level insert. The aggregated L2 view is maintained alongside
+    the orders, each event moving the exact total of the one level it
+    touches, so snapshots in the `OrderBook` formats are cheap and exact.
+
+    """
+
+    def __init__(self) -> None:
+        self._orders: dict[OrderId, Order] = {}
+        self._asks = _OrderBookSide(Side.ASK)
+        self._bids = _OrderBookSide(Side.BID)
+
+    def _side(self, side: Side) -> _OrderBookSide:
+        # plain strings are accepted like their Side member, others raise
+        return self._asks if Side(side) is Side.ASK else self._bids
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __contains__(self, order_id: OrderId) -> bool:
+        return order_id in self._orders
+
+    def get_order(self, order_id: OrderId) -> Order:
+        """
+        Look up a resting order.
+
+        Args:
+            order_id (OrderId): The identifier of the order.
+
+        Returns:
+            Order: The resting order.
+
+        Raises:
+            KeyError: If there is no order with this id.
+
+        """
+        return self._orders[order_id]
+
+    def add_order(
+        self, order_id: OrderId, side: Side, price: float, size: float
+    ) -> Order:
+        """
+        Add a new order at the back of its price level's queue.
+
+        Args:
+            order_id (OrderId): The identifier of the order.
+            side (Side): The side of the book.
+            price (float): The limit price of the order.
+            size (float): The size of the order.
+
+        Returns:
+            Order: The resting order.
+
+        Raises:
+            ValueError: If the id is already in the book, the side is not a
+                        `Side`, the price is not finite or the size is not
+                        positive.
+
+        """
+        if order_id in self._orders:
+            msg = f"order {order_id!r} is already in the book"
+            raise ValueError(msg)
+        _check_order(price, size)
+        book_side = self._side(side)
+
+        order = Order(order_id, Side(side), price, size)
+        self._orders[order_id] = order
+        book_side.add(order)
+        return order
+
+    def cancel_order(self, order_id: OrderId) -> Order:
+        """
+        Remove an order from the book.
+
+        Args:
+            order_id (OrderId): The identifier of the order.
+
+        Returns:
+            Order: The cancelled order.
+
+        Raises:
+            KeyError: If there is no order with this id.
+
+        """
+        order = self._orders.pop(order_id)
+        self._side(order.side).remove(order)
+        return order
+
+    def modify_order(
+        self, order_id: OrderId, size: float, price: float | None = None
+    ) -> Order:
+        """
+        Change the size and optionally the price of an order.
+
+        Reducing the size keeps the order's place in its queue. Increasing the
+        size or changing the price moves the order to the back of the queue of
+        its new price, as exchanges do.
+
+        Args:
+            order_id (OrderId): The identifier of the order.
+            size (float): The new size of the order.
+            price (float | None, optional): The new price. Defaults to keeping the price.
+
+        Returns:
+            Order: The modified order.
+
+        Raises:
+            KeyError: If there is no order with this id.
+            ValueError: If the price is not finite or the size is not positive.
+
+        """
+        order = self._orders[order_id]
+        price = order.price if price is None else price
+        _check_order(price, size)
+
+        book_side = self._side(order.side)
+        if price == order.price and size <= order.size:
+            book_side.reduce(order, size)
+            return order
+
+        book_side.remove(order)
+        order.price = price
+        order.size = size
+        book_side.add(order)
+        return order
+
+    def execute_order(self, order_id: OrderId, size: float) -> Order:
+        """
+        Fill part or all of an order, removing it once nothing is left.
+
+        Args:
+            order_id (OrderId): The identifier of the order.
+            size (float): The executed size.
+
+        Returns:
+            Order: The order with its remaining size.
+
+        Raises:
+            KeyError: If there is no order with this id.
+            ValueError: If the executed size is not positive or exceeds the order.
+
+        """
+        order = self._orders[order_id]
+        if not 0 < size <= order.size:
+            msg = f"executed size must be in (0, {order.size}], got {size}"
+            raise ValueError(msg)
+
+        if size == order.size:
+            return self.cancel_order(order_id)
+
+        self._side(order.side).reduce(order, order.size - size)
+        return order
+
+    def queue(self, side: Side, price: float) -> list[Order]:
+        """
+        Get the orders resting at a price level, in time priority.
+
+        Args:
+            side (Side): The side of the book.
+            price (float): The price of the level.
+
+        Returns:
+            list[Order]: The orders at the level, first in line first.
+
+        """
+        return self._side(side).queue(price)
+
+    @property
+    def top_level_prices(self) -> tuple[float | None, float | None]:
+        """
+        Get the top level ask and bid prices.
+
+        Returns:
+            tuple[float | None, float | None]: The top ask price and top bid price, or None if empty.
+
+        """
+        return self._asks.ladder.best(), self._bids.ladder.best()
+
+    @property
+    def n_levels(self) -> tuple[int, int]:
+        """
+        Returns the number of levels in the order book for both ask and bid prices.
+
+        Returns:
+            tuple[int, int]: A tuple containing the number of ask price levels and bid price levels.
+
+        """
+        return len(self._asks.ladder), len(self._bids.ladder)
+
+    def to_dict(self, depth: int | None = None) -> OrderBookDict:
+        """
+        Snapshot the aggregated L2 view as an `OrderBookDict`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBookDict: The total resting size at each price, best level first.
+
+        """
+        return OrderBookDict(
+            ask_prices=self._asks.ladder.prices(depth),
+            ask_sizes=self._asks.ladder.level_sizes(depth),
+            bid_prices=self._bids.ladder.prices(depth),
+            bid_sizes=self._bids.ladder.level_sizes(depth),
+        )
+
+    def to_orderbook(self, depth: int | None = None) -> OrderBook:
+        """
+        Snapshot the aggregated L2 view as an `OrderBook`.
+
+        Args:
+            depth (int | None, optional): The maximum number of levels per side.
+                Defaults to all levels.
+
+        Returns:
+            OrderBook: The total resting size at each price, best level first.
+
+        """
+        return OrderBook.from_dict(self.to_dict(depth))
@@ -0,0 +1,304 @@
+from dataclasses import dataclass, field
+from typing import Protocol, Self, TypedDict
+
+import numpy as np
+import numpy.typing as npt
+from make_market.messaging.decimals import (
+    digits_to_floats,
+    floats_to_digits_with_precision,
+)
+from make_market.orderbook.arrays import ArrayOrderBook, validate_levels
+from make_market.orderbook.core import OrderBook
+
+IntArray = npt.NDArray[np.int64]
+
+DEFAULT_PRICE_EXPONENT = -6
+DEFAULT_SIZE_EXPONENT = -2
+
+
+class QuoteLevelsDict(TypedDict):
+    """
+    QuoteLevelsDict holds the level fields shared by `BaseQuote` and `RawVendorQuote`.
+
+    It can be unpacked straight into either of them.
+
+    Attributes:
+        bid_price (list[int]): Bid price mantissas, best level first.
+        ask_price (list[int]): Ask price mantissas, best level first.
+        price_exponent (int): The exponent used for price scaling.
+        bid_size (list[int]): Bid size mantissas.
+        ask_size (list[int]): Ask size mantissas.
+        size_exponent (int): The exponent used for size scaling.
+
+    """
+
+    bid_price: list[int]
+    ask_price: list[int]
+    price_exponent: int
+    bid_size: list[int]
+    ask_size: list[int]
+    size_exponent: int
+
+
+class QuoteLevelsProtocol(Protocol):
+    """Anything carrying quote levels as integer mantissas, e.g. `BaseQuote`."""
+
+    bid_price: list[int]
+    ask_price: list[int]
+    price_exponent: int
+    bid_size: list[int]
+    ask_size: list[int]
+    size_exponent: int
+
+
+def _as_ticks(values: npt.ArrayLike) -> IntArray:
+    """Return `values` as a contiguous, one-dimensional int64 array."""
+    return np.ascontiguousarray(values, dtype=np.int64).reshape(-1)
+
+
+@dataclass(eq=False)
+class TickOrderBook:
+    """
+    TickOrderBook is an order book storing prices and sizes as int64 mantissas.
+
+    Every price is `mantissa * 10**price_exponent` and every size is
+    `mantissa * 10**size_exponent`, the same fixed-point representation used by
+    `BaseQuote`. Converting to and from quote level lists involves no float or
+    Decimal arithmetic, and price comparisons are exact.
+
+    Attributes:
+        ask_prices (IntArray): Ask price mantissas, best level first.
+        ask_sizes (IntArray): Ask size mantissas.
+        bid_prices (IntArray): Bid price mantissas, best level first.
+        bid_sizes (IntArray): Bid size mantissas.
+        price_exponent (int): The exponent used for price scaling.
+        size_exponent (int): The exponent used for size scaling.
+
+    """
+
+    ask_prices: IntArray = field(default_factory=lambda: np.empty(0, np.int64))
+    ask_sizes: IntArray = field(default_factory=lambda: np.empty(0, np.int64))
+    bid_prices: IntArray = field(default_factory=lambda: np.empty(0, np.int64))
+    bid_sizes: IntArray = field(default_factory=lambda: np.empty(0, np.int64))
+    price_exponent: int = DEFAULT_PRICE_EXPONENT
+    size_exponent: int = DEFAULT_SIZE_EXPONENT
+
+    def __post_init__(self) -> None:
+        self.ask_prices = _as_ticks(self.ask_prices)
+        self.ask_sizes = _as_ticks(self.ask_sizes)
+        self.bid_prices = _as_ticks(self.bid_prices)
+        self.bid_sizes = _as_ticks(self.bid_sizes)
+        self.validate()
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TickOrderBook):
+            return NotImplemented
+        return (
+            self.price_exponent == other.price_exponent
+            and self.size_exponent == other.size_exponent
+            and np.array_equal(self.ask_prices, other.ask_prices)
+            and np.array_equal(self.ask_sizes, other.ask_sizes)
+            and np.array_equal(self.bid_prices, other.bid_prices)
+            and np.array_equal(self.bid_sizes, other.bid_sizes)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def validate(self) -> None:
+        """
+        Validate the order book to ensure that prices and sizes are consistent.
+
+        Raises:
+            ValueError: If ask_prices and ask_sizes or bid_prices and bid_sizes
+                        are not of the same length, or if ask_prices are not in
+                        strictly increasing order, or if bid_prices are not in
+                        strictly decreasing order.
+
+        """
+        validate_levels(
+            self.ask_prices, self.ask_sizes, self.bid_prices, self.bid_sizes
+        )
+
+    def is_empty(self) -> bool:
+        """
+        Check if the order book is empty.
+
+        Returns:
+            bool: True if both ask_prices and bid_prices are empty, False otherwise.
+
+        """
+        return not (self.ask_prices.size or self.bid_prices.size)
+
+    @property
+    def top_level_prices(self) -> tuple[int | None, int | None]:
+        """
+        Get the top level ask and bid price mantissas.
+
+        Returns:
+            tuple[int | None, int | None]: The top ask and top bid mantissas, or None if empty.
+
+        """
+        top_ask = int(self.ask_prices[0]) if self.ask_prices.size else None
+        top_bid = int(self.bid_prices[0]) if self.bid_prices.size else None
+        return top_ask, top_bid
+
+    @property
+    def top_level_spread(self) -> int | None:
+        """
+        Calculate the top-level spread in ticks of `10**price_exponent`.
+
+        Returns:
+            int | None: The top-level spread if both sides are present, otherwise None.
+
+        """
+        top_ask, top_bid = self.top_level_prices
+        if top_ask is None or top_bid is None:
+            return None
+        return top_ask - top_bid
+
+    @property
+    def is_crossed(self) -> bool:
+        """
+        Check whether the top bid is above the top ask, using exact comparison.
+
+        Returns:
+            bool: True if both sides are present and the book is crossed.
+
+        """
+        spread = self.top_level_spread
+        return spread is not None and spread < 0
+
+    @property
+    def is_locked(self) -> bool:
+        """
+        Check whether the top bid equals the top ask, using exact comparison.
+
+        Returns:
+            bool: True if both sides are present and the book is locked.
+
+        """
+        return self.top_level_spread == 0
+
+    @property
+    def n_levels(self) -> tuple[int, int]:
+        """
+        Returns the number of levels in the order book for both ask and bid prices.
+
+        Returns:
+            tuple[int, int]: A tuple containing the number of ask price levels and bid price levels.
+
+        """
+        return self.ask_prices.size, self.bid_prices.size
+
+    @classmethod
+    def from_quote(cls, quote: QuoteLevelsProtocol, *, validate: bool = True) -> Self:
+        """
+        Create a tick book from the level lists of a `BaseQuote` or `RawVendorQuote`.
+
+        Args:
+            quote (QuoteLevelsProtocol): The quote to read the levels from.
+            validate (bool, optional): Whether to validate the levels. Quotes
+                produced from a validated book can skip it. Defaults to True.
+
+        Returns:
+            Self: A tick book holding the quote levels.
+
+        """
+        book = cls.__new__(cls)
+        book.ask_prices = _as_ticks(quote.ask_price)
+        book.ask_sizes = _as_ticks(quote.ask_size)
+        book.bid_prices = _as_ticks(quote.bid_price)
+        book.bid_sizes = _as_ticks(quote.bid_size)
+        book.price_exponent = quote.price_exponent
+        book.size_exponent = quote.size_exponent
+        if validate:
+            book.validate()
+        return book
+
+    def to_quote_levels(self) -> QuoteLevelsDict:
+        """
+        Convert the book to the level fields of `BaseQuote` and `RawVendorQuote`.
+
+        Returns:
+            QuoteLevelsDict: The levels as lists of Python ints, ready to be
+            unpacked into a quote.
+
+        """
+        return QuoteLevelsDict(
+            bid_price=self.bid_prices.tolist(),
+            ask_price=self.ask_prices.tolist(),
+            price_exponent=self.price_exponent,
+            bid_size=self.bid_sizes.tolist(),
+            ask_size=self.ask_sizes.tolist(),
+            size_exponent=self.size_exponent,
+        )
+
+    @classmethod
+    def from_orderbook(
+        cls,
+        orderbook: OrderBook | ArrayOrderBook,
+        price_exponent: int = DEFAULT_PRICE_EXPONENT,
+        size_exponent: int = DEFAULT_SIZE_EXPONENT,
+    ) -> Self:
+        """
+        Create a tick book by rounding a float book to the given exponents.
+
+        The exact value of each float is rounded to the nearest mantissa, ties
+        to even, like the quote pipeline does, so the mantissas match those of
+        a `BaseQuote` built from the same book. Rounding cannot reorder
+        levels, so the result is not re-validated.
+
+        Args:
+            orderbook (OrderBook | ArrayOrderBook): The float book to convert.
+            price_exponent (int, optional): The exponent used for price scaling.
+            size_exponent (int, optional): The exponent used for size scaling.
+
+        Returns:
+            Self: A tick book holding the rounded levels.
+
+        Raises:
+            ValueError: If a price or size is not finite.
+
+        """
+        book = cls.__new__(cls)
+        book.ask_prices = floats_to_digits_with_precision(
+            orderbook.ask_prices, price_exponent
+        )
+        book.ask_sizes = floats_to_digits_with_precision(
+            orderbook.ask_sizes, size_exponent
+        )
+        book.bid_prices = floats_to_digits_with_precision(
+            orderbook.bid_prices, price_exponent
+        )
+        book.bid_sizes = floats_to_digits_with_precision(
+            orderbook.bid_sizes, size_exponent
+        )
+        book.price_exponent = price_exponent
+        book.size_exponent = size_exponent
+        return book
+
+    def to_array_orderbook(self) -> ArrayOrderBook:
+        """
+        Convert the book to float values as an `ArrayOrderBook`.
+
+        Returns:
+            ArrayOrderBook: The nearest float representation of the book.
+
+        """
+        return ArrayOrderBook.from_arrays(
+            digits_to_floats(self.ask_prices, self.price_exponent),
+            digits_to_floats(self.ask_sizes, self.size_exponent),
+            digits_to_floats(self.bid_prices, self.price_exponent),
+            digits_to_floats(self.bid_sizes, self.size_exponent),
+            validate=False,
+        )
+
+    def to_orderbook(self) -> OrderBook:
+        """
+        Convert the book to float values as an `OrderBook`.
+
+        Returns:
+            OrderBook: The nearest float representation of the book.
+
+        """
+        return self.to_array_orderbook().to_orderbook()
@@ -1,8 +1,20 @@
+from make_market.producer_consumer.conflation import (
+    AsyncConflatingSubscriber,
+    ConflatingSubscriber,
+)
 from make_market.producer_consumer.protocols import (
     ConfigurationServiceProtocol,
     ConsumerProtocol,
     ProducerProtocol,
 )
+from make_market.producer_consumer.proxy import LastValueCache, ProxyStatistics
+from make_market.producer_consumer.sockets import SocketManager
+from make_market.producer_consumer.topics import (
+    MessageType,
+    parse_topic,
+    subscription_prefixes,
+    topic,
+)
 from make_market.producer_consumer.zero_mq import PubSubWithZeroMQ
 
 __all__ = [
@@ -10,4 +22,13 @@ __all__ = [
     "ProducerProtocol",
     "ConfigurationServiceProtocol",
     "PubSubWithZeroMQ",
+    "SocketManager",
+    "AsyncConflatingSubscriber",
+    "ConflatingSubscriber",
+    "LastValueCache",
+    "ProxyStatistics",
+    "MessageType",
+    "parse_topic",
+    "subscription_prefixes",
+    "topic",
 ]
@@ -0,0 +1,255 @@
+import asyncio
+import contextlib
+import threading
+from types import TracebackType
+from typing import Final, Self
+
+import zmq
+import zmq.asyncio
+from make_market.log.core import get_logger
+
+# bounds one drain, so a publisher faster than the drain cannot starve delivery
+DEFAULT_MAX_DRAIN: Final[int] = 10_000
+
+# how long the drain thread waits for messages before checking it was closed
+DEFAULT_POLL_INTERVAL: Final[int] = 100
+
+logger = get_logger(__name__)
+
+
+class _Conflation:
+    def __init__(self, max_drain: int) -> None:
+        self.max_drain = max_drain
+        self.replaced = 0
+        self._latest: dict[bytes, bytes] = {}
+        self._error: zmq.ZMQError | None = None
+
+    def _keep(self, message: list[bytes]) -> None:
+        if len(message) != 2:
+            # one bad publisher must not stop the delivery of every topic
+            logger.warning("Skipped a message of %d frames.", len(message))
+            return
+        topic, payload = message
+        if topic in self._latest:
+            self.replaced += 1
+        self._latest[topic] = payload
+
+    def _take(self) -> dict[bytes, bytes]:
+        latest, self._latest = self._latest, {}
+        return latest
+
+    def _raise_stopped(self) -> None:
+        if self._error is not None:
+            msg = "the drain of the subscriber stopped"
+            raise RuntimeError(msg) from self._error
+
+
+class ConflatingSubscriber(_Conflation):
+    """
+    ConflatingSubscriber delivers only the newest message of every topic.
+
+    Once started, a background thread drains the socket continuously and
+    keeps the last payload per topic, replacing older undelivered ones, and
+    each receive takes what was kept so far. A consumer that runs slower
+    than the publishers, e.g. a UI at 5 Hz, thus always gets the latest
+    quote of each symbol, and the socket queue never fills up to the high
+    water mark, where ZeroMQ would drop the newest messages.
+
+    Conflation happens in the consumer's own process, on its own socket, so
+    the proxy and the other subscribers are not affected. It suits topics
+    whose messages each carry a full state, like quotes and frames, and not
+    delta streams. Messages that are not `[topic, payload]` are logged and
+    skipped.
+
+    The socket belongs to the drain thread while the subscriber is started:
+    the caller must not use it, and must close the subscriber before closing
+    the socket. The subscriber is a context manager that starts and closes it.
+
+    Attributes:
+        socket (zmq.Socket): The subscriber socket, receiving `[topic, payload]` messages.
+        max_drain (int): The most messages read from the socket per wakeup of the thread.
+        poll_interval (int): The milliseconds the thread waits for messages before
+            checking it was closed.
+        replaced (int): The number of messages replaced by a newer one before delivery.
+
+    """
+
+    def __init__(
+        self,
+        socket: zmq.Socket,
+        max_drain: int = DEFAULT_MAX_DRAIN,
+        poll_interval: int = DEFAULT_POLL_INTERVAL,
+    ) -> None:
+        super().__init__(max_drain)
+        self.socket = socket
+        self.poll_interval = poll_interval
+        self._ready = threading.Condition()
+        self._closed = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start draining the socket in a background thread, if not started yet."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stop the drain thread and wake up the waiting receives; the socket stays open."""
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._ready:
+            self._ready.notify_all()
+
+    def _run(self) -> None:
+        try:
+            while not self._closed.is_set():
+                if self.socket.poll(self.poll_interval):
+                    self._drain()
+        except zmq.ZMQError as error:
+            # e.g. the socket was closed: wake up the receives, which raise instead of hanging
+            with self._ready:
+                self._error = error
+                self._ready.notify_all()
+
+    def _drain(self) -> None:
+        # read without the lock, so a waiting receive is only held up by the keeping
+        messages = []
+        for _ in range(self.max_drain):
+            try:
+                messages.append(self.socket.recv_multipart(zmq.NOBLOCK))
+            except zmq.Again:
+                break
+        with self._ready:
+            for message in messages:
+                self._keep(message)
+            self._ready.notify_all()
+
+    def receive(self, timeout: int | None = None) -> dict[bytes, bytes]:
+        """
+        Wait for messages and return the newest of every topic.
+
+        Starts the subscriber if it was not started yet.
+
+        Args:
+            timeout (int | None, optional): The most milliseconds to wait for a
+                first message, None to wait forever. Defaults to None.
+
+        Returns:
+            dict[bytes, bytes]: The newest payload per topic, in the order the
+            topics first arrived, empty if the timeout expired or the
+            subscriber was closed.
+
+        Raises:
+            RuntimeError: If the drain thread stopped on an error and every
+                message kept before was delivered.
+
+        """
+        self.start()
+        with self._ready:
+            self._ready.wait_for(
+                lambda: self._latest or self._closed.is_set() or self._error,
+                None if timeout is None else timeout / 1_000,
+            )
+            if not self._latest:
+                self._raise_stopped()
+            return self._take()
+
+
+class AsyncConflatingSubscriber(_Conflation):
+    """
+    AsyncConflatingSubscriber is the `ConflatingSubscriber` of an asyncio socket.
+
+    The socket is drained by a task of the event loop instead of a thread, so
+    it keeps up with the publishers as long as the consumer awaits, and
+    yields to the other tasks after every `max_drain` messages.
+
+    """
+
+    socket: zmq.asyncio.Socket
+
+    def __init__(
+        self, socket: zmq.asyncio.Socket, max_drain: int = DEFAULT_MAX_DRAIN
+    ) -> None:
+        super().__init__(max_drain)
+        self.socket = socket
+        self._ready = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    async def __aenter__(self) -> Self:
+        self.start()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start draining the socket in a task of the running loop, if not started yet."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        """Cancel the drain task; the socket stays open."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        try:
+            while True:
+                self._keep(await self.socket.recv_multipart())
+                for _ in range(self.max_drain - 1):
+                    try:
+                        self._keep(await self.socket.recv_multipart(zmq.NOBLOCK))
+                    except zmq.Again:
+                        break
+                if self._latest:
+                    self._ready.set()
+                # receiving ready messages does not suspend, let the consumer run
+                await asyncio.sleep(0)
+        except zmq.ZMQError as error:
+            # e.g. the socket was closed: wake up the receive, which raises instead of hanging
+            self._error = error
+            self._ready.set()
+
+    async def receive(self) -> dict[bytes, bytes]:
+        """
+        Wait for messages and return the newest of every topic.
+
+        Starts the subscriber if it was not started yet. Use `asyncio.timeout`
+        to bound the wait.
+
+        Returns:
+            dict[bytes, bytes]: The newest payload per topic, in the order the
+            topics first arrived.
+
+        Raises:
+            RuntimeError: If the drain task stopped on an error and every
+                message kept before was delivered.
+
+        """
+        self.start()
+        await self._ready.wait()
+        if not self._latest:
+            self._raise_stopped()
+        self._ready.clear()
+        return self._take()
@@ -0,0 +1,389 @@
+import json
+from collections import deque
+from collections.abc import Iterable
+from typing import Final, TypedDict
+
+import zmq
+from make_market.clock.core import now_ns
+from make_market.log.core import get_logger
+from make_market.producer_consumer.topics import TOPIC_SEPARATOR, MessageType
+
+TERMINATE: Final[bytes] = b"TERMINATE"
+
+# the first byte of the subscription messages of an XPUB socket
+SUBSCRIBE: Final[int] = 1
+
+# the most messages forwarded per wakeup of the proxy, so neither direction starves
+DEFAULT_MAX_BATCH: Final[int] = 1_000
+
+# the message types whose latest message is the whole state of their topic
+FULL_STATE_TYPES: Final[tuple[MessageType, ...]] = (
+    MessageType.QUOTE,
+    MessageType.PACKED,
+    MessageType.FRAME,
+)
+
+STATISTICS_TOPIC: Final[bytes] = b"STATISTICS/"
+DEFAULT_STATISTICS_INTERVAL: Final[int] = 1_000
+DEFAULT_MAX_TOPICS: Final[int] = 1_024
+DEFAULT_HISTORY: Final[int] = 60
+
+# the topic under which messages are counted once the topic slots are full
+OTHER_TOPICS: Final[str] = "*other*"
+
+# the topic under which single frame messages, which have no topic, are counted
+NO_TOPIC: Final[str] = "*none*"
+
+logger = get_logger(__name__)
+
+
+class LastValueCache:
+    """
+    LastValueCache keeps the latest message of every topic that went through the proxy.
+
+    Only `[topic, payload, ...]` messages of full state types are cached,
+    keyed by their topic frame. A quote frame carries the full ladder of
+    every symbol, so it is cached like a quote. A delta alone would be
+    replayed to a late subscriber that lacks the state it applies to, and
+    single frame messages have no topic; those are just forwarded.
+
+    Args:
+        message_types (Iterable[MessageType], optional): The types of the cached
+            messages. Defaults to `FULL_STATE_TYPES`.
+
+    """
+
+    def __init__(self, message_types: Iterable[MessageType] = FULL_STATE_TYPES) -> None:
+        self._messages: dict[bytes, list[bytes]] = {}
+        # a suffix test on the topic frame is cheaper than parsing it
+        self._suffixes = tuple(
+            f"{TOPIC_SEPARATOR}{message_type}{TOPIC_SEPARATOR}".encode()
+            for message_type in message_types
+        )
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def store(self, message: list[bytes]) -> None:
+        """
+        Keep a message as the latest of its topic.
+
+        Args:
+            message (list[bytes]): The frames of the message.
+
+        """
+        if len(message) > 1 and message[0].endswith(self._suffixes):
+            self._messages[message[0]] = message
+
+    def matching(self, prefix: bytes) -> list[list[bytes]]:
+        """
+        Get the latest message of every topic starting with a prefix.
+
+        Args:
+            prefix (bytes): The subscription prefix, b"" for every topic.
+
+        Returns:
+            list[list[bytes]]: The messages, in the order their topics first arrived.
+
+        """
+        return [
+            message
+            for topic, message in self._messages.items()
+            if topic.startswith(prefix)
+        ]
+
+
+class TopicStatisticsDict(TypedDict):
+    """
+    TopicStatisticsDict is the traffic of one topic during a sample interval.
+
+    Attributes:
+        messages_per_second (float): The rate of messages.
+        bytes_per_second (float): The rate of bytes, summed over all frames.
+        max_size (int): The size in bytes of the largest message.
+
+    """
+
+    messages_per_second: float
+    bytes_per_second: float
+    max_size: int
+
+
+class ProxyStatisticsDict(TypedDict):
+    """
+    ProxyStatisticsDict is one sample of the traffic through the proxy.
+
+    Attributes:
+        timestamp_ns (int): The end of the interval, in nanoseconds since the Unix epoch.
+        interval_ns (int): The length of the interval in nanoseconds.
+        subscriptions (int): The subscriptions seen during the interval.
+        unsubscriptions (int): The unsubscriptions seen during the interval.
+        topics (dict[str, TopicStatisticsDict]): The traffic of the topics that had messages.
+
+    """
+
+    timestamp_ns: int
+    interval_ns: int
+    subscriptions: int
+    unsubscriptions: int
+    topics: dict[str, TopicStatisticsDict]
+
+
+class ProxyStatistics:
+    """
+    ProxyStatistics counts the traffic through the proxy and samples it periodically.
+
+    Every topic gets a slot in fixed-size counters of messages, bytes and
+    largest message the first time it is seen in an interval, and the topics
+    beyond `max_topics` share the `OTHER_TOPICS` slot, so memory stays
+    bounded whatever the publishers send. Single frame messages have no
+    topic frame and are counted under `NO_TOPIC`, without taking a slot.
+    Recording a message costs a dict lookup and three list updates; rates
+    are only computed when a sample is taken.
+
+    Each sample is kept in `samples`, a ring of the last `history` samples,
+    and, if there is a socket, published on it as a `[STATISTICS_TOPIC, json]`
+    message. The counters and the slots are reset after each sample, so the
+    topics that stopped publishing free their slots.
+
+    Attributes:
+        socket (zmq.Socket | None): The PUB socket the samples are published on.
+        interval (int): The milliseconds between two samples.
+        max_topics (int): The number of topics counted separately.
+        samples (deque[ProxyStatisticsDict]): The latest samples, oldest first.
+
+    """
+
+    def __init__(
+        self,
+        socket: zmq.Socket | None = None,
+        interval: int = DEFAULT_STATISTICS_INTERVAL,
+        max_topics: int = DEFAULT_MAX_TOPICS,
+        history: int = DEFAULT_HISTORY,
+    ) -> None:
+        self.socket = socket
+        self.interval = interval
+        self.max_topics = max_topics
+        self.samples: deque[ProxyStatisticsDict] = deque(maxlen=history)
+
+        self._started_ns = now_ns()
+        self._reset()
+
+    def _reset(self) -> None:
+        # the topic slots, then the slots of OTHER_TOPICS and NO_TOPIC
+        size = self.max_topics + 2
+        self._slots: dict[bytes, int] = {}
+        self._topics: list[str] = []
+        self._messages = [0] * size
+        self._bytes = [0] * size
+        self._max_size = [0] * size
+        self._subscriptions = 0
+        self._unsubscriptions = 0
+
+    def _slot(self, topic: bytes) -> int:
+        # the overflow slot is only used once every other slot is taken
+        if len(self._topics) == self.max_topics:
+            return self.max_topics
+        self._slots[topic] = len(self._topics)
+        self._topics.append(topic.decode(errors="replace"))
+        return self._slots[topic]
+
+    def record(self, message: list[bytes]) -> None:
+        """
+        Count a message forwarded to the subscribers.
+
+        Args:
+            message (list[bytes]): The frames of the message, the first is the
+                topic if there are several.
+
+        """
+        if len(message) == 1:
+            slot = self.max_topics + 1
+        else:
+            topic_slot = self._slots.get(message[0])
+            slot = self._slot(message[0]) if topic_slot is None else topic_slot
+        size = sum(map(len, message))
+        self._messages[slot] += 1
+        self._bytes[slot] += size
+        self._max_size[slot] = max(size, self._max_size[slot])
+
+    def record_subscription(self, subscription: bytes) -> None:
+        """
+        Count a subscription message of the XPUB socket.
+
+        Args:
+            subscription (bytes): The message, a subscribe or unsubscribe byte and a prefix.
+
+        """
+        if subscription[:1] == bytes([SUBSCRIBE]):
+            self._subscriptions += 1
+        else:
+            self._unsubscriptions += 1
+
+    def sample(self) -> ProxyStatisticsDict:
+        """
+        Compute the rates since the last sample, keep and publish them, and reset the counters.
+
+        Returns:
+            ProxyStatisticsDict: The sample.
+
+        """
+        timestamp_ns = now_ns()
+        interval_ns = max(timestamp_ns - self._started_ns, 1)
+        seconds = interval_ns / 1e9
+
+        names = dict(enumerate(self._topics))
+        names[self.max_topics] = OTHER_TOPICS
+        names[self.max_topics + 1] = NO_TOPIC
+        sample: ProxyStatisticsDict = {
+            "timestamp_ns": timestamp_ns,
+            "interval_ns": interval_ns,
+            "subscriptions": self._subscriptions,
+            "unsubscriptions": self._unsubscriptions,
+            "topics": {
+                names[slot]: {
+                    "messages_per_second": messages / seconds,
+                    "bytes_per_second": self._bytes[slot] / seconds,
+                    "max_size": self._max_size[slot],
+                }
+                for slot, messages in enumerate(self._messages)
+                if messages
+            },
+        }
+
+        self.samples.append(sample)
+        if self.socket is not None:
+            self.socket.send_multipart([STATISTICS_TOPIC, json.dumps(sample).encode()])
+
+        self._reset()
+        self._started_ns = timestamp_ns
+        return sample
+
+    def until_next_sample(self) -> int:
+        """
+        Take a sample if one is due.
+
+        Returns:
+            int: The milliseconds until the next sample is due.
+
+        """
+        elapsed = (now_ns() - self._started_ns) // 1_000_000
+        if elapsed >= self.interval:
+            self.sample()
+            return self.interval
+        return self.interval - elapsed
+
+
+def _forward_messages(
+    frontend: zmq.Socket[bytes],
+    backend: zmq.Socket[bytes],
+    cache: LastValueCache | None,
+    statistics: ProxyStatistics | None,
+    max_batch: int,
+) -> None:
+    # frame by frame with bound methods, about twice as fast as recv_multipart
+    # and send_multipart, which dominate the cost of the loop
+    receive, option, send = frontend.recv, frontend.getsockopt, backend.send
+    for _ in range(max_batch):
+        try:
+            message = [receive(zmq.NOBLOCK)]
+        except zmq.Again:
+            return
+        while option(zmq.RCVMORE):
+            message.append(receive())
+        if cache is not None:
+            cache.store(message)
+        if statistics is not None:
+            statistics.record(message)
+        for frame in message[:-1]:
+            send(frame, zmq.SNDMORE)
+        send(message[-1])
+
+
+def _forward_subscriptions(
+    frontend: zmq.Socket[bytes],
+    backend: zmq.Socket[bytes],
+    cache: LastValueCache | None,
+    statistics: ProxyStatistics | None,
+    max_batch: int,
+) -> None:
+    for _ in range(max_batch):
+        try:
+            subscription = backend.recv(zmq.NOBLOCK)
+        except zmq.Again:
+            return
+        frontend.send(subscription)
+        if statistics is not None:
+            statistics.record_subscription(subscription)
+        if cache is not None and subscription[:1] == bytes([SUBSCRIBE]):
+            for message in cache.matching(subscription[1:]):
+                backend.send_multipart(message)
+
+
+def run_proxy(  # noqa: PLR0913
+    frontend: zmq.Socket[bytes],
+    backend: zmq.Socket[bytes],
+    control: zmq.Socket[bytes],
+    cache: LastValueCache | None = None,
+    statistics: ProxyStatistics | None = None,
+    max_batch: int = DEFAULT_MAX_BATCH,
+) -> None:
+    """
+    Forward messages from an XSUB frontend to an XPUB backend until terminated.
+
+    Without a cache or statistics this is `zmq.proxy_steerable`. With a
+    cache, the proxy subscribes to every message of the frontend, keeps the
+    latest per topic and answers each new subscription on the backend by
+    replaying the cached messages it matches, so a consumer that joins late
+    gets a snapshot of every symbol at once instead of waiting for each one
+    to tick. With statistics, every forwarded message and subscription is
+    counted, and a sample is taken whenever the interval has elapsed.
+
+    Each wakeup of the poller drains up to `max_batch` queued messages of a
+    socket without blocking, so the cost of a poll is shared by a whole
+    burst of messages instead of being paid for each of them.
+
+    The backend must be an XPUB socket with `XPUB_VERBOSE` set, so repeated
+    subscriptions to the same prefix, e.g. by a restarted consumer, are seen
+    too. A replay goes to every subscriber of the topic, so consumers that
+    were already subscribed may receive the latest message of a topic twice,
+    which is harmless for topics that carry a full state.
+
+    Args:
+        frontend (zmq.Socket[bytes]): The XSUB socket receiving from the publishers.
+        backend (zmq.Socket[bytes]): The XPUB socket sending to the subscribers.
+        control (zmq.Socket[bytes]): The socket receiving the `TERMINATE` command.
+        cache (LastValueCache | None, optional): The last value cache. Defaults to None.
+        statistics (ProxyStatistics | None, optional): The traffic counters.
+            Defaults to None.
+        max_batch (int, optional): The most messages forwarded per socket and wakeup.
+            Defaults to `DEFAULT_MAX_BATCH`.
+
+    """
+    if cache is None and statistics is None:
+        zmq.proxy_steerable(frontend, backend, control=control)
+        return
+
+    if cache is not None:
+        frontend.send(bytes([SUBSCRIBE]))
+
+    poller = zmq.Poller()
+    poller.register(frontend, zmq.POLLIN)
+    poller.register(backend, zmq.POLLIN)
+    poller.register(control, zmq.POLLIN)
+
+    timeout = None if statistics is None else statistics.interval
+    while True:
+        events = dict(poller.poll(timeout))
+
+        if control in events and control.recv() == TERMINATE:
+            return
+
+        if frontend in events:
+            _forward_messages(frontend, backend, cache, statistics, max_batch)
+
+        if backend in events:
+            _forward_subscriptions(frontend, backend, cache, statistics, max_batch)
+
+        if statistics is not None:
+            timeout = statistics.until_next_sample()
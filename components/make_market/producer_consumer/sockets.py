@@ -0,0 +1,108 @@
+import threading
+from collections.abc import Callable, Hashable
+
+import zmq
+import zmq.asyncio
+from make_market.log.core import get_logger
+from make_market.settings.models import ZeroMQSettings
+
+logger = get_logger(__name__)
+
+
+class SocketManager:
+    """
+    SocketManager creates, configures and owns the ZeroMQ sockets of a process.
+
+    ZeroMQ sockets are not thread safe, so sockets are cached per role and
+    thread: asking twice for the same role from the same thread returns the
+    same socket, asking from another thread creates that thread's own socket.
+    Every socket gets the high water marks, linger and kernel buffer sizes of
+    the settings before it is bound or connected.
+
+    The asynchronous context shadows the synchronous one, so sync and async
+    sockets share one I/O thread pool and can talk over `inproc://`.
+
+    Attributes:
+        context (zmq.Context): The context of the synchronous sockets.
+        async_context (zmq.asyncio.Context): The context of the asynchronous sockets.
+        settings (ZeroMQSettings): The socket options.
+
+    """
+
+    def __init__(
+        self, context: zmq.Context | None = None, settings: ZeroMQSettings | None = None
+    ) -> None:
+        self.context = zmq.Context() if context is None else context
+        self.async_context = zmq.asyncio.Context.shadow(self.context)
+        self.settings = ZeroMQSettings() if settings is None else settings
+
+        self._sockets: dict[tuple[Hashable, int], zmq.Socket] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._sockets)
+
+    def configure(self, socket: zmq.Socket) -> zmq.Socket:
+        """
+        Apply the socket options of the settings.
+
+        Args:
+            socket (zmq.Socket): A socket that is not bound or connected yet.
+
+        Returns:
+            zmq.Socket: The same socket.
+
+        """
+        socket.setsockopt(zmq.SNDHWM, self.settings.SNDHWM)
+        socket.setsockopt(zmq.RCVHWM, self.settings.RCVHWM)
+        socket.setsockopt(zmq.LINGER, self.settings.LINGER)
+        socket.setsockopt(zmq.SNDBUF, self.settings.SNDBUF)
+        socket.setsockopt(zmq.RCVBUF, self.settings.RCVBUF)
+        return socket
+
+    def socket(
+        self,
+        role: Hashable,
+        socket_type: int,
+        setup: Callable[[zmq.Socket], None],
+        *,
+        asynchronous: bool = False,
+    ) -> zmq.Socket:
+        """
+        Get the socket of a role for the calling thread, creating it on first use.
+
+        Args:
+            role (Hashable): The role of the socket, e.g. `"publisher"`.
+            socket_type (int): The ZeroMQ socket type, e.g. `zmq.PUB`.
+            setup (Callable[[zmq.Socket], None]): Binds, connects and subscribes
+                the configured socket.
+            asynchronous (bool, optional): Create the socket in the asynchronous
+                context. Defaults to False.
+
+        Returns:
+            zmq.Socket: The socket of the role for this thread.
+
+        """
+        key = (role, threading.get_ident())
+        with self._lock:
+            socket = self._sockets.get(key)
+            if socket is None:
+                context = self.async_context if asynchronous else self.context
+                socket = self.configure(context.socket(socket_type))
+                setup(socket)
+                self._sockets[key] = socket
+                logger.debug("Created %s socket for thread %s.", role, key[1])
+        return socket
+
+    def close(self) -> None:
+        """
+        Close every socket created by the manager.
+
+        The threads using the sockets must have stopped using them. Pending
+        outgoing messages are kept for the configured linger time.
+        """
+        with self._lock:
+            sockets, self._sockets = self._sockets, {}
+        for socket in sockets.values():
+            socket.close()
+        logger.debug("Closed %d sockets.", len(sockets))
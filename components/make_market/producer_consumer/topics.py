@@ -0,0 +1,118 @@
+from collections.abc import Iterable
+from enum import StrEnum
+from urllib.parse import unquote
+
+TOPIC_SEPARATOR = "/"
+ALL_SYMBOLS = "*"
+DEFAULT_EXCHANGE = "FX"
+
+# the separator inside a symbol is percent-escaped, so a symbol is always one part
+_ESCAPED_SEPARATOR = "%2F"
+
+
+class MessageType(StrEnum):
+    """Enumeration of the message types published on the bus, the last part of a topic."""
+
+    QUOTE = "quote"
+    FRAME = "frame"
+    DELTA = "delta"
+    PACKED = "packed"
+
+
+def _escape(part: str) -> str:
+    return part.replace("%", "%25").replace(TOPIC_SEPARATOR, _ESCAPED_SEPARATOR)
+
+
+def topic(exchange: str, symbol: str, message_type: MessageType) -> bytes:
+    """
+    Build the topic frame of a message.
+
+    Topics read `exchange/symbol/message-type/`, e.g. `FX/EUR%2FUSD/quote/`.
+    ZeroMQ matches subscriptions as byte prefixes, so `FX/` selects an
+    exchange and `FX/EUR%2FUSD/` a symbol. The separator and `%` are
+    percent-escaped inside the exchange and the symbol, so the prefix of
+    `EUR` never matches the topics of `EUR/USD`. Messages that carry many
+    symbols, like a `QuoteFrame`, are published under the symbol `ALL_SYMBOLS`.
+
+    Args:
+        exchange (str): The exchange of the message.
+        symbol (str): The symbol of the message, which may contain the separator.
+        message_type (MessageType): The type of the message.
+
+    Returns:
+        bytes: The topic.
+
+    """
+    return f"{symbol_prefix(exchange, symbol)}{message_type}{TOPIC_SEPARATOR}".encode()
+
+
+def symbol_prefix(exchange: str, symbol: str) -> str:
+    """
+    Build the topic prefix of every message of one symbol.
+
+    Args:
+        exchange (str): The exchange of the symbol.
+        symbol (str): The symbol.
+
+    Returns:
+        str: The prefix, e.g. `FX/EUR%2FUSD/`.
+
+    """
+    return f"{_escape(exchange)}{TOPIC_SEPARATOR}{_escape(symbol)}{TOPIC_SEPARATOR}"
+
+
+def parse_topic(value: bytes) -> tuple[str, str, MessageType]:
+    """
+    Split a topic into its parts.
+
+    Args:
+        value (bytes): The topic, as built by `topic`.
+
+    Returns:
+        tuple[str, str, MessageType]: The exchange, the symbol and the message type.
+
+    Raises:
+        ValueError: If the topic does not have the three parts.
+
+    """
+    exchange, _, rest = value.decode().partition(TOPIC_SEPARATOR)
+    symbol, _, rest = rest.partition(TOPIC_SEPARATOR)
+    message_type, _, rest = rest.partition(TOPIC_SEPARATOR)
+    if not (exchange and symbol and message_type) or rest:
+        msg = f"not a topic: {value!r}"
+        raise ValueError(msg)
+    return unquote(exchange), unquote(symbol), MessageType(message_type)
+
+
+def subscription_prefixes(
+    symbols: Iterable[str] | None = None,
+    prefixes: Iterable[str | bytes] | None = None,
+    exchange: str = DEFAULT_EXCHANGE,
+) -> list[bytes]:
+    """
+    Build the subscriptions of a subscriber.
+
+    Args:
+        symbols (Iterable[str] | None, optional): Receive every message of these
+            symbols, and the messages that carry all symbols. Defaults to None.
+        prefixes (Iterable[str | bytes] | None, optional): Receive the messages
+            whose topic starts with one of these prefixes. Defaults to None.
+        exchange (str, optional): The exchange of the symbols. Defaults to "FX".
+
+    Returns:
+        list[bytes]: The subscriptions, `[b""]`, i.e. everything, if neither
+        symbols nor prefixes are given.
+
+    """
+    subscriptions = [
+        prefix if isinstance(prefix, bytes) else prefix.encode()
+        for prefix in prefixes or ()
+    ]
+    if symbols is not None:
+        subscriptions += [
+            symbol_prefix(exchange, symbol).encode()
+            for symbol in [*symbols, ALL_SYMBOLS]
+        ]
+    if symbols is None and prefixes is None:
+        subscriptions.append(b"")
+    return list(dict.fromkeys(subscriptions))
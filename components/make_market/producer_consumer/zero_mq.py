@@ -1,10 +1,29 @@
 # Publisher thread
+import uuid
+from collections.abc import Iterable
 from threading import Thread
-from typing import Final
+from typing import Final, cast
 
 import zmq
 import zmq.asyncio
 from make_market.log.core import get_logger
+from make_market.producer_consumer.conflation import (
+    AsyncConflatingSubscriber,
+    ConflatingSubscriber,
+)
+from make_market.producer_consumer.proxy import (
+    DEFAULT_STATISTICS_INTERVAL,
+    TERMINATE,
+    LastValueCache,
+    ProxyStatistics,
+    run_proxy,
+)
+from make_market.producer_consumer.sockets import SocketManager
+from make_market.producer_consumer.topics import (
+    DEFAULT_EXCHANGE,
+    subscription_prefixes,
+)
+from make_market.settings.models import Settings, ZeroMQSettings
 
 PUBLISHER_THROTTHLE: Final[float] = 1
 
@@ -15,10 +34,48 @@ logger = get_logger(__name__)
 class PubSubWithZeroMQ:
     """
     A class to handle publish-subscribe messaging using ZeroMQ.
+
+    The proxy forwards messages from publishers bound to `in_address` to
+    subscribers connected to `out_address`. Publishers and subscribers get
+    their sockets from a `SocketManager`, one per role and thread. With
+    `inproc`, the default, the proxy runs in this process, `start` must be
+    called, and the sockets reach it over `inproc://` endpoints, so every
+    thread has its own socket on the same fan-out device. Without it, the
+    instance is a client of a proxy started by another process: publishers
+    bind `in_address` and subscribers connect to `out_address`, so only one
+    thread of the process can publish.
+
+    With `last_value_cache`, the proxy keeps the latest message of every
+    topic and replays the matching ones to each new subscription, so a
+    consumer that (re)connects gets every symbol at once. With
+    `statistics_address`, the proxy counts the messages, bytes and
+    subscriptions per topic and publishes a sample of the rates on that
+    address every `statistics_interval` milliseconds.
+
+    Attributes:
+        in_address (str): The address remote publishers bind to.
+        out_address (str): The address remote subscribers connect to.
+        inproc (bool): Whether the sockets reach the proxy of this process over
+            the inproc addresses.
+        local_in_address (str): The inproc address of the proxy frontend.
+        local_out_address (str): The inproc address of the proxy backend.
+        sockets (SocketManager): The sockets of this process.
+        last_value_cache (LastValueCache | None): The cache of the proxy, if any.
+        statistics (ProxyStatistics | None): The traffic counters of the running
+            proxy, if instrumented.
+
     """
 
-    def __init__(
-        self, in_address: str = "ipc://frontend", out_address: str = "ipc://backend"
+    def __init__(  # noqa: PLR0913
+        self,
+        in_address: str = "ipc://frontend",
+        out_address: str = "ipc://backend",
+        settings: ZeroMQSettings | None = None,
+        *,
+        inproc: bool = True,
+        last_value_cache: bool = False,
+        statistics_address: str | None = None,
+        statistics_interval: int = DEFAULT_STATISTICS_INTERVAL,
     ) -> None:
         logger.info(
             "Initializing ZeroMQ context with in_address: %s and out_address: %s",
@@ -28,9 +85,23 @@ class PubSubWithZeroMQ:
 
         self.in_address = in_address
         self.out_address = out_address
+        self.inproc = inproc
+
+        instance = uuid.uuid4().hex
+        self.local_in_address = f"inproc://frontend-{instance}"
+        self.local_out_address = f"inproc://backend-{instance}"
+        self._control_address = f"inproc://control-{instance}"
 
-        self.context = zmq.Context()
-        self.async_context = zmq.asyncio.Context.instance()
+        self.sockets = SocketManager(
+            settings=Settings().zero_mq if settings is None else settings
+        )
+        self.context = self.sockets.context
+        self.async_context = self.sockets.async_context
+        self.proxy_thread: Thread | None = None
+        self.last_value_cache = LastValueCache() if last_value_cache else None
+        self.statistics_address = statistics_address
+        self.statistics_interval = statistics_interval
+        self.statistics: ProxyStatistics | None = None
 
     def start(self) -> None:
         """
@@ -44,58 +115,87 @@ class PubSubWithZeroMQ:
 
     def stop(self) -> None:
         """
-        Stops the ZeroMQ proxy by joining the proxy thread and destroying the contexts.
+        Stops the ZeroMQ proxy, closes every socket and terminates the context.
 
-        This method ensures that the proxy thread is properly terminated and that
-        the ZeroMQ contexts are cleaned up to release any resources held by them.
+        The proxy is told to terminate over its control socket and joined, so
+        it has closed its sockets before the sockets handed out by the
+        `SocketManager` are closed. The threads using those sockets must have
+        stopped using them.
         """
-        logger.info("Stopping ZeroMQ proxy thread.")
-        self.proxy_thread.join(1)
-
-        logger.info("Closing synchronous sockets and destroying context.")
-        self.publisher_socket.close()
-        self.subscriber_socket.close()
-        self.context.destroy()
-
-        logger.info("Closing async sockets and destroying context.")
-        self.async_publisher_socket.close()
-        self.async_subscriber_socket.close()
-        self.async_context.destroy()
+        if self.proxy_thread is not None:
+            logger.info("Stopping ZeroMQ proxy thread.")
+            control = self.sockets.configure(self.context.socket(zmq.PAIR))
+            control.connect(self._control_address)
+            control.send(TERMINATE)
+            # closing with no linger could drop the command before delivery
+            self.proxy_thread.join()
+            control.close()
+            self.proxy_thread = None
+
+        logger.info("Closing sockets and terminating context.")
+        self.sockets.close()
+        self.context.destroy(linger=self.sockets.settings.LINGER)
 
         logger.info("ZeroMQ stopped.")
 
     def setup_proxy(self) -> None:
         """
-        Sets up a ZeroMQ proxy with an interrupt handler.
+        Sets up a ZeroMQ proxy with a control socket.
 
         This method initializes two ZeroMQ sockets: one for incoming messages (XSUB)
-        and one for outgoing messages (XPUB). It connects the incoming socket to the
-        frontend address and binds the outgoing socket to the backend address.
+        and one for outgoing messages (XPUB). The incoming socket connects to the
+        frontend address and the outgoing socket binds to the backend address,
+        and both also bind an inproc address for the sockets of this process.
 
-        A separate thread is started to run the proxy with an interrupt handler that
-        catches a KeyboardInterrupt and logs an interruption message.
+        A separate thread runs the proxy until `stop` sends it the terminate
+        command, and then closes the proxy sockets. With a last value cache
+        or statistics, the outgoing socket is verbose, so the proxy sees
+        every subscription, to answer it with a replay or count it.
 
         Raises:
             zmq.ZMQError: If there is an error in creating or binding the sockets.
 
         """
-        in_proxy = self.context.socket(zmq.XSUB)
+        in_proxy = self.sockets.configure(self.context.socket(zmq.XSUB))
         in_proxy.connect(self.in_address)
+        in_proxy.bind(self.local_in_address)
 
-        out_proxy = self.context.socket(zmq.XPUB)
+        out_proxy = self.sockets.configure(self.context.socket(zmq.XPUB))
+        if self.last_value_cache is not None or self.statistics_address is not None:
+            out_proxy.setsockopt(zmq.XPUB_VERBOSE, 1)
         out_proxy.bind(self.out_address)
-
-        def _proxy_with_interrupt(
-            in_proxy: zmq.Socket[bytes], out_proxy: zmq.Socket[bytes]
+        out_proxy.bind(self.local_out_address)
+
+        control = self.sockets.configure(self.context.socket(zmq.PAIR))
+        control.bind(self._control_address)
+
+        sockets = [in_proxy, out_proxy, control]
+        if self.statistics_address is not None:
+            statistics_socket = self.sockets.configure(self.context.socket(zmq.PUB))
+            statistics_socket.bind(self.statistics_address)
+            sockets.append(statistics_socket)
+            self.statistics = ProxyStatistics(
+                statistics_socket, interval=self.statistics_interval
+            )
+
+        def _proxy_with_control(
+            in_proxy: zmq.Socket[bytes],
+            out_proxy: zmq.Socket[bytes],
+            control: zmq.Socket[bytes],
         ) -> None:
             try:
-                zmq.proxy(in_proxy, out_proxy)
+                run_proxy(
+                    in_proxy, out_proxy, control, self.last_value_cache, self.statistics
+                )
             except KeyboardInterrupt:
                 logger.info("Interrupted")
+            finally:
+                for socket in sockets:
+                    socket.close()
 
         logger.info("Starting ZeroMQ proxy thread.")
         self.proxy_thread = Thread(
-            target=_proxy_with_interrupt, args=(in_proxy, out_proxy)
+            target=_proxy_with_control, args=(in_proxy, out_proxy, control)
         )
         self.proxy_thread.start()
         logger.info("ZeroMQ proxy started.")
@@ -103,69 +203,206 @@ class PubSubWithZeroMQ:
     @property
     def async_publisher_socket(self) -> zmq.asyncio.Socket:
         """
-        Creates and returns an asynchronous ZeroMQ publisher socket.
+        Returns the asynchronous ZeroMQ publisher socket of the calling thread.
 
-        This method initializes a PUB socket using the asynchronous context,
-        binds it to the frontend address, and returns the socket.
+        The PUB socket is created in the asynchronous context and connected
+        to the proxy frontend on first use, or bound to `in_address` without
+        `inproc`.
 
         Returns:
-            zmq.asyncio.Socket: The initialized and bound PUB socket.
+            zmq.asyncio.Socket: The connected PUB socket.
 
         """
-        publisher = self.async_context.socket(zmq.PUB)
-        publisher.bind(self.in_address)
-
-        return publisher
+        return cast(
+            "zmq.asyncio.Socket",
+            self.sockets.socket(
+                "async_publisher", zmq.PUB, self._publish, asynchronous=True
+            ),
+        )
 
     @property
     def async_subscriber_socket(self) -> zmq.asyncio.Socket:
         """
-        Creates and returns an asynchronous ZeroMQ subscriber socket.
+        Returns the asynchronous ZeroMQ subscriber socket of the calling thread.
 
-        The socket is connected to the backend address specified by BACKEND_ADDR
-        and subscribes to all messages.
+        The socket is connected to the proxy backend and subscribes to all messages.
 
         Returns:
             zmq.asyncio.Socket: An asynchronous ZeroMQ subscriber socket.
 
         """
-        subscriber = self.async_context.socket(zmq.SUB)
-        subscriber.connect(self.out_address)
-        subscriber.setsockopt_string(zmq.SUBSCRIBE, "")
+        return self.async_topic_subscriber_socket()
+
+    def async_topic_subscriber_socket(
+        self,
+        symbols: Iterable[str] | None = None,
+        prefixes: Iterable[str | bytes] | None = None,
+        exchange: str = DEFAULT_EXCHANGE,
+    ) -> zmq.asyncio.Socket:
+        """
+        Returns the asynchronous ZeroMQ subscriber socket of some topics for the calling thread.
+
+        The subscriptions are forwarded through the proxy to the publishers,
+        so the messages of other topics are filtered out by ZeroMQ before
+        they reach this process.
 
-        return subscriber
+        Args:
+            symbols (Iterable[str] | None, optional): Receive every message of these
+                symbols. Defaults to None.
+            prefixes (Iterable[str | bytes] | None, optional): Receive the messages
+                whose topic starts with one of these prefixes. Defaults to None.
+            exchange (str, optional): The exchange of the symbols. Defaults to "FX".
+
+        Returns:
+            zmq.asyncio.Socket: An asynchronous ZeroMQ subscriber socket, receiving
+            everything if neither symbols nor prefixes are given.
+
+        """
+        subscriptions = tuple(subscription_prefixes(symbols, prefixes, exchange))
+        return cast(
+            "zmq.asyncio.Socket",
+            self.sockets.socket(
+                ("async_subscriber", subscriptions),
+                zmq.SUB,
+                lambda socket: self._subscribe(socket, subscriptions),
+                asynchronous=True,
+            ),
+        )
 
     @property
     def publisher_socket(self) -> zmq.Socket[bytes]:
         """
-        Creates and returns a ZeroMQ publisher socket.
+        Returns the ZeroMQ publisher socket of the calling thread.
 
-        This method initializes a ZeroMQ PUB socket, binds it to the frontend
-        address specified by `self.FRONTEND_ADDR`, and returns the socket.
+        The PUB socket is connected to the proxy frontend on first use, or
+        bound to `in_address` without `inproc`.
 
         Returns:
-            zmq.Socket[bytes]: A ZeroMQ PUB socket bound to the frontend address.
+            zmq.Socket[bytes]: The connected PUB socket.
 
         """
-        publisher = self.context.socket(zmq.PUB)
-        publisher.bind(self.in_address)
-
-        return publisher
+        return self.sockets.socket("publisher", zmq.PUB, self._publish)
 
     @property
     def subscriber_socket(self) -> zmq.Socket[bytes]:
         """
-        Creates and returns a ZeroMQ subscriber socket.
+        Returns the ZeroMQ subscriber socket of the calling thread.
 
-        The subscriber socket connects to the backend address specified by
-        `self.BACKEND_ADDR` and subscribes to all messages.
+        The subscriber socket connects to the proxy backend and subscribes to
+        all messages.
 
         Returns:
             zmq.Socket[bytes]: A ZeroMQ subscriber socket.
 
         """
-        subscriber = self.context.socket(zmq.SUB)
-        subscriber.connect(self.out_address)
-        subscriber.setsockopt_string(zmq.SUBSCRIBE, "")
+        return self.topic_subscriber_socket()
+
+    def topic_subscriber_socket(
+        self,
+        symbols: Iterable[str] | None = None,
+        prefixes: Iterable[str | bytes] | None = None,
+        exchange: str = DEFAULT_EXCHANGE,
+    ) -> zmq.Socket[bytes]:
+        """
+        Returns the ZeroMQ subscriber socket of some topics for the calling thread.
+
+        Args:
+            symbols (Iterable[str] | None, optional): Receive every message of these
+                symbols. Defaults to None.
+            prefixes (Iterable[str | bytes] | None, optional): Receive the messages
+                whose topic starts with one of these prefixes. Defaults to None.
+            exchange (str, optional): The exchange of the symbols. Defaults to "FX".
+
+        Returns:
+            zmq.Socket[bytes]: A ZeroMQ subscriber socket, receiving everything if
+            neither symbols nor prefixes are given.
+
+        """
+        subscriptions = tuple(subscription_prefixes(symbols, prefixes, exchange))
+        return self.sockets.socket(
+            ("subscriber", subscriptions),
+            zmq.SUB,
+            lambda socket: self._subscribe(socket, subscriptions),
+        )
+
+    def conflating_subscriber(
+        self,
+        symbols: Iterable[str] | None = None,
+        prefixes: Iterable[str | bytes] | None = None,
+        exchange: str = DEFAULT_EXCHANGE,
+    ) -> ConflatingSubscriber:
+        """
+        Returns a subscriber that delivers only the newest message of every topic.
+
+        Args:
+            symbols (Iterable[str] | None, optional): Receive every message of these
+                symbols. Defaults to None.
+            prefixes (Iterable[str | bytes] | None, optional): Receive the messages
+                whose topic starts with one of these prefixes. Defaults to None.
+            exchange (str, optional): The exchange of the symbols. Defaults to "FX".
+
+        Returns:
+            ConflatingSubscriber: The conflating subscriber, over a socket of its
+            own, which `stop` closes, so the subscriber must be closed first.
+
+        """
+        return ConflatingSubscriber(
+            self._conflating_socket(symbols, prefixes, exchange)
+        )
+
+    def async_conflating_subscriber(
+        self,
+        symbols: Iterable[str] | None = None,
+        prefixes: Iterable[str | bytes] | None = None,
+        exchange: str = DEFAULT_EXCHANGE,
+    ) -> AsyncConflatingSubscriber:
+        """
+        Returns an asynchronous subscriber that delivers only the newest message of every topic.
+
+        Args:
+            symbols (Iterable[str] | None, optional): Receive every message of these
+                symbols. Defaults to None.
+            prefixes (Iterable[str | bytes] | None, optional): Receive the messages
+                whose topic starts with one of these prefixes. Defaults to None.
+            exchange (str, optional): The exchange of the symbols. Defaults to "FX".
+
+        Returns:
+            AsyncConflatingSubscriber: The conflating subscriber, over an asynchronous
+            socket of its own, which `stop` closes, so the subscriber must be
+            closed first.
+
+        """
+        return AsyncConflatingSubscriber(
+            cast(
+                "zmq.asyncio.Socket",
+                self._conflating_socket(symbols, prefixes, exchange, asynchronous=True),
+            )
+        )
+
+    def _conflating_socket(
+        self,
+        symbols: Iterable[str] | None,
+        prefixes: Iterable[str | bytes] | None,
+        exchange: str,
+        *,
+        asynchronous: bool = False,
+    ) -> zmq.Socket:
+        # a role of its own, so the socket is never shared with the drain thread
+        subscriptions = subscription_prefixes(symbols, prefixes, exchange)
+        return self.sockets.socket(
+            ("conflating_subscriber", uuid.uuid4().hex),
+            zmq.SUB,
+            lambda socket: self._subscribe(socket, subscriptions),
+            asynchronous=asynchronous,
+        )
+
+    def _publish(self, socket: zmq.Socket) -> None:
+        if self.inproc:
+            socket.connect(self.local_in_address)
+        else:
+            socket.bind(self.in_address)
 
-        return subscriber
+    def _subscribe(self, socket: zmq.Socket, subscriptions: Iterable[bytes]) -> None:
+        socket.connect(self.local_out_address if self.inproc else self.out_address)
+        for prefix in subscriptions:
+            socket.setsockopt(zmq.SUBSCRIBE, prefix)
@@ -48,11 +48,35 @@ class VendorWebscoketServerSettings(BaseModel):
 
     Attributes:
         THROTTHLE_INTERVAL (int): The interval in seconds for throttling the websocket server.
+        URL (str): The URL of the websocket server.
+        TIMESTAMP_NS (bool): Send quote timestamps as integer nanoseconds since the
+            Unix epoch instead of ISO strings.
 
     """
 
     THROTTHLE_INTERVAL: int = 1
     URL: str = "ws://localhost:8765"
+    TIMESTAMP_NS: bool = False
+
+
+class ZeroMQSettings(BaseModel):
+    """
+    ZeroMQSettings defines the socket options of the message bus.
+
+    Attributes:
+        SNDHWM (int): The high water mark of outgoing messages per socket.
+        RCVHWM (int): The high water mark of incoming messages per socket.
+        LINGER (int): The time in milliseconds a closed socket keeps sending pending messages.
+        SNDBUF (int): The kernel send buffer size in bytes, -1 for the OS default.
+        RCVBUF (int): The kernel receive buffer size in bytes, -1 for the OS default.
+
+    """
+
+    SNDHWM: int = 10_000
+    RCVHWM: int = 10_000
+    LINGER: int = 0
+    SNDBUF: int = -1
+    RCVBUF: int = -1
 
 
 class Settings(BaseSettings, case_sensitive=False):
@@ -62,6 +86,8 @@ class Settings(BaseSettings, case_sensitive=False):
     Attributes:
         config_database (ConfigDatabaseSettings): Configuration settings for the database.
         quest (QuestDatabaseSettings): Configuration settings for the quest database.
+        vendor_websocket (VendorWebscoketServerSettings): Settings of the vendor websocket server.
+        zero_mq (ZeroMQSettings): Socket options of the message bus.
 
     """
 
@@ -76,5 +102,6 @@ class Settings(BaseSettings, case_sensitive=False):
     config_database: ConfigDatabaseSettings = ConfigDatabaseSettings()
     quest: QuestDatabaseSettings = QuestDatabaseSettings()
     vendor_websocket: VendorWebscoketServerSettings = VendorWebscoketServerSettings()
+    zero_mq: ZeroMQSettings = ZeroMQSettings()
 
     dummy_setting: str = "dummy"
@@ -1,3 +1,3 @@
-from make_market.ws_client.client import WebSocketConnectAsync
+from make_market.ws_client.client import WebSocketConnectAsync, bus_codecs
 
-__all__ = ["WebSocketConnectAsync"]
+__all__ = ["WebSocketConnectAsync", "bus_codecs"]
@@ -1,19 +1,58 @@
 import asyncio
 import json
-from datetime import datetime
+from typing import Any
 
 import websockets
 import zmq.asyncio
+from make_market.clock import now_ns, ns_to_datetime
 from make_market.dict_zip import dict_zip
 from make_market.log.core import get_logger
-from make_market.messaging.schemas import BaseQuote, RawVendorQuote
+from make_market.messaging.codec import QuoteCodec
+from make_market.messaging.deltas import DeltaEncoder, QuoteDeltaCodec
+from make_market.messaging.envelope import EnvelopeCodec, SchemaRegistry
+from make_market.messaging.frames import QuoteFrame, QuoteFrameCodec
+from make_market.messaging.packing import PackedQuote, PackedQuoteCodec
+from make_market.messaging.schemas import BaseQuote
+from make_market.messaging.vendor import parse_vendor_message
 from make_market.producer_consumer.protocols import ProducerProtocol, StartableStopable
-from make_market.settings.models import Settings
+from make_market.producer_consumer.topics import (
+    ALL_SYMBOLS,
+    DEFAULT_EXCHANGE,
+    MessageType,
+    topic,
+)
 from make_market.ws_server.requests_types import Actions, Request
 
 logger = get_logger("ws_client")
 
 
+def bus_codecs(
+    registry: SchemaRegistry | None = None,
+) -> dict[MessageType, EnvelopeCodec[Any]]:
+    """
+    Create the codecs of the payloads published on the bus, by message type.
+
+    Every payload is in Avro single-object encoding, so it carries the
+    fingerprint of the schema it was written with, and consumers on another
+    schema version resolve it with the writer schema from the registry.
+
+    Args:
+        registry (SchemaRegistry | None, optional): The registry of writer schemas.
+            Defaults to the process-wide registry.
+
+    Returns:
+        dict[MessageType, EnvelopeCodec[Any]]: The codec of each message type,
+        decoding the payloads of the topics of that type.
+
+    """
+    return {
+        MessageType.QUOTE: EnvelopeCodec(QuoteCodec(), registry),
+        MessageType.FRAME: EnvelopeCodec(QuoteFrameCodec(), registry),
+        MessageType.DELTA: EnvelopeCodec(QuoteDeltaCodec(), registry),
+        MessageType.PACKED: EnvelopeCodec(PackedQuoteCodec(), registry),
+    }
+
+
 class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
     """
     WebSocketConnectAsync is a class that manages an asynchronous WebSocket connection
@@ -23,11 +62,17 @@ class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
         url (str): The WebSocket URL to connect to.
         websocket (websockets.WebSocketClientProtocol | None): The WebSocket client protocol instance.
         config (dict): Configuration dictionary for symbol subscriptions.
-        publisher_socket (zmq.asyncio.Socket): The ZeroMQ publisher socket for sending messages.
+        publisher_socket (zmq.asyncio.Socket): The ZeroMQ publisher socket for sending messages,
+            as `[topic, payload]` multipart messages, the payloads encoded by `bus_codecs`.
+        frames (bool): Publish one `QuoteFrame` per vendor message instead of one `BaseQuote` per symbol.
+        keyframe_interval (int | None): Publish `QuoteDelta`s with a keyframe every
+            `keyframe_interval` quotes of a symbol instead of full `BaseQuote`s.
+        packed (bool): Publish `PackedQuote`s, with delta-packed level arrays, instead of `BaseQuote`s.
 
     Methods:
-        __init__(url: str, config, publisher_socket: zmq.asyncio.Socket) -> None:
+        __init__(url: str, config, publisher_socket: zmq.asyncio.Socket, frames: bool = False, keyframe_interval: int | None = None, packed: bool = False) -> None:
             Initializes the WebSocketConnectAsync instance with the given URL, configuration, and publisher socket.
+            Raises ValueError if more than one of `frames`, `keyframe_interval` and `packed` is set.
         async _subscribe_to_new_symbol(symbol: str) -> None:
             Subscribes to a new symbol by sending a subscription request over the WebSocket.
         async _unsubscribe_from_symbol(symbol: str) -> None:
@@ -36,6 +81,10 @@ class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
             Sends a message over the WebSocket connection.
         async _receive() -> dict:
             Receives a message from the WebSocket connection and returns it as a dictionary.
+        async _receive_raw() -> str | bytes:
+            Receives a message from the WebSocket connection as the raw frame.
+        async _publish(symbol: str, message_type: MessageType, payload: bytes) -> None:
+            Publishes a payload under the topic of its symbol and message type.
         async _send_receive(message: str) -> dict:
             Sends a message and waits for a response, returning the response as a dictionary.
         async connect() -> None:
@@ -53,11 +102,34 @@ class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
 
     """
 
-    def __init__(self, url: str, config, publisher_socket: zmq.asyncio.Socket) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        url: str,
+        config,
+        publisher_socket: zmq.asyncio.Socket,
+        frames: bool = False,  # noqa: FBT001, FBT002
+        keyframe_interval: int | None = None,
+        packed: bool = False,  # noqa: FBT001, FBT002
+    ) -> None:
+        # each option picks the message type of the bus, only one can apply
+        if sum([frames, keyframe_interval is not None, packed]) > 1:
+            msg = "frames, keyframe_interval and packed are mutually exclusive"
+            raise ValueError(msg)
+
         self.url = url
         self.websocket: websockets.WebSocketClientProtocol | None = None
         self.config = config  # dummy for now
         self.publisher_socket: zmq.asyncio.Socket = publisher_socket
+        self.frames = frames
+        codecs = bus_codecs()
+        self.codec = codecs[MessageType.QUOTE]
+        self.frame_codec = codecs[MessageType.FRAME]
+        self.delta_encoder = (
+            DeltaEncoder(keyframe_interval) if keyframe_interval is not None else None
+        )
+        self.delta_codec = codecs[MessageType.DELTA]
+        self.packed = packed
+        self.packed_codec = codecs[MessageType.PACKED]
 
     async def _subscribe_to_new_symbol(self, symbol: str) -> None:
         request = Request(action=Actions.SUBSCRIBE, symbol=symbol)
@@ -75,10 +147,19 @@ class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
         await self.websocket.send(message)
 
     async def _receive(self) -> dict:
+        return json.loads(await self._receive_raw())
+
+    async def _receive_raw(self) -> str | bytes:
         if self.websocket is None:
             raise ConnectionError("WebSocket is not connected.")
-        response = await self.websocket.recv()
-        return json.loads(response)
+        return await self.websocket.recv()
+
+    async def _publish(
+        self, symbol: str, message_type: MessageType, payload: bytes
+    ) -> None:
+        await self.publisher_socket.send_multipart(
+            [topic(DEFAULT_EXCHANGE, symbol, message_type), payload]
+        )
 
     async def _send_receive(self, message: str) -> dict:
         await self._send(message)
@@ -127,32 +208,65 @@ class WebSocketConnectAsync(ProducerProtocol, StartableStopable):
     async def _main_loop(self):
         try:
             while True:
-                response: dict = await self._receive()
+                response = await self._receive_raw()
+
+                # received timestamp, from the monotonic-anchored wall clock
+                received_ns = now_ns()
+                received_timestamp = ns_to_datetime(received_ns)
 
-                # received timestamp
-                received_timestamp = datetime.datetime.now(tz=Settings().timezone)
+                msg, raw_quotes = parse_vendor_message(
+                    response, price_exponent=-6, size_exponent=-2
+                )
 
                 # TODO: handle message, for now just log it
-                msg = response.pop("message", None)
                 logger.info(f"Received message: {msg}")
 
-                # loop through the response and send it to the publisher socket
-                for symbol, quote in response.items():
-                    serialized_quote = RawVendorQuote.from_raw_vendor_dict(
-                        quote, price_exponent=-6, size_exponent=-2
+                if self.frames:
+                    frame = QuoteFrame.from_raw_vendor_quotes(
+                        raw_quotes,
+                        exchange=DEFAULT_EXCHANGE,
+                        app_id=1,
+                        tick_id=1,
+                        timestamp=received_timestamp,
+                        timestamp_ns=received_ns,
+                    )
+                    await self._publish(
+                        ALL_SYMBOLS, MessageType.FRAME, self.frame_codec.encode(frame)
                     )
+                    continue
 
+                # loop through the response and send it to the publisher socket
+                for symbol, serialized_quote in raw_quotes.items():
                     # enrich the quote with the symbol
                     enriched_quote = BaseQuote.from_raw_vendor_quote(
                         serialized_quote,
                         symbol=symbol,
-                        exchange="FX",
+                        exchange=DEFAULT_EXCHANGE,
                         app_id=1,
                         tick_id=1,
                         timestamp=received_timestamp,
+                        timestamp_ns=received_ns,
                     )
 
-                    await self.publisher_socket.send(enriched_quote.serialize())
+                    if self.delta_encoder is not None:
+                        delta = self.delta_encoder.encode(enriched_quote)
+                        await self._publish(
+                            symbol, MessageType.DELTA, self.delta_codec.encode(delta)
+                        )
+                        continue
+
+                    if self.packed:
+                        packed_quote = PackedQuote.from_quote(enriched_quote)
+                        await self._publish(
+                            symbol,
+                            MessageType.PACKED,
+                            self.packed_codec.encode(packed_quote),
+                        )
+                        continue
+
+                    await self._publish(
+                        symbol, MessageType.QUOTE, self.codec.encode(enriched_quote)
+                    )
 
         except (KeyboardInterrupt, asyncio.exceptions.CancelledError):
             logger.info("KeyboardInterrupt, stopping client")
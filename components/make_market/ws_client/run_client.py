@@ -1,17 +1,22 @@
 import asyncio
 import threading
 
-import zmq
 from make_market.configuration_service import ConfigurationService
+from make_market.producer_consumer.topics import parse_topic
 from make_market.producer_consumer.zero_mq import PubSubWithZeroMQ
 from make_market.settings.models import Settings
-from make_market.ws_client.client import WebSocketConnectAsync
+from make_market.ws_client.client import WebSocketConnectAsync, bus_codecs
 
 
-def _dummy_subscriber(socket: zmq.Socket, sub_id: int) -> None:
+def _dummy_subscriber(ps: PubSubWithZeroMQ, sub_id: int) -> None:
+    # every thread gets its own socket
+    socket = ps.subscriber_socket
+    codecs = bus_codecs()
     while True:
-        message = socket.recv_string()
-        print(f"Subscriber {sub_id} received: {message}")  # noqa: T201
+        topic, payload = socket.recv_multipart()
+        _, _, message_type = parse_topic(topic)
+        message = codecs[message_type].decode(payload, trusted=True)
+        print(f"Subscriber {sub_id} received {topic.decode()}: {message}")  # noqa: T201
 
 
 if __name__ == "__main__":
@@ -20,12 +25,8 @@ if __name__ == "__main__":
     )
     ps.start()
 
-    sub_thread1 = threading.Thread(
-        target=_dummy_subscriber, args=(ps.subscriber_socket, 1)
-    )
-    sub_thread2 = threading.Thread(
-        target=_dummy_subscriber, args=(ps.subscriber_socket, 2)
-    )
+    sub_thread1 = threading.Thread(target=_dummy_subscriber, args=(ps, 1))
+    sub_thread2 = threading.Thread(target=_dummy_subscriber, args=(ps, 2))
 
     sub_thread1.start()
     sub_thread2.start()
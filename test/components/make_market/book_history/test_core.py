@@ -0,0 +1,128 @@
+import datetime
+
+import numpy as np
+import pytest
+from make_market.book_history import BookHistory, BookHistoryStore
+from make_market.messaging import BaseQuote
+from make_market.orderbook import analytics
+
+
+def _append(history: BookHistory, i: int) -> None:
+    history.append(
+        timestamp_ns=i,
+        ask_prices=[100.0 + i, 101.0 + i],
+        ask_sizes=[1.0, 2.0],
+        bid_prices=[99.0 + i],
+        bid_sizes=[3.0],
+    )
+
+
+def test_history_window_before_wrap() -> None:
+    history = BookHistory(capacity=4, depth=3)
+    for i in range(3):
+        _append(history, i)
+
+    window = history.window()
+    assert len(history) == 3
+    assert window.timestamps_ns.tolist() == [0, 1, 2]
+    assert window.books.ask_prices[:, 0].tolist() == [100.0, 101.0, 102.0]
+
+    # missing levels are padded with a NaN price and a size of 0
+    assert np.isnan(window.books.ask_prices[:, 2]).all()
+    assert window.books.bid_sizes[0].tolist() == [3.0, 0.0, 0.0]
+
+
+def test_history_window_after_wrap() -> None:
+    history = BookHistory(capacity=4, depth=2)
+    for i in range(11):
+        _append(history, i)
+
+    assert len(history) == 4
+    assert history.window().timestamps_ns.tolist() == [7, 8, 9, 10]
+    assert history.window(2).timestamps_ns.tolist() == [9, 10]
+    assert history.window(0).timestamps_ns.tolist() == []
+
+
+def test_history_window_is_zero_copy() -> None:
+    history = BookHistory(capacity=4, depth=2)
+    for i in range(6):
+        _append(history, i)
+
+    window = history.window()
+    assert np.shares_memory(window.books.ask_prices, history._ask_prices)  # noqa: SLF001
+    assert window.books.ask_prices.flags.c_contiguous
+
+
+def test_history_window_lifetime() -> None:
+    history = BookHistory(capacity=4, depth=2)
+    for i in range(6):
+        _append(history, i)
+
+    window = history.window(3)
+    _append(history, 6)
+    assert window.timestamps_ns.tolist() == [3, 4, 5]
+
+    # capacity - n appends later the oldest row of the window is overwritten
+    _append(history, 7)
+    assert window.timestamps_ns.tolist() == [7, 4, 5]
+
+    full = history.window()
+    _append(history, 8)
+    assert full.timestamps_ns.tolist() == [8, 5, 6, 7]
+
+
+def test_history_memory_is_flat() -> None:
+    history = BookHistory(capacity=8, depth=5)
+    nbytes = history._ask_prices.nbytes  # noqa: SLF001
+    for i in range(1_000):
+        _append(history, i)
+    assert history._ask_prices.nbytes == nbytes  # noqa: SLF001
+
+
+def test_history_window_feeds_analytics() -> None:
+    history = BookHistory(capacity=4, depth=3)
+    for i in range(5):
+        _append(history, i)
+
+    np.testing.assert_allclose(
+        analytics.mid_prices(history.window().books), [100.5, 101.5, 102.5, 103.5]
+    )
+
+
+def test_history_invalid_window() -> None:
+    history = BookHistory(capacity=4)
+    _append(history, 0)
+
+    with pytest.raises(ValueError, match="window size"):
+        history.window(2)
+
+
+def test_history_store_append_quote() -> None:
+    timestamp = datetime.datetime(2024, 1, 1, tzinfo=datetime.UTC)
+    store = BookHistoryStore(capacity=2, depth=2)
+    for symbol in ["EUR/USD", "GBP/USD", "EUR/USD"]:
+        store.append_quote(
+            BaseQuote(
+                symbol=symbol,
+                exchange="FX",
+                vendor_timestamp=timestamp,
+                timestamp=timestamp,
+                bid_price=[1_099_000, 1_098_000, 1_097_000],
+                ask_price=[1_101_000],
+                price_exponent=-6,
+                bid_size=[150, 250, 350],
+                ask_size=[100],
+                size_exponent=-2,
+                app_id=1,
+                tick_id=1,
+            )
+        )
+
+    assert store.symbols == ["EUR/USD", "GBP/USD"]
+    assert len(store["EUR/USD"]) == 2
+
+    window = store["EUR/USD"].window(1)
+    assert window.timestamps_ns.tolist() == [1_704_067_200_000_000_000]
+    assert window.books.bid_prices.tolist() == [[1.099, 1.098]]
+    assert window.books.bid_sizes.tolist() == [[1.5, 2.5]]
+    assert window.books.ask_sizes.tolist() == [[1.0, 0.0]]
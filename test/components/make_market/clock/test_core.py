@@ -0,0 +1,44 @@
+import datetime
+import time
+
+from make_market.clock import WallClock, datetime_to_ns, now_ns, ns_to_datetime
+
+
+def test_now_ns_is_close_to_system_time() -> None:
+    assert abs(now_ns() - time.time_ns()) < 1_000_000_000
+
+
+def test_wall_clock_is_monotonic(mocker) -> None:
+    clock = WallClock()
+    first = clock.now_ns()
+
+    # a step of the system clock does not move the wall clock
+    mocker.patch("time.time_ns", return_value=0)
+
+    assert clock.now_ns() >= first
+
+
+def test_resync_follows_system_clock(mocker) -> None:
+    clock = WallClock()
+    mocker.patch("time.time_ns", return_value=10**18)
+
+    clock.resync()
+
+    assert 10**18 <= clock.now_ns() < 10**18 + 1_000_000_000
+
+
+def test_datetime_round_trip() -> None:
+    value = datetime.datetime(2024, 10, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC)
+
+    value_ns = datetime_to_ns(value)
+
+    assert value_ns == 1_727_785_815_123_456_000
+    assert ns_to_datetime(value_ns) == value
+    assert ns_to_datetime(value_ns + 999) == value
+
+
+def test_datetime_to_ns_with_timezone() -> None:
+    offset = datetime.timezone(datetime.timedelta(hours=2))
+    value = datetime.datetime(2024, 10, 1, 14, 30, 15, tzinfo=offset)
+
+    assert datetime_to_ns(value) == 1_727_785_815_000_000_000
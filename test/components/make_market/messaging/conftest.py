@@ -0,0 +1,27 @@
+import datetime
+
+import pytest
+from make_market.messaging import BaseQuote
+from make_market.messaging.status import QuoteStatus
+from make_market.settings.models import Settings
+
+
+@pytest.fixture
+def quote() -> BaseQuote:
+    return BaseQuote(
+        symbol="EUR/USD",
+        exchange="FX",
+        vendor_timestamp=datetime.datetime.now(Settings().timezone),
+        timestamp=datetime.datetime.now(Settings().timezone),
+        bid_price=[1_085_000, 1_084_900, 1_084_800],
+        ask_price=[1_085_100, 1_085_200],
+        price_exponent=-6,
+        bid_size=[1_000, 2_000, 3_000],
+        ask_size=[1_500, 2_500],
+        size_exponent=-2,
+        app_id=3,
+        tick_id=2**40 + 17,
+        status=QuoteStatus.CROSSED_PRICE | QuoteStatus.ONE_SIDED,
+        vendor_timestamp_ns=1_727_785_815_123_456_789,
+        timestamp_ns=1_727_785_815_123_457_001,
+    )
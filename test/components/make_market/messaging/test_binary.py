@@ -0,0 +1,105 @@
+import numpy as np
+import pytest
+from make_market.clock import datetime_to_ns, now_ns, ns_to_datetime
+from make_market.messaging.binary import BinaryQuoteCodec, binary_quote_dtype
+from make_market.messaging.schemas import BaseQuote
+from make_market.messaging.status import QuoteStatus
+
+
+@pytest.fixture
+def codec() -> BinaryQuoteCodec:
+    return BinaryQuoteCodec(max_levels=4)
+
+
+def _quote(tick_id: int = 1, n_levels: int = 2) -> BaseQuote:
+    timestamp_ns = now_ns()
+    return BaseQuote(
+        symbol="EUR/USD",
+        exchange="FX",
+        vendor_timestamp=ns_to_datetime(timestamp_ns - 1_500),
+        timestamp=ns_to_datetime(timestamp_ns),
+        bid_price=[1_085_000 - i for i in range(n_levels)],
+        ask_price=[1_085_100 + i for i in range(n_levels)],
+        price_exponent=-6,
+        bid_size=[1_000] * n_levels,
+        ask_size=[1_500] * n_levels,
+        size_exponent=-2,
+        app_id=1,
+        tick_id=tick_id,
+        status=QuoteStatus.MARKET_CLOSED | QuoteStatus.ONE_SIDED,
+        vendor_timestamp_ns=timestamp_ns - 1_500,
+        timestamp_ns=timestamp_ns,
+    )
+
+
+def test_encoded_quote_has_fixed_size(codec: BinaryQuoteCodec) -> None:
+    assert len(codec.encode(_quote(n_levels=1))) == codec.dtype.itemsize
+    assert len(codec.encode(_quote(n_levels=4))) == codec.dtype.itemsize
+
+
+def test_base_quote_binary_round_trip() -> None:
+    quote = _quote()
+
+    data = quote.serialize("binary")
+
+    assert len(data) == binary_quote_dtype().itemsize
+    assert BaseQuote.deserialize(data, "binary") == quote
+
+
+def test_binary_fills_nanoseconds_from_datetimes(codec: BinaryQuoteCodec) -> None:
+    quote = _quote()
+    quote.vendor_timestamp_ns = quote.timestamp_ns = 0
+
+    fields = codec.decode_fields(codec.encode(quote))
+
+    assert fields["timestamp"] == quote.timestamp
+    assert fields["timestamp_ns"] == datetime_to_ns(quote.timestamp)
+
+
+def test_base_quote_avro_is_unchanged() -> None:
+    quote = _quote()
+
+    assert BaseQuote.deserialize(quote.serialize()) == quote
+
+
+def test_view_reads_columns_without_copying(codec: BinaryQuoteCodec) -> None:
+    data = b"".join(codec.encode(_quote(tick_id=i, n_levels=i)) for i in range(1, 4))
+
+    records = codec.view(data)
+
+    assert records.shape == (3,)
+    assert records["tick_id"].tolist() == [1, 2, 3]
+    assert records["n_bids"].tolist() == [1, 2, 3]
+    assert records["bid_price"][2, :3].tolist() == [1_085_000, 1_084_999, 1_084_998]
+    assert records["bid_price"][0, 1:].tolist() == [0, 0, 0]
+    assert not records.flags.writeable
+    assert np.shares_memory(records, np.frombuffer(data, dtype=np.uint8))
+
+
+def test_encode_rejects_too_many_levels(codec: BinaryQuoteCodec) -> None:
+    with pytest.raises(ValueError, match="levels"):
+        codec.encode(_quote(n_levels=5))
+
+
+def test_encode_rejects_long_symbol(codec: BinaryQuoteCodec) -> None:
+    quote = _quote()
+    quote.symbol = "X" * 17
+
+    with pytest.raises(ValueError, match="longer than"):
+        codec.encode(quote)
+
+
+def test_view_rejects_other_layouts(codec: BinaryQuoteCodec) -> None:
+    data = codec.encode(_quote())
+
+    with pytest.raises(ValueError, match="multiple"):
+        codec.view(data[:-1])
+    with pytest.raises(ValueError, match="layout"):
+        BinaryQuoteCodec(max_levels=4).view(b"\x00" * len(data))
+
+
+def test_decode_fields_expects_one_quote(codec: BinaryQuoteCodec) -> None:
+    data = codec.encode(_quote())
+
+    with pytest.raises(ValueError, match="one quote"):
+        codec.decode_fields(data * 2)
@@ -0,0 +1,29 @@
+import pytest
+from make_market.messaging import BaseQuote, QuoteCodec
+from make_market.messaging.status import QuoteStatus
+
+
+@pytest.fixture
+def codec() -> QuoteCodec:
+    return QuoteCodec()
+
+
+def test_encode_matches_serialize(codec: QuoteCodec, quote: BaseQuote) -> None:
+    assert codec.encode(quote) == quote.serialize()
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_decode_round_trip(codec: QuoteCodec, quote: BaseQuote, trusted: bool) -> None:
+    decoded = codec.decode(codec.encode(quote), trusted=trusted)
+
+    assert decoded == quote
+    assert isinstance(decoded.status, QuoteStatus)
+    assert decoded.status == quote.status
+
+
+def test_decode_matches_deserialize(codec: QuoteCodec) -> None:
+    fake_quote = BaseQuote.fake(status=QuoteStatus(0))
+    data = fake_quote.serialize()
+
+    assert codec.decode(data) == BaseQuote.deserialize(data)
+    assert codec.decode(data, trusted=True) == BaseQuote.deserialize(data)
@@ -1,9 +1,15 @@
+import json
 from decimal import Decimal
 
+import numpy as np
 import pytest
 from make_market.messaging.decimals import (
     decimal_from_int_number_with_exponent,
+    decimal_text_to_digits,
+    digits_to_decimals,
+    digits_to_floats,
     float_to_digits_with_precision,
+    floats_to_digits_with_precision,
 )
 
 
@@ -20,12 +26,89 @@ from make_market.messaging.decimals import (
         (-0.000123, -6, -123),
         (1000.0, 0, 1000),
         (0.0, 0, 0),
+        (250.0, 2, 2),
+        (-151.0, 2, -2),
     ],
 )
 def test_float_to_int_with_precision(
     value: float, exponent: int, expected: int
 ) -> None:
     assert float_to_digits_with_precision(value, exponent) == expected
+    assert floats_to_digits_with_precision([value], exponent).tolist() == [expected]
+
+
+def _decimal_digits(values: np.ndarray, exponent: int) -> list[int]:
+    return [float_to_digits_with_precision(v, exponent) for v in values.tolist()]
+
+
+@pytest.mark.parametrize("exponent", [-8, -6, -4, -2, 0, 2])
+def test_floats_to_digits_matches_decimal_on_random_prices(exponent: int) -> None:
+    rng = np.random.default_rng(exponent + 100)
+    values = np.concatenate(
+        [
+            rng.uniform(-2.0, 2.0, 20_000),
+            rng.uniform(0.0, 100_000.0, 20_000),
+            10.0 ** rng.uniform(-8.0, 8.0, 20_000),
+        ]
+    )
+
+    digits = floats_to_digits_with_precision(values, exponent)
+
+    assert digits.tolist() == _decimal_digits(values, exponent)
+
+
+@pytest.mark.parametrize("exponent", [-6, -3, -2, -1])
+def test_floats_to_digits_matches_decimal_near_ties(exponent: int) -> None:
+    rng = np.random.default_rng(-exponent)
+    # decimal ties such as 1.0005 at -3 and their float neighbours
+    ties = (rng.integers(-(10**7), 10**7, 5_000) + 0.5) * 10.0**exponent
+    values = np.concatenate(
+        [ties, np.nextafter(ties, np.inf), np.nextafter(ties, -np.inf)]
+    )
+
+    digits = floats_to_digits_with_precision(values, exponent)
+
+    assert digits.tolist() == _decimal_digits(values, exponent)
+
+
+def test_floats_to_digits_matches_decimal_on_exact_halves() -> None:
+    values = np.array([0.5, 1.5, 2.5, -0.5, -1.5, -2.5, 2.0**52 + 1.0, 2.0**53])
+
+    digits = floats_to_digits_with_precision(values, 0)
+
+    assert digits.tolist() == [0, 2, 2, 0, -2, -2, 2**52 + 1, 2**53]
+    assert digits.tolist() == _decimal_digits(values, 0)
+
+
+def test_floats_to_digits_keeps_shape() -> None:
+    digits = floats_to_digits_with_precision([[1.0, 2.0], [3.0, 4.0]], -2)
+
+    assert digits.dtype == np.int64
+    assert digits.tolist() == [[100, 200], [300, 400]]
+    assert floats_to_digits_with_precision([], -2).shape == (0,)
+
+
+def test_floats_to_digits_rejects_non_finite_values() -> None:
+    with pytest.raises(ValueError, match="finite"):
+        floats_to_digits_with_precision([1.0, float("nan")], -2)
+
+
+@pytest.mark.parametrize(
+    ("values", "exponent"),
+    [([1.0, 1e12], -8), ([2.0**63], 0), ([-1e19], 0), ([1.5], -30)],
+)
+def test_floats_to_digits_rejects_values_outside_int64(
+    values: list[float], exponent: int
+) -> None:
+    with pytest.raises(OverflowError, match="int64"):
+        floats_to_digits_with_precision(values, exponent)
+
+
+def test_floats_to_digits_accepts_int64_bounds() -> None:
+    assert floats_to_digits_with_precision([-(2.0**63)], 0).tolist() == [-(2**63)]
+    assert floats_to_digits_with_precision([9.2e10], -8).tolist() == [
+        9_200_000_000_000_000_000
+    ]
 
 
 @pytest.mark.parametrize(
@@ -47,3 +130,64 @@ def test_decimal_from_int_number_with_exponent(
     number: int, exponent: int, expected: Decimal
 ) -> None:
     assert decimal_from_int_number_with_exponent(number, exponent) == expected
+
+
+@pytest.mark.parametrize(
+    ("text", "exponent", "expected"),
+    [
+        ("1.005", -3, 1005),
+        ("1.0005", -3, 1000),
+        ("1.0015", -3, 1002),
+        ("-1.0015", -3, -1002),
+        ("123.456", -2, 12346),
+        ("12", -2, 1200),
+        ("-0.000123", -6, -123),
+        ("1e-05", -6, 10),
+        ("1.5E+3", 0, 1500),
+        ("250", 2, 2),
+        ("0.0", -4, 0),
+    ],
+)
+def test_decimal_text_to_digits(text: str, exponent: int, expected: int) -> None:
+    assert decimal_text_to_digits(text, exponent) == expected
+
+
+@pytest.mark.parametrize("exponent", [-8, -6, -2, 0])
+def test_decimal_text_to_digits_matches_decimal(exponent: int) -> None:
+    rng = np.random.default_rng(-exponent)
+    values = np.concatenate(
+        [rng.uniform(-1_000.0, 1_000.0, 5_000), 10.0 ** rng.uniform(-9.0, 6.0, 5_000)]
+    )
+    quantum = Decimal(1).scaleb(exponent)
+
+    for value in values.tolist():
+        text = json.dumps(value)
+        expected = int(Decimal(text).quantize(quantum).scaleb(-exponent))
+        assert decimal_text_to_digits(text, exponent) == expected
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["", "-", "abc", "1.2.3", "nan", "1e", "1e+", "1e--5", "--1", "+-1", "1.-5", "²"],
+)
+def test_decimal_text_to_digits_rejects_non_numbers(text: str) -> None:
+    with pytest.raises(ValueError, match="decimal number"):
+        decimal_text_to_digits(text, -2)
+
+
+@pytest.mark.parametrize("exponent", [-30, -8, -6, -2, 0, 3, 25])
+def test_digits_to_floats_and_decimals(exponent: int) -> None:
+    digits = [1_085_125, -3, 0, 2**53 + 1]
+
+    floats = digits_to_floats(digits, exponent)
+    decimals = digits_to_decimals(np.asarray(digits, dtype=np.int64), exponent)
+
+    expected = [decimal_from_int_number_with_exponent(d, exponent) for d in digits]
+    assert decimals == expected
+    assert floats.dtype == np.float64
+    assert floats.tolist() == pytest.approx([float(d) for d in expected], rel=1e-15)
+
+
+def test_digits_to_floats_rounds_once() -> None:
+    # 10.0 ** -6 is inexact, so multiplying by it would round twice
+    assert digits_to_floats([1_085_125], -6)[0] == float(Decimal("1.085125"))
@@ -0,0 +1,189 @@
+import random
+
+import pytest
+from make_market.clock import now_ns, ns_to_datetime
+from make_market.messaging import (
+    BaseQuote,
+    DeltaDecoder,
+    DeltaEncoder,
+    QuoteCodec,
+    QuoteDelta,
+    QuoteDeltaCodec,
+)
+from make_market.messaging.status import QuoteStatus
+
+
+def _quote(
+    bids: list[tuple[int, int]],
+    asks: list[tuple[int, int]],
+    symbol: str = "EUR/USD",
+    tick_id: int = 1,
+) -> BaseQuote:
+    timestamp_ns = now_ns()
+    return BaseQuote(
+        symbol=symbol,
+        exchange="FX",
+        vendor_timestamp=ns_to_datetime(timestamp_ns),
+        timestamp=ns_to_datetime(timestamp_ns),
+        bid_price=[p for p, _ in bids],
+        ask_price=[p for p, _ in asks],
+        price_exponent=-6,
+        bid_size=[s for _, s in bids],
+        ask_size=[s for _, s in asks],
+        size_exponent=-2,
+        app_id=1,
+        tick_id=tick_id,
+        vendor_timestamp_ns=timestamp_ns,
+        timestamp_ns=timestamp_ns,
+    )
+
+
+def _random_walk(rng: random.Random, n_quotes: int, depth: int) -> list[BaseQuote]:
+    mid = 1_085_000
+    bids = {mid - 10 * (i + 1): 1_000 for i in range(depth)}
+    asks = {mid + 10 * (i + 1): 1_000 for i in range(depth)}
+    quotes = []
+    for tick_id in range(n_quotes):
+        for _ in range(rng.randint(1, 3)):
+            levels = rng.choice([bids, asks])
+            price = rng.choice(list(levels))
+            action = rng.random()
+            if action < 0.2 and len(levels) > 1:
+                del levels[price]
+            elif action < 0.4:
+                # a new level next to an existing one
+                levels[price + rng.choice([-5, 5])] = rng.randint(1, 50) * 100
+            else:
+                levels[price] = rng.randint(1, 50) * 100
+        quotes.append(
+            _quote(
+                sorted(bids.items(), reverse=True),
+                sorted(asks.items()),
+                tick_id=tick_id,
+            )
+        )
+    return quotes
+
+
+def test_first_quote_is_a_keyframe() -> None:
+    quote = _quote([(100, 5)], [(101, 5)])
+
+    delta = DeltaEncoder().encode(quote)
+
+    assert delta.keyframe
+    assert delta.sequence == 0
+    assert delta.bid_price == [100]
+
+
+def test_delta_carries_only_changed_levels() -> None:
+    encoder = DeltaEncoder()
+    encoder.encode(_quote([(100, 5), (99, 5)], [(101, 5), (102, 5)]))
+
+    delta = encoder.encode(_quote([(100, 7), (99, 5)], [(102, 5), (103, 2)]))
+
+    assert not delta.keyframe
+    assert delta.sequence == 1
+    assert (delta.bid_price, delta.bid_size) == ([100], [7])
+    assert (delta.ask_price, delta.ask_size) == ([103, 101], [2, 0])
+
+
+def test_keyframe_interval() -> None:
+    encoder = DeltaEncoder(keyframe_interval=3)
+    quote = _quote([(100, 5)], [(101, 5)])
+
+    keyframes = [encoder.encode(quote).keyframe for _ in range(7)]
+
+    assert keyframes == [True, False, False, True, False, False, True]
+
+
+def test_keyframe_on_exponent_change_and_zero_size() -> None:
+    encoder = DeltaEncoder()
+    encoder.encode(_quote([(100, 5)], [(101, 5)]))
+
+    quote = _quote([(100, 5)], [(101, 5)])
+    quote.price_exponent = -5
+    assert encoder.encode(quote).keyframe
+
+    assert encoder.encode(_quote([(100, 0)], [(101, 5)])).keyframe
+
+
+def test_force_keyframe() -> None:
+    encoder = DeltaEncoder()
+    quote = _quote([(100, 5)], [(101, 5)])
+    encoder.encode(quote)
+
+    encoder.force_keyframe("EUR/USD")
+
+    assert encoder.encode(quote).keyframe
+
+
+def test_rejects_duplicate_prices() -> None:
+    encoder = DeltaEncoder()
+    encoder.encode(_quote([(100, 5)], [(101, 5)]))
+
+    with pytest.raises(ValueError, match="ask_price must not contain duplicate"):
+        encoder.encode(_quote([(100, 5)], [(101, 5), (101, 7)], tick_id=2))
+
+    # the rejected quote left the state of the symbol alone
+    assert encoder.encode(_quote([(100, 5)], [(101, 5)])).sequence == 1
+
+
+def test_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        DeltaEncoder(keyframe_interval=0)
+
+
+@pytest.mark.parametrize("keyframe_interval", [1, 5, 1_000])
+def test_round_trip_random_walk(keyframe_interval: int) -> None:
+    quotes = _random_walk(random.Random(keyframe_interval), n_quotes=300, depth=20)
+    encoder = DeltaEncoder(keyframe_interval)
+    decoder = DeltaDecoder()
+    codec = QuoteDeltaCodec()
+
+    decoded = [
+        decoder.decode(codec.decode(codec.encode(encoder.encode(q)), trusted=True))
+        for q in quotes
+    ]
+
+    assert decoded == quotes
+
+
+def test_deltas_are_smaller_than_quotes() -> None:
+    quotes = _random_walk(random.Random(0), n_quotes=100, depth=20)
+    encoder = DeltaEncoder()
+    codec, delta_codec = QuoteCodec(), QuoteDeltaCodec()
+
+    quote_bytes = sum(len(codec.encode(q)) for q in quotes)
+    delta_bytes = sum(len(delta_codec.encode(encoder.encode(q))) for q in quotes)
+
+    assert delta_bytes * 2 < quote_bytes
+
+
+def test_decoder_waits_for_keyframe_after_gap() -> None:
+    encoder = DeltaEncoder(keyframe_interval=3)
+    decoder = DeltaDecoder()
+    quotes = [_quote([(100, size)], [(101, 5)], tick_id=size) for size in range(1, 8)]
+    deltas: list[QuoteDelta] = [encoder.encode(q) for q in quotes]
+
+    # the consumer misses the second message
+    decoded = [decoder.decode(d) for d in deltas[:1] + deltas[2:]]
+
+    assert decoded == [quotes[0], None, quotes[3], quotes[4], quotes[5], quotes[6]]
+
+
+def test_decoder_ignores_deltas_before_first_keyframe() -> None:
+    encoder = DeltaEncoder()
+    quote = _quote([(100, 5)], [(101, 5)])
+    encoder.encode(quote)
+
+    assert DeltaDecoder().decode(encoder.encode(quote)) is None
+
+
+def test_status_is_restored() -> None:
+    quote = _quote([(101, 5)], [(100, 5)])
+    quote.status = QuoteStatus.CROSSED_PRICE
+
+    decoded = DeltaDecoder().decode(DeltaEncoder().encode(quote))
+
+    assert decoded == quote
+    assert isinstance(decoded.status, QuoteStatus)
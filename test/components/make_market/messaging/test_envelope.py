@@ -0,0 +1,121 @@
+import copy
+import io
+
+import fastavro
+import pytest
+from make_market.messaging import (
+    BaseQuote,
+    EnvelopeCodec,
+    QuoteCodec,
+    SchemaRegistry,
+)
+from make_market.messaging.envelope import (
+    SINGLE_OBJECT_MARKER,
+    pack_envelope,
+    schema_fingerprint,
+    unpack_envelope,
+)
+from make_market.messaging.status import QuoteStatus
+
+
+@pytest.fixture
+def registry() -> SchemaRegistry:
+    return SchemaRegistry()
+
+
+def _schema_without(*names: str) -> dict:
+    schema = copy.deepcopy(BaseQuote.avro_schema_to_python())
+    schema["fields"] = [f for f in schema["fields"] if f["name"] not in names]
+    return schema
+
+
+def _schema_without_status() -> dict:
+    return _schema_without("status")
+
+
+def test_schema_fingerprint() -> None:
+    # the CRC-64-AVRO fingerprint of the schema "int", from the Avro test vectors
+    assert schema_fingerprint("int") == (8247732601305521295).to_bytes(8, "little")
+    assert len(schema_fingerprint(BaseQuote)) == 8
+    assert schema_fingerprint(BaseQuote) != schema_fingerprint(_schema_without_status())
+
+
+def test_pack_unpack_envelope() -> None:
+    data = pack_envelope(b"12345678", b"payload")
+
+    assert data.startswith(SINGLE_OBJECT_MARKER)
+    assert unpack_envelope(data) == (b"12345678", b"payload")
+
+
+def test_unpack_rejects_bare_payload(quote: BaseQuote) -> None:
+    with pytest.raises(ValueError, match="single-object"):
+        unpack_envelope(quote.serialize())
+
+
+def test_round_trip(registry: SchemaRegistry, quote: BaseQuote) -> None:
+    codec = EnvelopeCodec(QuoteCodec(), registry)
+
+    data = codec.encode(quote)
+
+    assert data[2:10] == schema_fingerprint(BaseQuote)
+    assert data[10:] == quote.serialize()
+    assert codec.decode(data) == quote
+    assert codec.decode(data, trusted=True) == quote
+
+
+def test_decodes_older_writer_schema(
+    registry: SchemaRegistry, quote: BaseQuote
+) -> None:
+    old_schema = _schema_without_status()
+    old_id = registry.register(old_schema)
+    payload = io.BytesIO()
+    fastavro.schemaless_writer(payload, fastavro.parse_schema(old_schema), vars(quote))
+    codec = EnvelopeCodec(QuoteCodec(), registry)
+
+    decoded = codec.decode(pack_envelope(old_id, payload.getvalue()))
+
+    # the old schema has no status, the reader's default applies
+    assert decoded.status == QuoteStatus(0)
+    assert isinstance(decoded.status, QuoteStatus)
+    assert decoded.bid_price == quote.bid_price
+    assert decoded.tick_id == quote.tick_id
+
+
+def test_nanosecond_timestamps_resolve_across_schema_versions(
+    registry: SchemaRegistry, quote: BaseQuote
+) -> None:
+    old_schema = _schema_without("vendor_timestamp_ns", "timestamp_ns")
+    old_id = registry.register(old_schema)
+    codec = EnvelopeCodec(QuoteCodec(), registry)
+
+    # a producer from before the nanosecond fields: the reader's defaults apply
+    payload = io.BytesIO()
+    fastavro.schemaless_writer(payload, fastavro.parse_schema(old_schema), vars(quote))
+    decoded = codec.decode(pack_envelope(old_id, payload.getvalue()))
+    assert (decoded.vendor_timestamp_ns, decoded.timestamp_ns) == (0, 0)
+    assert decoded.bid_price == quote.bid_price
+
+    # a consumer from before the nanosecond fields skips them
+    schema_id, payload_bytes = unpack_envelope(codec.encode(quote))
+    record = fastavro.schemaless_reader(
+        io.BytesIO(payload_bytes),
+        registry.get(schema_id),
+        fastavro.parse_schema(old_schema),
+    )
+    assert "timestamp_ns" not in record
+    assert record["tick_id"] == quote.tick_id
+
+
+def test_unknown_writer_schema(registry: SchemaRegistry, quote: BaseQuote) -> None:
+    codec = EnvelopeCodec(QuoteCodec(), registry)
+
+    with pytest.raises(KeyError, match="unknown schema fingerprint"):
+        codec.decode(pack_envelope(b"\x00" * 8, quote.serialize()))
+
+
+def test_register_is_idempotent(registry: SchemaRegistry) -> None:
+    schema_id = registry.register(BaseQuote)
+
+    assert registry.register(BaseQuote.avro_schema_to_python()) == schema_id
+    assert schema_id in registry
+    assert registry.get(schema_id) is registry.get(schema_id)
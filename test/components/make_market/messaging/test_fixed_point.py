@@ -0,0 +1,65 @@
+from decimal import Decimal
+
+import pytest
+from make_market.messaging import FixedPoint
+
+
+def test_add_and_subtract_align_exponents() -> None:
+    price = FixedPoint(1_085_000, -6)
+    tick = FixedPoint(5, -5)
+
+    assert price + tick == FixedPoint(1_085_050, -6)
+    assert (price - tick).exponent == -6
+    assert (price - tick).to_decimal() == Decimal("1.08495")
+
+
+def test_sum_is_exact() -> None:
+    tick = FixedPoint(1, -1)
+
+    total = sum([tick] * 3, FixedPoint(0, 0))
+
+    assert total == FixedPoint(3, -1)
+    assert 0.1 + 0.1 + 0.1 != 0.3
+
+
+def test_compare_across_exponents() -> None:
+    assert FixedPoint(10, -1) == FixedPoint(1, 0)
+    assert hash(FixedPoint(10, -1)) == hash(FixedPoint(1, 0))
+    assert FixedPoint(1_084_999, -6) < FixedPoint(1_085, -3)
+    assert FixedPoint(-1, 0) <= FixedPoint(0, 5)
+    assert max(FixedPoint(2, 0), FixedPoint(19, -1)) == FixedPoint(2, 0)
+
+
+@pytest.mark.parametrize(
+    ("mantissa", "exponent", "expected"),
+    [
+        (1_085, -6, FixedPoint(1_085_000, -6)),
+        (1_085, -2, FixedPoint(108, -2)),
+        (15, -2, FixedPoint(2, -2)),
+        (25, -2, FixedPoint(2, -2)),
+        (-15, -2, FixedPoint(-2, -2)),
+        (-25, -2, FixedPoint(-2, -2)),
+        (-14, -2, FixedPoint(-1, -2)),
+    ],
+)
+def test_rescale(mantissa: int, exponent: int, expected: FixedPoint) -> None:
+    rescaled = FixedPoint(mantissa, -3).rescale(exponent)
+
+    assert rescaled.exponent == expected.exponent
+    assert rescaled.mantissa == expected.mantissa
+
+
+def test_conversions() -> None:
+    value = FixedPoint(-1_085_125, -6)
+
+    assert value.to_decimal() == Decimal("-1.085125")
+    assert float(value) == -1.085125
+    assert str(value) == "-1.085125"
+    assert FixedPoint.from_decimal(Decimal("-1.085125")) == value
+    assert FixedPoint(1_500, -2).normalize() == FixedPoint(15, 0)
+    assert FixedPoint(1_500, -2).normalize().exponent == 0
+
+
+def test_from_decimal_rejects_non_finite() -> None:
+    with pytest.raises(ValueError, match="FixedPoint"):
+        FixedPoint.from_decimal(Decimal("NaN"))
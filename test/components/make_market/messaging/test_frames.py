@@ -0,0 +1,147 @@
+import datetime
+
+import numpy as np
+import pytest
+from make_market.clock import datetime_to_ns
+from make_market.messaging import QuoteFrame, QuoteFrameCodec
+from make_market.messaging.schemas import BaseQuote, RawVendorQuote
+from make_market.messaging.status import QuoteStatus
+from make_market.settings.models import Settings
+
+
+def _raw_quote(
+    bid_price: list[int], ask_price: list[int], timestamp: datetime.datetime
+) -> RawVendorQuote:
+    return RawVendorQuote(
+        timestamp=timestamp,
+        bid_price=bid_price,
+        ask_price=ask_price,
+        price_exponent=-6,
+        bid_size=[100 * (i + 1) for i in range(len(bid_price))],
+        ask_size=[150 * (i + 1) for i in range(len(ask_price))],
+        size_exponent=-2,
+    )
+
+
+@pytest.fixture
+def timestamp() -> datetime.datetime:
+    return datetime.datetime.now(Settings().timezone)
+
+
+@pytest.fixture
+def raw_quotes(timestamp: datetime.datetime) -> dict[str, RawVendorQuote]:
+    return {
+        "EUR/USD": _raw_quote([1_085_000, 1_084_900], [1_085_100], timestamp),
+        "USD/JPY": _raw_quote([], [], timestamp),
+        "GBP/USD": _raw_quote([1_270_000], [1_270_000, 1_270_100], timestamp),
+        "AUD/USD": _raw_quote([660_000], [], timestamp),
+    }
+
+
+@pytest.fixture
+def frame(
+    raw_quotes: dict[str, RawVendorQuote], timestamp: datetime.datetime
+) -> QuoteFrame:
+    return QuoteFrame.from_raw_vendor_quotes(
+        raw_quotes, exchange="FX", timestamp=timestamp, app_id=1, tick_id=7
+    )
+
+
+def test_from_raw_vendor_quotes_flattens_levels(frame: QuoteFrame) -> None:
+    assert frame.symbols == ["EUR/USD", "USD/JPY", "GBP/USD", "AUD/USD"]
+    assert frame.bid_offsets == [0, 2, 2, 3, 4]
+    assert frame.ask_offsets == [0, 1, 1, 3, 3]
+    assert frame.bid_price == [1_085_000, 1_084_900, 1_270_000, 660_000]
+    assert frame.ask_price == [1_085_100, 1_270_000, 1_270_100]
+
+
+def test_from_raw_vendor_quotes_computes_statuses(frame: QuoteFrame) -> None:
+    assert frame.statuses == [
+        QuoteStatus(0),
+        QuoteStatus.EMPTY_ORDERBOOK,
+        QuoteStatus.LOCKED_PRICE,
+        QuoteStatus.ONE_SIDED,
+    ]
+
+
+def test_iterating_matches_base_quotes(
+    frame: QuoteFrame,
+    raw_quotes: dict[str, RawVendorQuote],
+    timestamp: datetime.datetime,
+) -> None:
+    expected = [
+        BaseQuote.from_raw_vendor_quote(
+            raw_quote,
+            symbol=symbol,
+            exchange="FX",
+            timestamp=timestamp,
+            app_id=1,
+            tick_id=7,
+        )
+        for symbol, raw_quote in raw_quotes.items()
+    ]
+
+    assert len(frame) == len(expected)
+    assert list(frame) == expected
+
+
+def test_nanosecond_timestamps(
+    raw_quotes: dict[str, RawVendorQuote], timestamp: datetime.datetime
+) -> None:
+    raw_quotes["EUR/USD"].timestamp_ns = 1_727_785_815_123_456_789
+
+    frame = QuoteFrame.from_raw_vendor_quotes(
+        raw_quotes,
+        exchange="FX",
+        timestamp=timestamp,
+        app_id=1,
+        tick_id=7,
+        timestamp_ns=1_727_785_815_123_457_001,
+    )
+
+    assert frame[0].vendor_timestamp_ns == 1_727_785_815_123_456_789
+    assert frame[1].vendor_timestamp_ns == datetime_to_ns(timestamp)
+    assert {quote.timestamp_ns for quote in frame} == {1_727_785_815_123_457_001}
+
+
+def test_to_arrays_levels_are_views(frame: QuoteFrame) -> None:
+    arrays = frame.to_arrays()
+
+    bid_price, bid_size, ask_price, ask_size = arrays.levels(2)
+
+    assert bid_price.tolist() == [1_270_000]
+    assert bid_size.tolist() == [100]
+    assert ask_price.tolist() == [1_270_000, 1_270_100]
+    assert ask_size.tolist() == [150, 300]
+    assert np.shares_memory(ask_price, arrays.ask_price)
+    assert arrays.levels(1)[0].shape == (0,)
+
+
+def test_rejects_mixed_exponents(
+    raw_quotes: dict[str, RawVendorQuote], timestamp: datetime.datetime
+) -> None:
+    raw_quotes["EUR/USD"].price_exponent = -5
+
+    with pytest.raises(ValueError, match="exponents"):
+        QuoteFrame.from_raw_vendor_quotes(
+            raw_quotes, exchange="FX", timestamp=timestamp, app_id=1, tick_id=7
+        )
+
+
+def test_empty_frame(timestamp: datetime.datetime) -> None:
+    frame = QuoteFrame.from_raw_vendor_quotes(
+        {}, exchange="FX", timestamp=timestamp, app_id=1, tick_id=7
+    )
+
+    assert len(frame) == 0
+    assert frame.bid_offsets == [0]
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_codec_round_trip(frame: QuoteFrame, trusted: bool) -> None:
+    codec = QuoteFrameCodec()
+
+    data = codec.encode(frame)
+
+    assert data == frame.serialize()
+    assert codec.decode(data, trusted=trusted) == frame
@@ -0,0 +1,99 @@
+import copy
+import io
+
+import fastavro
+import pytest
+from make_market.messaging import BaseQuote, LazyQuote, SchemaRegistry
+from make_market.messaging.envelope import pack_envelope
+from make_market.messaging.status import QuoteStatus
+from make_market.producer_consumer.topics import MessageType
+from make_market.ws_client import bus_codecs
+
+
+def test_header_fields(quote: BaseQuote) -> None:
+    lazy = LazyQuote(quote.serialize())
+
+    assert lazy.symbol == quote.symbol
+    assert lazy.exchange == quote.exchange
+    assert lazy.timestamp == quote.timestamp
+    assert lazy.vendor_timestamp == quote.vendor_timestamp
+    assert lazy.timestamp_ns == quote.timestamp_ns
+    assert lazy.vendor_timestamp_ns == quote.vendor_timestamp_ns
+    assert lazy.app_id == quote.app_id
+    assert lazy.tick_id == quote.tick_id
+    assert lazy.status == quote.status
+    assert isinstance(lazy.status, QuoteStatus)
+
+
+def test_header_does_not_decode_levels(quote: BaseQuote) -> None:
+    lazy = LazyQuote(quote.serialize())
+
+    _ = (lazy.symbol, lazy.timestamp, lazy.timestamp_ns, lazy.tick_id, lazy.status)
+
+    assert "_fields" not in vars(lazy)
+
+
+def test_levels_are_decoded_on_access(quote: BaseQuote) -> None:
+    lazy = LazyQuote(quote.serialize())
+
+    assert lazy.bid_price == quote.bid_price
+    assert lazy.ask_price == quote.ask_price
+    assert lazy.bid_size == quote.bid_size
+    assert lazy.ask_size == quote.ask_size
+    assert lazy.price_exponent == quote.price_exponent
+    assert lazy.size_exponent == quote.size_exponent
+    assert "_fields" in vars(lazy)
+
+
+def test_to_quote(quote: BaseQuote) -> None:
+    assert LazyQuote(quote.serialize()).to_quote() == quote
+
+
+def test_matches_fake_quotes() -> None:
+    for _ in range(50):
+        quote = BaseQuote.fake(status=QuoteStatus(0))
+        lazy = LazyQuote(quote.serialize())
+
+        assert (lazy.symbol, lazy.exchange, lazy.tick_id, lazy.app_id) == (
+            quote.symbol,
+            quote.exchange,
+            quote.tick_id,
+            quote.app_id,
+        )
+        assert lazy.timestamp == quote.timestamp
+        assert lazy.status == quote.status
+
+
+def test_from_envelope_reads_bus_payloads(quote: BaseQuote) -> None:
+    data = bus_codecs()[MessageType.QUOTE].encode(quote)
+
+    lazy = LazyQuote.from_envelope(data)
+
+    assert lazy.symbol == quote.symbol
+    assert lazy.tick_id == quote.tick_id
+    assert lazy.timestamp_ns == quote.timestamp_ns
+    assert lazy.to_quote() == quote
+
+
+def test_from_envelope_resolves_other_writer_schemas(quote: BaseQuote) -> None:
+    registry = SchemaRegistry()
+    old_schema = copy.deepcopy(BaseQuote.avro_schema_to_python())
+    old_schema["fields"] = [
+        f for f in old_schema["fields"] if f["name"] != "vendor_timestamp_ns"
+    ]
+    payload = io.BytesIO()
+    fastavro.schemaless_writer(payload, fastavro.parse_schema(old_schema), vars(quote))
+
+    lazy = LazyQuote.from_envelope(
+        pack_envelope(registry.register(old_schema), payload.getvalue()), registry
+    )
+
+    # the field the old writer lacks takes the reader's default
+    assert lazy.vendor_timestamp_ns == 0
+    assert lazy.timestamp_ns == quote.timestamp_ns
+    assert lazy.bid_price == quote.bid_price
+
+
+def test_from_envelope_rejects_bare_payloads(quote: BaseQuote) -> None:
+    with pytest.raises(ValueError, match="single-object"):
+        LazyQuote.from_envelope(quote.serialize())
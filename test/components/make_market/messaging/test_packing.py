@@ -0,0 +1,85 @@
+import datetime
+
+import numpy as np
+import pytest
+from make_market.messaging import (
+    BaseQuote,
+    PackedQuote,
+    PackedQuoteCodec,
+    QuoteCodec,
+)
+from make_market.messaging.packing import pack_levels, unpack_levels
+from make_market.messaging.status import QuoteStatus
+from make_market.settings.models import Settings
+
+
+def _quote(depth: int, rng: np.random.Generator) -> BaseQuote:
+    mid = 1_085_000
+    bid_price = mid - np.cumsum(rng.integers(1, 20, depth))
+    ask_price = mid + np.cumsum(rng.integers(1, 20, depth))
+    timestamp = datetime.datetime.now(Settings().timezone)
+    return BaseQuote(
+        symbol="EUR/USD",
+        exchange="FX",
+        vendor_timestamp=timestamp,
+        timestamp=timestamp,
+        bid_price=bid_price.tolist(),
+        ask_price=ask_price.tolist(),
+        price_exponent=-6,
+        bid_size=rng.integers(1, 50, depth).tolist(),
+        ask_size=rng.integers(1, 50, depth).tolist(),
+        size_exponent=-2,
+        app_id=1,
+        tick_id=1,
+        status=QuoteStatus.ONE_SIDED,
+        timestamp_ns=1_727_785_815_123_456_789,
+    )
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [0],
+        [1_085_000, 1_084_990, 1_084_980],
+        [127, 128, -64, -65, 0],
+        [2**63 - 1, -(2**63), 0, 2**63 - 1],
+    ],
+)
+def test_levels_round_trip(values: list[int]) -> None:
+    assert unpack_levels(pack_levels(values)).tolist() == values
+
+
+def test_random_levels_round_trip() -> None:
+    rng = np.random.default_rng(0)
+    values = rng.integers(-(2**63), 2**63 - 1, 1_000, dtype=np.int64)
+
+    np.testing.assert_array_equal(unpack_levels(pack_levels(values)), values)
+
+
+def test_adjacent_levels_take_one_byte() -> None:
+    # 1_085_000 takes 4 bytes, each step of -10 ticks a single byte
+    assert len(pack_levels([1_085_000 - 10 * i for i in range(20)])) == 4 + 19
+
+
+def test_truncated_levels_are_rejected() -> None:
+    with pytest.raises(ValueError, match="varint"):
+        unpack_levels(pack_levels([1_085_000])[:-1])
+
+
+def test_packed_quote_round_trip() -> None:
+    quote = _quote(20, np.random.default_rng(1))
+    codec = PackedQuoteCodec()
+
+    decoded = codec.decode(codec.encode(PackedQuote.from_quote(quote)), trusted=True)
+
+    assert decoded.to_quote() == quote
+
+
+def test_packed_quote_is_smaller() -> None:
+    quote = _quote(20, np.random.default_rng(2))
+
+    packed = PackedQuoteCodec().encode(PackedQuote.from_quote(quote))
+    full = QuoteCodec().encode(quote)
+
+    assert len(packed) < 0.7 * len(full)
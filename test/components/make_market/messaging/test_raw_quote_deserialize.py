@@ -3,7 +3,8 @@ import math
 
 import pytest
 from make_market.messaging.decimals import decimal_from_int_number_with_exponent
-from make_market.messaging.schemas import RawVendorQuote
+from make_market.messaging.schemas import BaseQuote, RawVendorQuote
+from make_market.messaging.status import QuoteStatus
 from make_market.orderbook.core import OrderBook
 from make_market.settings.models import Settings
 from make_market.ws_server.quote import create_raw_quote_from_orderbook
@@ -36,3 +37,76 @@ def test_create_raw_vendor_quote_from_dict(raw_quote_dict):
         raw_quote_dict["ask_prices"][0],
         rel_tol=10**price_exponent,
     ), "Should be converted to the correct price."
+
+
+@pytest.mark.parametrize(
+    ("bid_price", "ask_price", "expected"),
+    [
+        ([99], [100], QuoteStatus(0)),
+        ([100], [100], QuoteStatus.LOCKED_PRICE),
+        ([101], [100], QuoteStatus.CROSSED_PRICE),
+        ([], [100], QuoteStatus.ONE_SIDED),
+        ([], [], QuoteStatus.EMPTY_ORDERBOOK),
+    ],
+)
+def test_base_quote_status_is_computed(
+    bid_price: list[int], ask_price: list[int], expected: QuoteStatus
+) -> None:
+    timestamp = datetime.datetime.now(Settings().timezone)
+    raw_quote = RawVendorQuote(
+        timestamp=timestamp,
+        bid_price=bid_price,
+        ask_price=ask_price,
+        price_exponent=0,
+        bid_size=[1] * len(bid_price),
+        ask_size=[1] * len(ask_price),
+        size_exponent=0,
+    )
+
+    quote = BaseQuote.from_raw_vendor_quote(
+        raw_quote,
+        symbol="EUR/USD",
+        exchange="FX",
+        timestamp=timestamp,
+        app_id=1,
+        tick_id=1,
+    )
+
+    assert quote.status == expected
+
+
+def test_base_quote_nanosecond_timestamps() -> None:
+    orderbook = OrderBook.random_from_midprice_and_spread(midprice=100.0, spread=2.0)
+    raw_quote = RawVendorQuote.from_raw_vendor_dict(
+        create_raw_quote_from_orderbook(
+            orderbook, timezone=Settings().timezone, timestamp_ns=1_000_001_999
+        ),
+        price_exponent=-6,
+        size_exponent=1,
+    )
+    received = datetime.datetime(1970, 1, 1, 0, 0, 2, tzinfo=datetime.UTC)
+
+    with_ns = BaseQuote.from_raw_vendor_quote(
+        raw_quote,
+        symbol="EUR/USD",
+        exchange="FX",
+        timestamp=received,
+        app_id=1,
+        tick_id=1,
+        timestamp_ns=2_000_000_500,
+    )
+    from_datetime = BaseQuote.from_raw_vendor_quote(
+        raw_quote,
+        symbol="EUR/USD",
+        exchange="FX",
+        timestamp=received,
+        app_id=1,
+        tick_id=1,
+    )
+
+    assert raw_quote.timestamp == datetime.datetime(
+        1970, 1, 1, 0, 0, 1, 1, tzinfo=datetime.UTC
+    )
+    assert with_ns.vendor_timestamp_ns == 1_000_001_999
+    assert with_ns.timestamp_ns == 2_000_000_500
+    assert from_datetime.timestamp_ns == 2_000_000_000
@@ -1,4 +1,10 @@
-from make_market.messaging.status import QuoteStatus
+import numpy as np
+import pytest
+from make_market.messaging.status import (
+    QuoteStatus,
+    status_from_top_of_book,
+    status_from_top_of_book_arrays,
+)
 
 
 def test_quote_status_combination():
@@ -29,3 +35,48 @@ def test_above_max():
     # testing with value that is not mapped to any status
     status = QuoteStatus(1 << 10)
     assert status.value == 1 << 10
+
+
+@pytest.mark.parametrize(
+    ("top_bid", "top_ask", "expected"),
+    [
+        (99, 100, QuoteStatus(0)),
+        (100, 100, QuoteStatus.LOCKED_PRICE),
+        (101, 100, QuoteStatus.CROSSED_PRICE),
+        (99, None, QuoteStatus.ONE_SIDED),
+        (None, 100, QuoteStatus.ONE_SIDED),
+        (None, None, QuoteStatus.EMPTY_ORDERBOOK),
+    ],
+)
+def test_status_from_top_of_book(
+    top_bid: int | None, top_ask: int | None, expected: QuoteStatus
+) -> None:
+    assert status_from_top_of_book(top_bid, top_ask) == expected
+
+
+def test_status_from_top_of_book_arrays():
+    nan = float("nan")
+    status = status_from_top_of_book_arrays(
+        top_bids=[99.0, 100.0, 101.0, 99.0, nan, nan],
+        top_asks=[100.0, 100.0, 100.0, nan, 100.0, nan],
+    )
+
+    assert [QuoteStatus(s) for s in status] == [
+        QuoteStatus(0),
+        QuoteStatus.LOCKED_PRICE,
+        QuoteStatus.CROSSED_PRICE,
+        QuoteStatus.ONE_SIDED,
+        QuoteStatus.ONE_SIDED,
+        QuoteStatus.EMPTY_ORDERBOOK,
+    ]
+
+
+def test_status_from_top_of_book_arrays_with_masks():
+    status = status_from_top_of_book_arrays(
+        top_bids=np.array([1_000_001, 0]),
+        top_asks=np.array([1_000_000, 0]),
+        has_bids=[True, False],
+        has_asks=[True, True],
+    )
+
+    assert status.tolist() == [QuoteStatus.CROSSED_PRICE, QuoteStatus.ONE_SIDED]
@@ -0,0 +1,110 @@
+import datetime
+import json
+
+import numpy as np
+import pytest
+from make_market.messaging.schemas import RawVendorQuote
+from make_market.messaging.vendor import parse_vendor_message
+from make_market.orderbook.batch import random_book_block
+from make_market.settings.models import Settings
+from make_market.ws_server.quote import create_raw_quotes_from_book_block
+
+
+@pytest.fixture
+def raw_message() -> str:
+    block = random_book_block(
+        [1.085, 150.2, 0.66], [0.0001, 0.01, 0.0001], rng=np.random.default_rng(0)
+    )
+    quotes = create_raw_quotes_from_book_block(
+        ["EUR/USD", "USD/JPY", "AUD/USD"], block, Settings().timezone
+    )
+    return json.dumps(quotes)
+
+
+def test_parse_matches_float_path(raw_message: str) -> None:
+    message, raw_quotes = parse_vendor_message(
+        raw_message, price_exponent=-6, size_exponent=-2
+    )
+
+    expected = {
+        symbol: RawVendorQuote.from_raw_vendor_dict(
+            quote, price_exponent=-6, size_exponent=-2
+        )
+        for symbol, quote in json.loads(raw_message).items()
+    }
+    assert message is None
+    assert raw_quotes == expected
+
+
+def test_parse_bytes_and_message() -> None:
+    data = json.dumps(
+        {
+            "message": "subscribed",
+            "EUR/USD": {
+                "timestamp": "2024-10-01T12:00:00+02:00",
+                "bid_prices": [1.0845, 1],
+                "ask_prices": [1.0855],
+                "bid_sizes": [10.5, 3],
+                "ask_sizes": [7.25],
+            },
+        }
+    ).encode()
+
+    message, raw_quotes = parse_vendor_message(
+        data, price_exponent=-3, size_exponent=-1
+    )
+
+    assert message == "subscribed"
+    quote = raw_quotes["EUR/USD"]
+    assert quote.timestamp == datetime.datetime.fromisoformat(
+        "2024-10-01T12:00:00+02:00"
+    )
+    # decimal ties round half to even on the text, not on the nearest float
+    assert quote.bid_price == [1084, 1000]
+    assert quote.ask_price == [1086]
+    assert quote.bid_size == [105, 30]
+    assert quote.ask_size == [72]
+
+
+def test_parse_nanosecond_timestamps() -> None:
+    block = random_book_block([1.085], [0.0001], rng=np.random.default_rng(0))
+    data = json.dumps(
+        create_raw_quotes_from_book_block(
+            ["EUR/USD"],
+            block,
+            Settings().timezone,
+            timestamp_ns=1_727_785_815_123_456_789,
+        )
+    )
+
+    _, raw_quotes = parse_vendor_message(data, price_exponent=-6, size_exponent=-2)
+
+    quote = raw_quotes["EUR/USD"]
+    assert quote.timestamp_ns == 1_727_785_815_123_456_789
+    assert quote.timestamp == datetime.datetime(
+        2024, 10, 1, 12, 30, 15, 123456, tzinfo=datetime.UTC
+    )
+    assert quote == RawVendorQuote.from_raw_vendor_dict(
+        json.loads(data)["EUR/USD"], price_exponent=-6, size_exponent=-2
+    )
+
+
+def test_parse_status_message_only() -> None:
+    message, raw_quotes = parse_vendor_message(
+        json.dumps({"message": "unsubscribed"}), price_exponent=-6, size_exponent=-2
+    )
+
+    assert message == "unsubscribed"
+    assert raw_quotes == {}
+
+
+@pytest.mark.parametrize("constant", ["NaN", "Infinity", "-Infinity"])
+def test_parse_rejects_non_finite_numbers(constant: str) -> None:
+    data = (
+        '{"EUR/USD": {"timestamp": "2024-10-01T12:00:00+02:00",'
+        f' "bid_prices": [{constant}], "ask_prices": [1.0855],'
+        ' "bid_sizes": [10], "ask_sizes": [7]}}'
+    )
+
+    with pytest.raises(ValueError, match="not a decimal number"):
+        parse_vendor_message(data, price_exponent=-6, size_exponent=-2)
@@ -0,0 +1,108 @@
+import math
+
+import numpy as np
+import pytest
+from make_market.orderbook import BookBlock, OrderBook, Side, analytics
+
+
+@pytest.fixture
+def orderbook() -> OrderBook:
+    return OrderBook(
+        ask_prices=[100.0, 101.0, 102.0],
+        ask_sizes=[10.0, 20.0, 30.0],
+        bid_prices=[99.0, 98.0],
+        bid_sizes=[30.0, 40.0],
+    )
+
+
+@pytest.fixture
+def block() -> BookBlock:
+    # the second book is one level shallower on the ask side, padded with size 0
+    return BookBlock(
+        ask_prices=np.array([[100.0, 101.0, 102.0], [10.0, 11.0, np.nan]]),
+        ask_sizes=np.array([[10.0, 20.0, 30.0], [1.0, 1.0, 0.0]]),
+        bid_prices=np.array([[99.0, 98.0], [9.0, 8.0]]),
+        bid_sizes=np.array([[30.0, 40.0], [3.0, 1.0]]),
+    )
+
+
+def test_mid_prices(orderbook: OrderBook, block: BookBlock) -> None:
+    assert analytics.mid_prices(orderbook) == 99.5
+    np.testing.assert_allclose(analytics.mid_prices(block), [99.5, 9.5])
+
+
+def test_microprice(orderbook: OrderBook, block: BookBlock) -> None:
+    # top prices weighted by the opposite top size
+    assert analytics.microprice(orderbook) == pytest.approx(99.75)
+    np.testing.assert_allclose(analytics.microprice(block), [99.75, 9.75])
+
+
+def test_microprice_one_sided() -> None:
+    orderbook = OrderBook(bid_prices=[99.0], bid_sizes=[1.0])
+    assert math.isnan(analytics.microprice(orderbook))
+
+
+def test_imbalance(orderbook: OrderBook, block: BookBlock) -> None:
+    assert analytics.imbalance(orderbook) == pytest.approx(0.5)
+    # bids 70 against asks 60 over three levels
+    assert analytics.imbalance(orderbook, depth=3) == pytest.approx(10 / 130)
+    np.testing.assert_allclose(analytics.imbalance(block, depth=2), [40 / 100, 2 / 6])
+
+
+def test_cumulative_depth(orderbook: OrderBook, block: BookBlock) -> None:
+    np.testing.assert_array_equal(
+        analytics.cumulative_depth(orderbook, Side.ASK), [10.0, 30.0, 60.0]
+    )
+    np.testing.assert_array_equal(
+        analytics.cumulative_depth(block, Side.ASK),
+        [[10.0, 30.0, 60.0], [1.0, 2.0, 2.0]],
+    )
+
+
+def test_price_for_size(orderbook: OrderBook) -> None:
+    assert analytics.price_for_size(orderbook, Side.ASK, 5.0) == 100.0
+    # 10 @ 100 + 15 @ 101
+    assert analytics.price_for_size(orderbook, Side.ASK, 25.0) == pytest.approx(
+        (10 * 100.0 + 15 * 101.0) / 25
+    )
+    assert analytics.price_for_size(orderbook, Side.BID, 70.0) == pytest.approx(
+        (30 * 99.0 + 40 * 98.0) / 70
+    )
+    assert math.isnan(analytics.price_for_size(orderbook, Side.BID, 70.5))
+
+
+def test_plain_string_sides(orderbook: OrderBook) -> None:
+    assert analytics.price_for_size(orderbook, "ask", 5.0) == 100.0  # type: ignore[arg-type]
+    assert analytics.price_for_size(orderbook, "bid", 70.0) == pytest.approx(
+        analytics.price_for_size(orderbook, Side.BID, 70.0)
+    )
+
+    with pytest.raises(ValueError, match="not a valid Side"):
+        analytics.cumulative_depth(orderbook, "mid")  # type: ignore[arg-type]
+
+
+def test_price_for_size_batch(block: BookBlock) -> None:
+    np.testing.assert_allclose(
+        analytics.price_for_size(block, Side.ASK, 2.0), [100.0, 10.5]
+    )
+    result = analytics.price_for_size(block, Side.ASK, 3.0)
+    assert result[0] == 100.0
+    assert math.isnan(result[1])
+
+
+def test_price_for_size_invalid_quantity(orderbook: OrderBook) -> None:
+    with pytest.raises(ValueError, match="quantity must be positive"):
+        analytics.price_for_size(orderbook, Side.ASK, 0.0)
+
+
+def test_depth_within_ticks(orderbook: OrderBook, block: BookBlock) -> None:
+    assert analytics.depth_within_ticks(orderbook, Side.ASK, 150, 0.01) == 30.0
+    assert analytics.depth_within_ticks(orderbook, Side.BID, 50, 0.01) == 30.0
+    np.testing.assert_allclose(
+        analytics.depth_within_ticks(block, Side.ASK, 2, 1.0), [30.0, 2.0]
+    )
+
+
+def test_depth_within_ticks_one_sided() -> None:
+    orderbook = OrderBook(ask_prices=[100.0], ask_sizes=[1.0])
+    assert math.isnan(analytics.depth_within_ticks(orderbook, Side.ASK, 1, 1.0))
@@ -0,0 +1,145 @@
+import numpy as np
+import pytest
+from make_market.orderbook import ArrayOrderBook, OrderBook, OrderBookDict
+
+
+@pytest.fixture
+def orderbook_dict() -> OrderBookDict:
+    return {
+        "ask_prices": [100.0, 101.0, 102.0],
+        "ask_sizes": [10.0, 15.0, 20.0],
+        "bid_prices": [99.0, 98.0],
+        "bid_sizes": [20.0, 25.0],
+    }
+
+
+def test_array_orderbook_initialization(orderbook_dict: OrderBookDict) -> None:
+    orderbook = ArrayOrderBook(**orderbook_dict)
+
+    assert orderbook.ask_prices.dtype == np.float64
+    assert orderbook.ask_prices.flags.c_contiguous
+    assert orderbook.ask_prices.tolist() == [100.0, 101.0, 102.0]
+    assert orderbook.bid_sizes.tolist() == [20.0, 25.0]
+
+
+def test_array_orderbook_empty_initialization() -> None:
+    orderbook = ArrayOrderBook()
+
+    assert orderbook.is_empty()
+    assert orderbook.n_levels == (0, 0)
+    assert orderbook.top_level_prices == (None, None)
+    assert orderbook.mid_price is None
+    assert orderbook.top_level_spread is None
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        (
+            {"ask_prices": [100.0, 101.0], "ask_sizes": [10.0]},
+            "ask_prices and ask_sizes must be of the same length",
+        ),
+        (
+            {"bid_prices": [99.0, 98.0], "bid_sizes": [20.0]},
+            "bid_prices and bid_sizes must be of the same length",
+        ),
+        (
+            {"ask_prices": [101.0, 100.0], "ask_sizes": [10.0, 15.0]},
+            "ask_prices must be in strictly increasing order",
+        ),
+        (
+            {"bid_prices": [98.0, 99.0], "bid_sizes": [20.0, 25.0]},
+            "bid_prices must be in strictly decreasing order",
+        ),
+    ],
+)
+def test_array_orderbook_validation_failure(kwargs: dict, match: str) -> None:
+    with pytest.raises(ValueError, match=match):
+        ArrayOrderBook(**kwargs)
+
+    # the list-backed book rejects exactly the same input
+    with pytest.raises(ValueError, match=match):
+        OrderBook(**kwargs)
+
+
+def test_array_orderbook_trusted_construction_skips_validation() -> None:
+    ask_prices = np.array([101.0, 100.0])
+    orderbook = ArrayOrderBook.from_arrays(
+        ask_prices, np.ones(2), np.empty(0), np.empty(0), validate=False
+    )
+
+    # arrays are stored as-is, without copies or checks
+    assert orderbook.ask_prices is ask_prices
+
+    with pytest.raises(ValueError, match="ask_prices must be"):
+        orderbook.validate()
+
+
+def test_array_orderbook_matches_orderbook_api(orderbook_dict: OrderBookDict) -> None:
+    array_orderbook = ArrayOrderBook.from_dict(orderbook_dict)
+    orderbook = OrderBook.from_dict(orderbook_dict)
+
+    assert array_orderbook.top_level_prices == orderbook.top_level_prices
+    assert array_orderbook.top_level_spread == orderbook.top_level_spread
+    assert array_orderbook.mid_price == orderbook.mid_price
+    assert array_orderbook.n_levels == orderbook.n_levels
+    assert array_orderbook.to_dict() == orderbook.to_dict()
+
+
+def test_array_orderbook_to_dict_is_json_friendly(
+    orderbook_dict: OrderBookDict,
+) -> None:
+    data = ArrayOrderBook.from_dict(orderbook_dict).to_dict()
+
+    assert all(isinstance(value, list) for value in data.values())
+    assert isinstance(data["ask_prices"][0], float)
+
+
+def test_array_orderbook_orderbook_round_trip(orderbook_dict: OrderBookDict) -> None:
+    orderbook = OrderBook.from_dict(orderbook_dict)
+
+    array_orderbook = ArrayOrderBook.from_orderbook(orderbook)
+
+    assert array_orderbook == ArrayOrderBook.from_dict(orderbook_dict)
+    assert array_orderbook.to_orderbook() == orderbook
+
+
+def test_array_orderbook_from_orderbook_validates_changed_books(
+    orderbook_dict: OrderBookDict,
+) -> None:
+    orderbook = OrderBook.from_dict(orderbook_dict)
+    orderbook.bid_prices.append(97.0)
+
+    with pytest.raises(ValueError, match="same length"):
+        ArrayOrderBook.from_orderbook(orderbook)
+
+
+def test_array_orderbook_random_from_bid_ask_prices_is_seeded() -> None:
+    first, second = (
+        ArrayOrderBook.random_from_bid_ask_prices(
+            99.5, 100.5, rng=np.random.default_rng(7)
+        )
+        for _ in range(2)
+    )
+
+    assert first == second
+
+
+def test_array_orderbook_random_creation() -> None:
+    rng = np.random.default_rng(42)
+    orderbook = ArrayOrderBook.random_from_midprice_and_spread(
+        midprice=100.0, spread=1.0, n_ask_levels=5, n_bid_levels=4, rng=rng
+    )
+
+    assert orderbook.n_levels == (5, 4)
+    top_ask, top_bid = orderbook.top_level_prices
+    assert top_bid < 100.0 < top_ask
+
+    # same seed, same book
+    assert orderbook == ArrayOrderBook.random_from_midprice_and_spread(
+        midprice=100.0,
+        spread=1.0,
+        n_ask_levels=5,
+        n_bid_levels=4,
+        rng=np.random.default_rng(42),
+    )
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+from make_market.orderbook import ArrayOrderBook, BookBlock, random_book_block
+
+
+@pytest.fixture
+def block() -> BookBlock:
+    return random_book_block(
+        midprices=[1.0, 1.5, 2.0],
+        spreads=[0.01, 0.02, 0.05],
+        n_ask_levels=4,
+        n_bid_levels=3,
+        rng=np.random.default_rng(7),
+    )
+
+
+def test_random_book_block_shape(block: BookBlock) -> None:
+    assert len(block) == 3
+    assert block.ask_prices.shape == (3, 4)
+    assert block.ask_sizes.shape == (3, 4)
+    assert block.bid_prices.shape == (3, 3)
+    assert block.bid_sizes.shape == (3, 3)
+
+
+def test_random_book_block_books_are_valid(block: BookBlock) -> None:
+    for book, midprice in zip(block, [1.0, 1.5, 2.0], strict=True):
+        book.validate()
+        top_ask, top_bid = book.top_level_prices
+        assert top_bid < midprice < top_ask
+        assert book.n_levels == (4, 3)
+
+
+def test_random_book_block_is_reproducible(block: BookBlock) -> None:
+    other = random_book_block(
+        midprices=[1.0, 1.5, 2.0],
+        spreads=[0.01, 0.02, 0.05],
+        n_ask_levels=4,
+        n_bid_levels=3,
+        rng=np.random.default_rng(7),
+    )
+    assert np.array_equal(block.ask_prices, other.ask_prices)
+    assert np.array_equal(block.bid_sizes, other.bid_sizes)
+
+
+def test_book_block_to_dicts(block: BookBlock) -> None:
+    dicts = block.to_dicts()
+
+    assert len(dicts) == 3
+    for data, book in zip(dicts, block, strict=True):
+        assert ArrayOrderBook.from_dict(data) == book
+        assert isinstance(data["bid_prices"][0], float)
+
+
+def test_random_book_block_length_mismatch() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        random_book_block(midprices=[1.0, 2.0], spreads=[0.01])
@@ -0,0 +1,128 @@
+import pytest
+from make_market.orderbook import (
+    ConsolidatedOrderBook,
+    LevelDelta,
+    OrderBook,
+    Side,
+)
+
+
+@pytest.fixture
+def book() -> ConsolidatedOrderBook:
+    book = ConsolidatedOrderBook()
+    book.update_venue(
+        "A",
+        OrderBook(
+            ask_prices=[100.0, 101.0],
+            ask_sizes=[1.0, 2.0],
+            bid_prices=[99.0, 98.0],
+            bid_sizes=[3.0, 4.0],
+        ),
+    )
+    book.update_venue(
+        "B",
+        OrderBook(
+            ask_prices=[100.0, 100.5],
+            ask_sizes=[5.0, 6.0],
+            bid_prices=[99.5, 98.0],
+            bid_sizes=[7.0, 8.0],
+        ),
+    )
+    return book
+
+
+def test_consolidated_ladder(book: ConsolidatedOrderBook) -> None:
+    assert book.venues == ["A", "B"]
+    assert book.to_dict() == {
+        "ask_prices": [100.0, 100.5, 101.0],
+        "ask_sizes": [6.0, 6.0, 2.0],
+        "bid_prices": [99.5, 99.0, 98.0],
+        "bid_sizes": [7.0, 3.0, 12.0],
+    }
+    assert book.top_level_prices == (100.0, 99.5)
+    assert book.n_levels == (3, 3)
+
+
+def test_venue_attribution(book: ConsolidatedOrderBook) -> None:
+    assert book.venue_sizes(Side.ASK, 100.0) == {"A": 1.0, "B": 5.0}
+    assert book.venue_sizes(Side.BID, 99.5) == {"B": 7.0}
+    assert book.venue_sizes(Side.BID, 1.0) == {}
+
+
+def test_update_venue_patches_changed_levels(book: ConsolidatedOrderBook) -> None:
+    book.update_venue(
+        "A",
+        OrderBook(
+            ask_prices=[100.0, 102.0],
+            ask_sizes=[1.5, 2.0],
+            bid_prices=[98.0],
+            bid_sizes=[4.0],
+        ),
+    )
+
+    assert book.to_dict() == {
+        "ask_prices": [100.0, 100.5, 102.0],
+        "ask_sizes": [6.5, 6.0, 2.0],
+        "bid_prices": [99.5, 98.0],
+        "bid_sizes": [7.0, 12.0],
+    }
+    assert book.venue_sizes(Side.ASK, 100.0) == {"A": 1.5, "B": 5.0}
+    assert book.venue_book("B").ask_prices == [100.0, 100.5]
+
+
+def test_apply_venue_deltas(book: ConsolidatedOrderBook) -> None:
+    book.apply_venue_deltas(
+        "B",
+        [LevelDelta(Side.BID, 99.5, 0.0), LevelDelta(Side.ASK, 99.9, 1.0)],
+    )
+
+    assert book.top_level_prices == (99.9, 99.0)
+    assert book.venue_book("B").bid_prices == [98.0]
+
+
+def test_invalid_venue_deltas_leave_book_untouched(
+    book: ConsolidatedOrderBook,
+) -> None:
+    before = book.to_dict()
+
+    with pytest.raises(ValueError, match="size must be non-negative"):
+        book.apply_venue_deltas(
+            "A",
+            [LevelDelta(Side.ASK, 100.0, 0.0), LevelDelta(Side.ASK, 101.0, -1.0)],
+        )
+
+    assert book.to_dict() == before
+
+
+def test_remove_venue(book: ConsolidatedOrderBook) -> None:
+    book.remove_venue("B")
+
+    assert book.venues == ["A"]
+    assert book.to_orderbook() == book.venue_book("A")
+
+    with pytest.raises(KeyError):
+        book.remove_venue("B")
+
+
+def test_plain_string_sides(book: ConsolidatedOrderBook) -> None:
+    book.apply_venue_deltas("A", [LevelDelta("ask", 99.9, 1.0)])  # type: ignore[arg-type]
+
+    assert book.venue_sizes("ask", 99.9) == {"A": 1.0}  # type: ignore[arg-type]
+    assert book.top_level_prices == (99.9, 99.5)
+
+
+def test_update_venue_rejects_duplicate_prices(book: ConsolidatedOrderBook) -> None:
+    before = book.to_dict()
+
+    with pytest.raises(ValueError, match="duplicate prices"):
+        book.update_venue(
+            "A",
+            OrderBook(
+                ask_prices=[100.0, 100.0],
+                ask_sizes=[1.0, 2.0],
+                bid_prices=[99.0],
+                bid_sizes=[3.0],
+            ),
+        )
+
+    assert book.to_dict() == before
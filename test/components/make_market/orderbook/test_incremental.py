@@ -0,0 +1,145 @@
+import pytest
+from make_market.orderbook import (
+    ArrayOrderBook,
+    IncrementalOrderBook,
+    LevelDelta,
+    OrderBook,
+    OrderBookDict,
+    Side,
+)
+
+
+@pytest.fixture
+def orderbook_dict() -> OrderBookDict:
+    return {
+        "ask_prices": [100.0, 101.0, 102.0],
+        "ask_sizes": [10.0, 15.0, 20.0],
+        "bid_prices": [99.0, 98.0],
+        "bid_sizes": [20.0, 25.0],
+    }
+
+
+@pytest.fixture
+def book(orderbook_dict: OrderBookDict) -> IncrementalOrderBook:
+    return IncrementalOrderBook.from_dict(orderbook_dict)
+
+
+def test_incremental_orderbook_from_dict(
+    book: IncrementalOrderBook, orderbook_dict: OrderBookDict
+) -> None:
+    assert book.to_dict() == orderbook_dict
+    assert book.n_levels == (3, 2)
+    assert book.top_level_prices == (100.0, 99.0)
+    assert book.mid_price == 99.5
+
+
+def test_incremental_orderbook_empty() -> None:
+    book = IncrementalOrderBook()
+
+    assert book.is_empty()
+    assert book.top_level_prices == (None, None)
+    assert book.mid_price is None
+    assert book.to_orderbook() == OrderBook()
+
+
+def test_insert_levels_keep_ordering(book: IncrementalOrderBook) -> None:
+    book.update_level(Side.ASK, 100.5, 1.0)
+    book.update_level(Side.ASK, 99.5, 2.0)
+    book.update_level(Side.BID, 98.5, 3.0)
+    book.update_level(Side.BID, 97.0, 4.0)
+
+    data = book.to_dict()
+    assert data["ask_prices"] == [99.5, 100.0, 100.5, 101.0, 102.0]
+    assert data["ask_sizes"] == [2.0, 10.0, 1.0, 15.0, 20.0]
+    assert data["bid_prices"] == [99.0, 98.5, 98.0, 97.0]
+    assert data["bid_sizes"] == [20.0, 3.0, 25.0, 4.0]
+
+
+def test_update_and_delete_levels(book: IncrementalOrderBook) -> None:
+    book.update_level(Side.ASK, 101.0, 42.0)
+    assert book.size_at(Side.ASK, 101.0) == 42.0
+    assert book.n_levels == (3, 2)
+
+    book.update_level(Side.ASK, 100.0, 0.0)
+    book.delete_level(Side.BID, 99.0)
+    assert book.top_level_prices == (101.0, 98.0)
+    assert book.size_at(Side.ASK, 100.0) is None
+
+    # deleting a missing level is a no-op
+    book.delete_level(Side.BID, 12.0)
+    assert book.n_levels == (2, 1)
+
+
+@pytest.mark.parametrize(
+    "delta",
+    [
+        LevelDelta(Side.ASK, 100.0, -1.0),
+        LevelDelta(Side.BID, float("nan"), 1.0),
+        LevelDelta(Side.BID, 99.0, float("nan")),
+    ],
+)
+def test_invalid_delta_is_rejected(
+    book: IncrementalOrderBook, delta: LevelDelta
+) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        book.apply_delta(delta)
+
+
+def test_apply_deltas_is_atomic(
+    book: IncrementalOrderBook, orderbook_dict: OrderBookDict
+) -> None:
+    deltas = [
+        LevelDelta(Side.ASK, 100.0, 0.0),
+        LevelDelta(Side.BID, 99.5, 5.0),
+        LevelDelta(Side.BID, 99.0, -5.0),
+    ]
+
+    with pytest.raises(ValueError, match="size must be non-negative"):
+        book.apply_deltas(deltas)
+
+    assert book.to_dict() == orderbook_dict
+
+
+def test_apply_deltas_in_order(book: IncrementalOrderBook) -> None:
+    book.apply_deltas(
+        [
+            LevelDelta(Side.BID, 99.5, 5.0),
+            LevelDelta(Side.BID, 99.5, 0.0),
+            LevelDelta(Side.ASK, 99.75, 1.0),
+            LevelDelta(Side.ASK, 99.75, 2.0),
+        ]
+    )
+
+    assert book.to_dict()["bid_prices"] == [99.0, 98.0]
+    assert book.top_level_prices == (99.75, 99.0)
+    assert book.size_at(Side.ASK, 99.75) == 2.0
+
+
+def test_plain_string_sides(book: IncrementalOrderBook) -> None:
+    book.apply_delta(LevelDelta("ask", 99.5, 1.0))  # type: ignore[arg-type]
+    book.update_level("bid", 98.5, 2.0)  # type: ignore[arg-type]
+
+    assert book.size_at(Side.ASK, 99.5) == 1.0
+    assert book.size_at(Side.BID, 98.5) == 2.0
+    assert book.top_level_prices == (99.5, 99.0)
+
+    with pytest.raises(ValueError, match="not a valid Side"):
+        book.apply_deltas([LevelDelta("mid", 99.5, 1.0)])  # type: ignore[arg-type]
+
+
+def test_snapshots(book: IncrementalOrderBook, orderbook_dict: OrderBookDict) -> None:
+    assert book.to_orderbook() == OrderBook.from_dict(orderbook_dict)
+    assert book.to_array_orderbook() == ArrayOrderBook.from_dict(orderbook_dict)
+
+    top = book.to_orderbook(depth=1)
+    assert top.n_levels == (1, 1)
+    assert top.top_level_prices == (100.0, 99.0)
+
+
+def test_from_dict_length_mismatch() -> None:
+    with pytest.raises(
+        ValueError, match="ask_prices and ask_sizes must be of the same length"
+    ):
+        IncrementalOrderBook.from_dict(
+            {"ask_prices": [1.0], "ask_sizes": [], "bid_prices": [], "bid_sizes": []}
+        )
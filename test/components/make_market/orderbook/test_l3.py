@@ -0,0 +1,137 @@
+import time
+
+import pytest
+from make_market.orderbook import L3OrderBook, OrderBook, Side
+
+
+@pytest.fixture
+def book() -> L3OrderBook:
+    book = L3OrderBook()
+    book.add_order(1, Side.ASK, 100.0, 1.0)
+    book.add_order(2, Side.ASK, 100.0, 2.0)
+    book.add_order(3, Side.ASK, 101.0, 3.0)
+    book.add_order(4, Side.BID, 99.0, 4.0)
+    book.add_order(5, Side.BID, 98.0, 5.0)
+    return book
+
+
+def test_l2_view(book: L3OrderBook) -> None:
+    assert len(book) == 5
+    assert book.to_dict() == {
+        "ask_prices": [100.0, 101.0],
+        "ask_sizes": [3.0, 3.0],
+        "bid_prices": [99.0, 98.0],
+        "bid_sizes": [4.0, 5.0],
+    }
+    assert book.to_orderbook() == OrderBook.from_dict(book.to_dict())
+    assert book.top_level_prices == (100.0, 99.0)
+    assert book.n_levels == (2, 2)
+
+
+def test_fifo_queue(book: L3OrderBook) -> None:
+    book.add_order(6, Side.ASK, 100.0, 0.5)
+
+    assert [order.order_id for order in book.queue(Side.ASK, 100.0)] == [1, 2, 6]
+    assert book.queue(Side.ASK, 105.0) == []
+
+
+def test_add_duplicate_or_invalid_order(book: L3OrderBook) -> None:
+    with pytest.raises(ValueError, match="already in the book"):
+        book.add_order(1, Side.BID, 90.0, 1.0)
+    with pytest.raises(ValueError, match="size must be positive"):
+        book.add_order(7, Side.BID, 90.0, 0.0)
+    with pytest.raises(ValueError, match="price must be finite"):
+        book.add_order(7, Side.BID, float("inf"), 1.0)
+
+
+def test_cancel_order(book: L3OrderBook) -> None:
+    cancelled = book.cancel_order(1)
+
+    assert cancelled.order_id == 1
+    assert 1 not in book
+    assert book.to_dict()["ask_sizes"] == [2.0, 3.0]
+
+    book.cancel_order(2)
+    assert book.top_level_prices == (101.0, 99.0)
+
+    with pytest.raises(KeyError):
+        book.cancel_order(2)
+
+
+def test_modify_order_size_down_keeps_priority(book: L3OrderBook) -> None:
+    book.modify_order(1, 0.5)
+
+    assert [order.order_id for order in book.queue(Side.ASK, 100.0)] == [1, 2]
+    assert book.to_dict()["ask_sizes"] == [2.5, 3.0]
+
+
+def test_modify_order_size_up_loses_priority(book: L3OrderBook) -> None:
+    book.modify_order(1, 5.0)
+
+    assert [order.order_id for order in book.queue(Side.ASK, 100.0)] == [2, 1]
+    assert book.to_dict()["ask_sizes"] == [7.0, 3.0]
+
+
+def test_modify_order_price(book: L3OrderBook) -> None:
+    book.modify_order(4, 4.0, price=99.5)
+
+    assert book.get_order(4).price == 99.5
+    assert book.to_dict()["bid_prices"] == [99.5, 98.0]
+    assert book.queue(Side.BID, 99.0) == []
+
+
+def test_execute_order(book: L3OrderBook) -> None:
+    book.execute_order(5, 2.0)
+    assert book.get_order(5).size == 3.0
+    assert book.to_dict()["bid_sizes"] == [4.0, 3.0]
+
+    book.execute_order(5, 3.0)
+    assert 5 not in book
+    assert book.n_levels == (2, 1)
+
+    with pytest.raises(ValueError, match="executed size"):
+        book.execute_order(4, 5.0)
+
+
+def test_level_totals_do_not_drift(book: L3OrderBook) -> None:
+    for order_id in range(10, 1_000):
+        book.add_order(order_id, Side.BID, 99.0, 0.1)
+    for order_id in range(10, 1_000):
+        book.cancel_order(order_id)
+    book.add_order(6, Side.BID, 97.0, 0.3)
+    book.modify_order(6, 0.1)
+
+    assert book.to_dict()["bid_sizes"] == [4.0, 5.0, 0.1]
+
+
+def _seconds_per_event(depth: int) -> float:
+    book = L3OrderBook()
+    for order_id in range(depth):
+        book.add_order(order_id, Side.BID, 99.0, 0.1)
+
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for order_id in range(depth, depth + 1_000):
+            book.add_order(order_id, Side.BID, 99.0, 0.3)
+            book.modify_order(order_id, 0.2)
+            book.cancel_order(order_id)
+        best = min(best, time.perf_counter() - started)
+    return best / 3_000
+
+
+def test_deep_queue_events_stay_flat() -> None:
+    # re-summing the queue on every event would make the deep level ~1000x slower
+    assert _seconds_per_event(20_000) < 5 * _seconds_per_event(20)
+
+
+def test_plain_string_sides(book: L3OrderBook) -> None:
+    order = book.add_order(6, "ask", 99.5, 1.0)  # type: ignore[arg-type]
+
+    assert order.side is Side.ASK
+    assert book.top_level_prices == (99.5, 99.0)
+    assert book.cancel_order(6) is order
+
+    with pytest.raises(ValueError, match="not a valid Side"):
+        book.add_order(7, "mid", 99.5, 1.0)  # type: ignore[arg-type]
+    assert 7 not in book
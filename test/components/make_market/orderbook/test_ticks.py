@@ -0,0 +1,99 @@
+import datetime
+
+import numpy as np
+import pytest
+from make_market.messaging import BaseQuote
+from make_market.messaging.decimals import float_to_digits_with_precision
+from make_market.orderbook import OrderBook, TickOrderBook
+from make_market.settings.models import Settings
+
+
+@pytest.fixture
+def tick_book() -> TickOrderBook:
+    return TickOrderBook(
+        ask_prices=[1_000_100, 1_000_200],
+        ask_sizes=[1_000, 1_500],
+        bid_prices=[999_900, 999_800],
+        bid_sizes=[2_000, 2_500],
+        price_exponent=-6,
+        size_exponent=-2,
+    )
+
+
+def test_tick_orderbook_initialization(tick_book: TickOrderBook) -> None:
+    assert tick_book.ask_prices.dtype == np.int64
+    assert tick_book.n_levels == (2, 2)
+    assert tick_book.top_level_prices == (1_000_100, 999_900)
+    assert tick_book.top_level_spread == 200
+    assert not tick_book.is_crossed
+    assert not tick_book.is_locked
+
+
+def test_tick_orderbook_validation_failure() -> None:
+    with pytest.raises(ValueError, match="ask_prices must be"):
+        TickOrderBook(ask_prices=[2, 1], ask_sizes=[1, 1])
+
+
+@pytest.mark.parametrize(
+    ("top_bid", "crossed", "locked"),
+    [(999_999, False, False), (1_000_000, False, True), (1_000_001, True, False)],
+)
+def test_tick_orderbook_crossed_and_locked(
+    top_bid: int, crossed: bool, locked: bool
+) -> None:
+    book = TickOrderBook(
+        ask_prices=[1_000_000], ask_sizes=[1], bid_prices=[top_bid], bid_sizes=[1]
+    )
+    assert book.is_crossed is crossed
+    assert book.is_locked is locked
+
+
+def test_one_sided_tick_orderbook_is_not_crossed() -> None:
+    book = TickOrderBook(bid_prices=[1], bid_sizes=[1])
+    assert book.top_level_spread is None
+    assert not book.is_crossed
+    assert not book.is_locked
+
+
+def test_base_quote_round_trip(tick_book: TickOrderBook) -> None:
+    now = datetime.datetime.now(Settings().timezone)
+    quote = BaseQuote(
+        symbol="EUR/USD",
+        exchange="FX",
+        vendor_timestamp=now,
+        timestamp=now,
+        app_id=1,
+        tick_id=1,
+        **tick_book.to_quote_levels(),
+    )
+
+    assert quote.ask_price == [1_000_100, 1_000_200]
+    assert all(type(price) is int for price in quote.ask_price)
+    assert TickOrderBook.from_quote(quote) == tick_book
+
+
+def test_orderbook_conversion(tick_book: TickOrderBook) -> None:
+    orderbook = OrderBook(
+        ask_prices=[1.0001, 1.0002],
+        ask_sizes=[10.0, 15.0],
+        bid_prices=[0.9999, 0.9998],
+        bid_sizes=[20.0, 25.0],
+    )
+
+    assert TickOrderBook.from_orderbook(orderbook) == tick_book
+    assert tick_book.to_orderbook() == orderbook
+
+
+def test_from_orderbook_rounds_like_the_quote_pipeline() -> None:
+    # the float products of these round the other way than their exact values
+    asks = [0.4097365, 0.4097375, 0.4097385]
+    orderbook = OrderBook(
+        ask_prices=asks, ask_sizes=[1.0, 1.0, 1.0], bid_prices=[], bid_sizes=[]
+    )
+
+    tick_book = TickOrderBook.from_orderbook(orderbook, price_exponent=-6)
+
+    assert tick_book.ask_prices.tolist() == [
+        float_to_digits_with_precision(price, -6) for price in asks
+    ]
+    assert tick_book.ask_prices.tolist()[:2] == [409737, 409737]
@@ -0,0 +1,183 @@
+import asyncio
+import time
+import uuid
+
+import pytest
+import zmq
+import zmq.asyncio
+from make_market.producer_consumer.conflation import (
+    AsyncConflatingSubscriber,
+    ConflatingSubscriber,
+)
+
+
+@pytest.fixture
+def context():
+    context = zmq.Context()
+    yield context
+    context.destroy(linger=0)
+
+
+def _pair(context: zmq.Context) -> tuple[zmq.Socket, zmq.Socket]:
+    # PUSH/PULL delivers every message, unlike a PUB without subscribers yet
+    address = f"inproc://{uuid.uuid4().hex}"
+    pull = context.socket(zmq.PULL)
+    pull.bind(address)
+    push = context.socket(zmq.PUSH)
+    push.connect(address)
+    return push, pull
+
+
+def test_keeps_newest_message_per_topic(context: zmq.Context) -> None:
+    push, pull = _pair(context)
+    for tick in range(5):
+        push.send_multipart([b"FX/EUR/USD/quote/", b"eur %d" % tick])
+        push.send_multipart([b"FX/USD/JPY/quote/", b"jpy %d" % tick])
+    push.send_multipart([b"FX/GBP/USD/quote/", b"gbp 0"])
+    pull.poll(1_000)
+
+    with ConflatingSubscriber(pull) as subscriber:
+        # the queued messages are drained in one go
+        time.sleep(0.2)
+        latest = subscriber.receive(timeout=1_000)
+
+    assert latest == {
+        b"FX/EUR/USD/quote/": b"eur 4",
+        b"FX/USD/JPY/quote/": b"jpy 4",
+        b"FX/GBP/USD/quote/": b"gbp 0",
+    }
+    assert subscriber.replaced == 8
+
+
+def test_receive_times_out_empty(context: zmq.Context) -> None:
+    _, pull = _pair(context)
+
+    with ConflatingSubscriber(pull) as subscriber:
+        assert subscriber.receive(timeout=10) == {}
+
+
+def test_receive_returns_when_closed(context: zmq.Context) -> None:
+    _, pull = _pair(context)
+    subscriber = ConflatingSubscriber(pull)
+    subscriber.start()
+    subscriber.close()
+
+    assert subscriber.receive() == {}
+
+
+def test_drains_beyond_the_high_water_mark(context: zmq.Context) -> None:
+    address = f"inproc://{uuid.uuid4().hex}"
+    sub = context.socket(zmq.SUB)
+    sub.setsockopt(zmq.RCVHWM, 100)
+    sub.setsockopt(zmq.SUBSCRIBE, b"")
+    sub.bind(address)
+    pub = context.socket(zmq.PUB)
+    pub.setsockopt(zmq.SNDHWM, 100)
+    pub.connect(address)
+
+    with ConflatingSubscriber(sub) as subscriber:
+        # wait until the subscription reached the publisher
+        while not subscriber.receive(timeout=10):
+            pub.send_multipart([b"topic", b"ready"])
+
+        # far more than the high water marks, at a steady rate, before reading
+        for tick in range(5_000):
+            pub.send_multipart([b"topic", b"%d" % tick])
+            if tick % 50 == 0:
+                time.sleep(0.001)
+        time.sleep(0.2)
+
+        assert subscriber.receive(timeout=1_000) == {b"topic": b"4999"}
+
+
+@pytest.mark.asyncio
+async def test_async_keeps_newest_message_per_topic(context: zmq.Context) -> None:
+    address = f"inproc://{uuid.uuid4().hex}"
+    pull = zmq.asyncio.Context.shadow(context).socket(zmq.PULL)
+    pull.bind(address)
+    push = context.socket(zmq.PUSH)
+    push.connect(address)
+
+    try:
+        for tick in range(3):
+            push.send_multipart([b"FX/EUR/USD/quote/", b"%d" % tick])
+        await pull.poll(1_000)
+
+        async with AsyncConflatingSubscriber(pull) as subscriber, asyncio.timeout(1):
+            latest = await subscriber.receive()
+        assert latest == {b"FX/EUR/USD/quote/": b"2"}
+        assert subscriber.replaced == 2
+    finally:
+        # the base context does not track sockets of its asyncio shadow
+        pull.close()
+
+
+def test_skips_malformed_messages(context: zmq.Context) -> None:
+    push, pull = _pair(context)
+    push.send_multipart([b"FX/EUR/USD/quote/"])
+    push.send_multipart([b"FX/EUR/USD/quote/", b"eur 0", b"extra"])
+    push.send_multipart([b"FX/USD/JPY/quote/", b"jpy 0"])
+
+    with ConflatingSubscriber(pull) as subscriber:
+        assert subscriber.receive(timeout=1_000) == {b"FX/USD/JPY/quote/": b"jpy 0"}
+        # the drain thread survived the malformed messages
+        push.send_multipart([b"FX/EUR/USD/quote/", b"eur 1"])
+        assert subscriber.receive(timeout=1_000) == {b"FX/EUR/USD/quote/": b"eur 1"}
+
+
+def test_receive_raises_when_the_drain_stopped(
+    context: zmq.Context, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    push, pull = _pair(context)
+    subscriber = ConflatingSubscriber(pull)
+
+    def fail() -> None:
+        raise zmq.ZMQError(zmq.ENOTSOCK)
+
+    monkeypatch.setattr(subscriber, "_drain", fail)
+    push.send_multipart([b"FX/EUR/USD/quote/", b"eur 0"])
+
+    with subscriber, pytest.raises(RuntimeError, match="drain"):
+        subscriber.receive()
+
+
+@pytest.mark.asyncio
+async def test_async_skips_malformed_messages(context: zmq.Context) -> None:
+    address = f"inproc://{uuid.uuid4().hex}"
+    pull = zmq.asyncio.Context.shadow(context).socket(zmq.PULL)
+    pull.bind(address)
+    push = context.socket(zmq.PUSH)
+    push.connect(address)
+
+    try:
+        push.send_multipart([b"FX/EUR/USD/quote/"])
+        async with AsyncConflatingSubscriber(pull) as subscriber, asyncio.timeout(1):
+            push.send_multipart([b"FX/USD/JPY/quote/", b"jpy 0"])
+            assert await subscriber.receive() == {b"FX/USD/JPY/quote/": b"jpy 0"}
+    finally:
+        pull.close()
+
+
+@pytest.mark.asyncio
+async def test_async_receive_raises_when_the_drain_stopped(
+    context: zmq.Context, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    address = f"inproc://{uuid.uuid4().hex}"
+    pull = zmq.asyncio.Context.shadow(context).socket(zmq.PULL)
+    pull.bind(address)
+    push = context.socket(zmq.PUSH)
+    push.connect(address)
+    subscriber = AsyncConflatingSubscriber(pull)
+
+    def fail(message: list[bytes]) -> None:
+        raise zmq.ZMQError(zmq.ENOTSOCK)
+
+    monkeypatch.setattr(subscriber, "_keep", fail)
+
+    try:
+        push.send_multipart([b"FX/EUR/USD/quote/", b"eur 0"])
+        async with subscriber, asyncio.timeout(1):
+            with pytest.raises(RuntimeError, match="drain"):
+                await subscriber.receive()
+    finally:
+        pull.close()
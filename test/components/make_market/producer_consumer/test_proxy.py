@@ -0,0 +1,205 @@
+import json
+import threading
+import uuid
+
+import zmq
+from make_market.producer_consumer.proxy import (
+    NO_TOPIC,
+    OTHER_TOPICS,
+    STATISTICS_TOPIC,
+    TERMINATE,
+    LastValueCache,
+    ProxyStatistics,
+    run_proxy,
+)
+from make_market.producer_consumer.topics import (
+    ALL_SYMBOLS,
+    MessageType,
+    subscription_prefixes,
+    symbol_prefix,
+    topic,
+)
+
+
+def test_last_value_cache_keeps_latest_per_topic() -> None:
+    cache = LastValueCache()
+    eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+    usd_jpy = topic("FX", "USD/JPY", MessageType.QUOTE)
+
+    cache.store([eur_usd, b"1"])
+    cache.store([usd_jpy, b"2"])
+    cache.store([eur_usd, b"3"])
+
+    assert len(cache) == 2
+    assert cache.matching(b"") == [[eur_usd, b"3"], [usd_jpy, b"2"]]
+    assert cache.matching(symbol_prefix("FX", "USD/JPY").encode()) == [[usd_jpy, b"2"]]
+    assert cache.matching(b"CRYPTO/") == []
+
+
+def test_last_value_cache_ignores_messages_without_topic() -> None:
+    cache = LastValueCache()
+
+    cache.store([b"123"])
+
+    assert len(cache) == 0
+
+
+def test_last_value_cache_keeps_only_full_states() -> None:
+    cache = LastValueCache()
+    frame = topic("FX", ALL_SYMBOLS, MessageType.FRAME)
+    packed = topic("FX", "EUR/USD", MessageType.PACKED)
+
+    cache.store([topic("FX", "EUR/USD", MessageType.DELTA), b"1"])
+    cache.store([frame, b"2"])
+    cache.store([packed, b"3"])
+
+    assert cache.matching(b"") == [[frame, b"2"], [packed, b"3"]]
+
+
+def test_last_value_cache_replays_frames_to_symbol_subscribers() -> None:
+    cache = LastValueCache()
+    frame = topic("FX", ALL_SYMBOLS, MessageType.FRAME)
+
+    cache.store([frame, b"1"])
+    cache.store([frame, b"2"])
+
+    # a late subscriber of any symbol also subscribes to the frames of all symbols
+    replayed = [
+        message
+        for prefix in subscription_prefixes(symbols=["EUR/USD"])
+        for message in cache.matching(prefix)
+    ]
+    assert replayed == [[frame, b"2"]]
+
+
+def test_run_proxy_forwards_bursts_in_batches() -> None:
+    context = zmq.Context()
+    addresses = [f"inproc://{name}-{uuid.uuid4().hex}" for name in ("in", "out", "ctl")]
+    frontend = context.socket(zmq.XSUB)
+    frontend.bind(addresses[0])
+    backend = context.socket(zmq.XPUB)
+    backend.setsockopt(zmq.XPUB_VERBOSE, 1)
+    backend.bind(addresses[1])
+    control = context.socket(zmq.PAIR)
+    control.bind(addresses[2])
+    statistics = ProxyStatistics()
+    proxy = threading.Thread(
+        target=run_proxy,
+        args=(frontend, backend, control, LastValueCache(), statistics),
+        kwargs={"max_batch": 7},
+    )
+    proxy.start()
+
+    pub = context.socket(zmq.PUB)
+    pub.connect(addresses[0])
+    sub = context.socket(zmq.SUB)
+    sub.setsockopt(zmq.SUBSCRIBE, b"")
+    sub.connect(addresses[1])
+    terminate = context.socket(zmq.PAIR)
+    terminate.connect(addresses[2])
+    eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+    try:
+        # wait until the subscription reached the publisher
+        while not sub.poll(100):
+            pub.send_multipart([eur_usd, b"ready"])
+        while sub.poll(100):
+            sub.recv_multipart()
+
+        for tick in range(500):
+            pub.send_multipart([eur_usd, b"%d" % tick])
+
+        assert [sub.recv_multipart()[1] for _ in range(500)] == [
+            b"%d" % tick for tick in range(500)
+        ]
+    finally:
+        terminate.send(TERMINATE)
+        proxy.join()
+        for socket in (pub, sub, terminate, frontend, backend, control):
+            socket.close()
+        context.term()
+
+
+def test_statistics_sample_rates_per_topic() -> None:
+    statistics = ProxyStatistics(history=2)
+    eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+
+    statistics.record([eur_usd, b"12345"])
+    statistics.record([eur_usd, b"1"])
+    statistics.record_subscription(b"\x01FX/")
+    statistics.record_subscription(b"\x00FX/")
+    statistics.record_subscription(b"\x01FX/")
+    sample = statistics.sample()
+
+    seconds = sample["interval_ns"] / 1e9
+    assert sample["subscriptions"] == 2
+    assert sample["unsubscriptions"] == 1
+    assert sample["topics"] == {
+        "FX/EUR%2FUSD/quote/": {
+            "messages_per_second": 2 / seconds,
+            "bytes_per_second": (2 * len(eur_usd) + 6) / seconds,
+            "max_size": len(eur_usd) + 5,
+        }
+    }
+    assert list(statistics.samples) == [sample]
+
+    # the counters are reset after each sample
+    assert statistics.sample()["topics"] == {}
+    statistics.sample()
+    assert len(statistics.samples) == 2
+
+
+def test_statistics_share_a_slot_beyond_max_topics() -> None:
+    statistics = ProxyStatistics(max_topics=1)
+
+    statistics.record([b"a", b"1"])
+    statistics.record([b"b", b"1"])
+    statistics.record([b"c", b"1"])
+
+    topics = statistics.sample()["topics"]
+    assert topics.keys() == {"a", OTHER_TOPICS}
+    assert topics[OTHER_TOPICS]["max_size"] == 2
+
+
+def test_statistics_count_single_frames_without_a_slot() -> None:
+    statistics = ProxyStatistics(max_topics=1)
+
+    statistics.record([b"123"])
+    statistics.record([b"12345"])
+    statistics.record([b"a", b"1"])
+
+    topics = statistics.sample()["topics"]
+    assert topics.keys() == {"a", NO_TOPIC}
+    assert topics[NO_TOPIC]["max_size"] == 5
+
+
+def test_statistics_free_slots_after_a_sample() -> None:
+    statistics = ProxyStatistics(max_topics=1)
+
+    statistics.record([b"a", b"1"])
+    statistics.sample()
+    statistics.record([b"b", b"1"])
+
+    assert statistics.sample()["topics"].keys() == {"b"}
+
+
+def test_statistics_publish_samples() -> None:
+    context = zmq.Context()
+    sub = context.socket(zmq.SUB)
+    pub = context.socket(zmq.PUB)
+    try:
+        pub.bind("inproc://statistics")
+        sub.connect("inproc://statistics")
+        sub.setsockopt(zmq.SUBSCRIBE, STATISTICS_TOPIC)
+        statistics = ProxyStatistics(pub)
+
+        statistics.record([b"a", b"1"])
+        sample = statistics.sample()
+
+        assert sub.poll(1_000)
+        topic_frame, payload = sub.recv_multipart()
+        assert topic_frame == STATISTICS_TOPIC
+        assert json.loads(payload) == sample
+    finally:
+        sub.close()
+        pub.close()
+        context.term()
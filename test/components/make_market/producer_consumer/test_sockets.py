@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+import zmq
+from make_market.producer_consumer.sockets import SocketManager
+from make_market.settings.models import ZeroMQSettings
+
+
+@pytest.fixture
+def manager():
+    manager = SocketManager(
+        settings=ZeroMQSettings(SNDHWM=123, RCVHWM=456, LINGER=7, SNDBUF=65_536)
+    )
+    yield manager
+    manager.close()
+    manager.context.term()
+
+
+def _publisher(manager: SocketManager) -> zmq.Socket:
+    return manager.socket("publisher", zmq.PUB, lambda _: None)
+
+
+def test_socket_is_cached_per_thread(manager: SocketManager) -> None:
+    sockets = []
+    thread = threading.Thread(target=lambda: sockets.append(_publisher(manager)))
+    thread.start()
+    thread.join()
+
+    assert _publisher(manager) is _publisher(manager)
+    assert sockets[0] is not _publisher(manager)
+    assert len(manager) == 2
+
+
+def test_socket_options_are_applied(manager: SocketManager) -> None:
+    socket = _publisher(manager)
+
+    assert socket.getsockopt(zmq.SNDHWM) == 123
+    assert socket.getsockopt(zmq.RCVHWM) == 456
+    assert socket.getsockopt(zmq.LINGER) == 7
+    assert socket.getsockopt(zmq.SNDBUF) == 65_536
+
+
+def test_setup_runs_once(manager: SocketManager) -> None:
+    calls = []
+
+    for _ in range(3):
+        manager.socket("subscriber", zmq.SUB, calls.append)
+
+    assert len(calls) == 1
+
+
+def test_async_sockets_share_the_context(manager: SocketManager) -> None:
+    socket = manager.socket("publisher", zmq.PUB, lambda _: None, asynchronous=True)
+
+    assert socket.context.underlying == manager.context.underlying
+
+
+def test_close_closes_every_socket(manager: SocketManager) -> None:
+    socket = _publisher(manager)
+
+    manager.close()
+
+    assert socket.closed
+    assert len(manager) == 0
@@ -0,0 +1,54 @@
+import pytest
+from make_market.producer_consumer.topics import (
+    ALL_SYMBOLS,
+    MessageType,
+    parse_topic,
+    subscription_prefixes,
+    topic,
+)
+
+
+def test_topic_round_trip() -> None:
+    value = topic("FX", "EUR/USD", MessageType.QUOTE)
+
+    assert value == b"FX/EUR%2FUSD/quote/"
+    assert parse_topic(value) == ("FX", "EUR/USD", MessageType.QUOTE)
+    assert parse_topic(topic("FX", ALL_SYMBOLS, MessageType.FRAME))[1] == ALL_SYMBOLS
+
+
+def test_parse_topic_rejects_other_frames() -> None:
+    with pytest.raises(ValueError, match="topic"):
+        parse_topic(b"123")
+    with pytest.raises(ValueError, match="topic"):
+        parse_topic(b"FX/EUR/USD/quote/")
+
+
+def test_topic_escapes_separator_and_percent() -> None:
+    value = topic("FX", "A%2FB/C", MessageType.QUOTE)
+
+    assert value == b"FX/A%252FB%2FC/quote/"
+    assert parse_topic(value) == ("FX", "A%2FB/C", MessageType.QUOTE)
+
+
+def test_symbol_prefix_does_not_match_longer_symbols() -> None:
+    (eur_usd, _) = subscription_prefixes(symbols=["EUR/USD"])
+
+    assert topic("FX", "EUR/USD", MessageType.DELTA).startswith(eur_usd)
+    assert not topic("FX", "EUR/USDT", MessageType.DELTA).startswith(eur_usd)
+
+
+def test_symbol_prefix_does_not_match_symbols_it_starts() -> None:
+    (eur, _) = subscription_prefixes(symbols=["EUR"])
+
+    assert topic("FX", "EUR", MessageType.QUOTE).startswith(eur)
+    assert not topic("FX", "EUR/USD", MessageType.QUOTE).startswith(eur)
+
+
+def test_subscription_prefixes() -> None:
+    assert subscription_prefixes() == [b""]
+    assert subscription_prefixes(symbols=["EUR/USD"], exchange="CRYPTO") == [
+        b"CRYPTO/EUR%2FUSD/",
+        b"CRYPTO/*/",
+    ]
+    assert subscription_prefixes(prefixes=["FX/", b"FX/"]) == [b"FX/"]
+    assert subscription_prefixes(symbols=[]) == [b"FX/*/"]
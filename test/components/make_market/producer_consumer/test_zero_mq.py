@@ -1,10 +1,13 @@
 import asyncio
+import json
 import threading
 import time
 
 import pytest
 import zmq
 import zmq.asyncio
+from make_market.producer_consumer.proxy import STATISTICS_TOPIC
+from make_market.producer_consumer.topics import MessageType, topic
 from make_market.producer_consumer.zero_mq import PubSubWithZeroMQ
 
 received = False
@@ -83,3 +86,157 @@ def test_subscriber(zmq_middleware: PubSubWithZeroMQ) -> None:
         assert message == b"123"
     finally:
         pub_thread.join()
+
+
+def test_subscriber_filters_symbols(zmq_middleware: PubSubWithZeroMQ) -> None:
+    pub_socket = zmq_middleware.publisher_socket
+    sub_socket = zmq_middleware.topic_subscriber_socket(symbols=["EUR/USD"])
+    sub_socket.setsockopt(zmq.RCVTIMEO, 5_000)
+
+    def _publish() -> None:
+        for _ in range(20):
+            time.sleep(0.1)
+            pub_socket.send_multipart([topic("FX", "USD/JPY", MessageType.QUOTE), b"1"])
+            pub_socket.send_multipart([topic("FX", "EUR/USD", MessageType.QUOTE), b"2"])
+
+    pub_thread = threading.Thread(target=_publish)
+    pub_thread.start()
+
+    try:
+        received = [sub_socket.recv_multipart() for _ in range(3)]
+        assert received == [[b"FX/EUR%2FUSD/quote/", b"2"]] * 3
+    finally:
+        pub_thread.join()
+
+
+def test_conflating_subscriber(zmq_middleware: PubSubWithZeroMQ) -> None:
+    pub_socket = zmq_middleware.publisher_socket
+    eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+    usd_jpy = topic("FX", "USD/JPY", MessageType.QUOTE)
+
+    with zmq_middleware.conflating_subscriber(
+        symbols=["EUR/USD", "USD/JPY"]
+    ) as conflating:
+        # wait until the subscription reached the publisher
+        while not conflating.receive(timeout=100):
+            pub_socket.send_multipart([eur_usd, b"ready"])
+
+        for tick in range(100):
+            pub_socket.send_multipart([eur_usd, b"%d" % tick])
+            pub_socket.send_multipart([usd_jpy, b"%d" % tick])
+        time.sleep(0.2)
+
+        assert conflating.receive(timeout=1_000) == {eur_usd: b"99", usd_jpy: b"99"}
+
+
+def test_sockets_are_created_once_per_thread(
+    zmq_middleware: PubSubWithZeroMQ,
+) -> None:
+    other = []
+    thread = threading.Thread(
+        target=lambda: other.append(zmq_middleware.subscriber_socket)
+    )
+    thread.start()
+    thread.join()
+
+    assert zmq_middleware.publisher_socket is zmq_middleware.publisher_socket
+    assert zmq_middleware.subscriber_socket is zmq_middleware.subscriber_socket
+    assert other[0] is not zmq_middleware.subscriber_socket
+
+
+def test_stop_closes_sockets_and_proxy() -> None:
+    ps = PubSubWithZeroMQ(
+        in_address="tcp://localhost:5555", out_address="tcp://localhost:5556"
+    )
+    ps.start()
+    socket = ps.subscriber_socket
+
+    ps.stop()
+
+    assert socket.closed
+    assert ps.proxy_thread is None
+    assert ps.context.closed
+
+
+def test_last_value_cache_replays_to_late_subscribers() -> None:
+    ps = PubSubWithZeroMQ(
+        in_address="tcp://localhost:5555",
+        out_address="tcp://localhost:5556",
+        last_value_cache=True,
+    )
+    ps.start()
+    try:
+        assert ps.last_value_cache is not None
+        pub_socket = ps.publisher_socket
+        eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+        usd_jpy = topic("FX", "USD/JPY", MessageType.QUOTE)
+
+        # publish, with no subscriber yet, until the proxy cached both symbols
+        while len(ps.last_value_cache) < 2:
+            pub_socket.send_multipart([eur_usd, b"1"])
+            pub_socket.send_multipart([usd_jpy, b"2"])
+            time.sleep(0.01)
+
+        sub_socket = ps.topic_subscriber_socket(symbols=["EUR/USD"])
+        sub_socket.setsockopt(zmq.RCVTIMEO, 5_000)
+
+        assert sub_socket.recv_multipart() == [eur_usd, b"1"]
+    finally:
+        ps.stop()
+
+
+def test_instrumented_proxy_publishes_statistics() -> None:
+    ps = PubSubWithZeroMQ(
+        in_address="tcp://localhost:5555",
+        out_address="tcp://localhost:5556",
+        statistics_address="inproc://statistics",
+        statistics_interval=100,
+    )
+    ps.start()
+    statistics_socket = ps.context.socket(zmq.SUB)
+    try:
+        statistics_socket.connect("inproc://statistics")
+        statistics_socket.setsockopt(zmq.SUBSCRIBE, STATISTICS_TOPIC)
+        pub_socket = ps.publisher_socket
+        sub_socket = ps.topic_subscriber_socket(symbols=["EUR/USD"])
+        eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+
+        # wait until the subscription reached the publisher
+        while not sub_socket.poll(100):
+            pub_socket.send_multipart([eur_usd, b"1"])
+
+        topics: dict = {}
+        while "FX/EUR%2FUSD/quote/" not in topics:
+            pub_socket.send_multipart([eur_usd, b"1"])
+            assert statistics_socket.poll(5_000)
+            topics = json.loads(statistics_socket.recv_multipart()[1])["topics"]
+
+        assert topics["FX/EUR%2FUSD/quote/"]["max_size"] == len(eur_usd) + 1
+        assert topics["FX/EUR%2FUSD/quote/"]["messages_per_second"] > 0
+    finally:
+        statistics_socket.close()
+        ps.stop()
+
+
+def test_out_of_process_client(tmp_path) -> None:
+    in_address = f"ipc://{tmp_path}/frontend"
+    out_address = f"ipc://{tmp_path}/backend"
+    server = PubSubWithZeroMQ(in_address=in_address, out_address=out_address)
+    # another process: its own context, no proxy, the configured addresses
+    client = PubSubWithZeroMQ(
+        in_address=in_address, out_address=out_address, inproc=False
+    )
+    server.start()
+    try:
+        pub_socket = client.publisher_socket
+        sub_socket = client.topic_subscriber_socket(symbols=["EUR/USD"])
+        eur_usd = topic("FX", "EUR/USD", MessageType.QUOTE)
+
+        # wait until the subscription reached the publisher through the proxy
+        while not sub_socket.poll(100):
+            pub_socket.send_multipart([eur_usd, b"1"])
+
+        assert sub_socket.recv_multipart() == [eur_usd, b"1"]
+    finally:
+        client.stop()
+        server.stop()
@@ -1,8 +1,15 @@
+import asyncio
 import json
 
+import numpy as np
 import pytest
 import zmq.asyncio
-from make_market.ws_client import WebSocketConnectAsync
+from make_market.messaging.envelope import HEADER_SIZE, SINGLE_OBJECT_MARKER
+from make_market.orderbook.batch import random_book_block
+from make_market.producer_consumer.topics import MessageType, parse_topic
+from make_market.settings.models import Settings
+from make_market.ws_client import WebSocketConnectAsync, bus_codecs
+from make_market.ws_server.quote import create_raw_quotes_from_book_block
 
 
 @pytest.fixture
@@ -20,6 +27,19 @@ def websocket_connect_async(publisher_socket, config):
     return WebSocketConnectAsync("ws://test_url", config, publisher_socket)
 
 
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"keyframe_interval": 10, "packed": True},
+        {"frames": True, "packed": True},
+        {"frames": True, "keyframe_interval": 10},
+    ],
+)
+def test_rejects_conflicting_message_types(publisher_socket, config, options):
+    with pytest.raises(ValueError, match="mutually exclusive"):
+        WebSocketConnectAsync("ws://test_url", config, publisher_socket, **options)
+
+
 @pytest.mark.asyncio
 async def test_subscribe_to_new_symbol(mocker, websocket_connect_async):
     mock_send = mocker.patch.object(
@@ -129,3 +149,47 @@ async def test_on_config_change(mocker, websocket_connect_async):
     mock_unsubscribe.assert_called_once_with("symbol1")
     mock_subscribe.assert_called_once_with("symbol2")
     assert websocket_connect_async.config == new_config
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("options", "message_type"),
+    [
+        ({}, MessageType.QUOTE),
+        ({"frames": True}, MessageType.FRAME),
+        ({"keyframe_interval": 10}, MessageType.DELTA),
+        ({"packed": True}, MessageType.PACKED),
+    ],
+)
+async def test_published_payloads_carry_the_schema_fingerprint(
+    mocker, options, message_type
+):
+    context = zmq.asyncio.Context()
+    publisher = context.socket(zmq.PUB)
+    subscriber = context.socket(zmq.SUB)
+    try:
+        publisher.bind("inproc://client")
+        subscriber.connect("inproc://client")
+        subscriber.setsockopt(zmq.SUBSCRIBE, b"")
+
+        client = WebSocketConnectAsync("ws://test_url", {}, publisher, **options)
+        block = random_book_block([1.085], [0.0001], rng=np.random.default_rng(0))
+        raw = create_raw_quotes_from_book_block(["EUR/USD"], block, Settings().timezone)
+        mocker.patch.object(
+            client,
+            "_receive_raw",
+            side_effect=[json.dumps(raw), asyncio.CancelledError()],
+        )
+        mocker.patch.object(client, "stop", new_callable=mocker.AsyncMock)
+
+        await client._main_loop()  # noqa: SLF001
+        topic, payload = await asyncio.wait_for(subscriber.recv_multipart(), 5)
+
+        codec = bus_codecs()[message_type]
+        assert parse_topic(topic)[2] is message_type
+        assert payload[:HEADER_SIZE] == SINGLE_OBJECT_MARKER + codec.schema_id
+        assert codec.decode(payload).exchange == "FX"
+    finally:
+        publisher.close()
+        subscriber.close()
+        context.term()